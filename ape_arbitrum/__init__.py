@@ -24,7 +24,7 @@ def networks():
         create_network_type,
     )
 
-    from .ecosystem import NETWORKS
+    from .constants import NETWORKS
 
     for network_name, network_params in NETWORKS.items():
         yield "arbitrum", network_name, create_network_type(*network_params)
@@ -37,13 +37,13 @@ def networks():
 @plugins.register(plugins.ProviderPlugin)
 def providers():
     from ape.api.networks import LOCAL_NETWORK_NAME
-    from ape_node import Node
     from ape_test import LocalProvider
 
-    from .ecosystem import NETWORKS
+    from .balancer import ArbitrumNode
+    from .constants import NETWORKS
 
     for network_name in NETWORKS:
-        yield "arbitrum", network_name, Node
+        yield "arbitrum", network_name, ArbitrumNode
 
     yield "arbitrum", LOCAL_NETWORK_NAME, LocalProvider
 
@@ -59,8 +59,73 @@ def __getattr__(name: str):
 
         return ArbitrumConfig
 
+    if name == "AsyncArbitrumProvider":
+        from .async_provider import AsyncArbitrumProvider
+
+        return AsyncArbitrumProvider
+
+    if name == "BlockCache":
+        from .cache import BlockCache
+
+        return BlockCache
+
+    if name == "ConfirmationTracker":
+        from .confirmations import ConfirmationTracker
+
+        return ConfirmationTracker
+
+    if name == "FeeOracle":
+        from .fees import FeeOracle
+
+        return FeeOracle
+
+    if name == "FinalityTracker":
+        from .finality import FinalityTracker
+
+        return FinalityTracker
+
+    if name == "ForkStateCache":
+        from .forking import ForkStateCache
+
+        return ForkStateCache
+
+    if name == "instrumentation":
+        from .instrumentation import instrumentation
+
+        return instrumentation
+
+    if name == "L1GasAnalytics":
+        from .analytics import L1GasAnalytics
+
+        return L1GasAnalytics
+
+    if name == "LoadBalancedProvider":
+        from .balancer import LoadBalancedProvider
+
+        return LoadBalancedProvider
+
+    if name == "ReceiptStore":
+        from .columnar import ReceiptStore
+
+        return ReceiptStore
+
+    if name == "RetryableTicketTracker":
+        from .retryables import RetryableTicketTracker
+
+        return RetryableTicketTracker
+
+    if name == "SequencerFeed":
+        from .feed import SequencerFeed
+
+        return SequencerFeed
+
+    if name == "TraceProfiler":
+        from .tracing import TraceProfiler
+
+        return TraceProfiler
+
     if name == "NETWORKS":
-        from .ecosystem import NETWORKS
+        from .constants import NETWORKS
 
         return NETWORKS
 
@@ -70,5 +135,18 @@ def __getattr__(name: str):
 __all__ = [
     "Arbitrum",
     "ArbitrumConfig",
+    "AsyncArbitrumProvider",
+    "BlockCache",
+    "ConfirmationTracker",
+    "FeeOracle",
+    "FinalityTracker",
+    "ForkStateCache",
+    "instrumentation",
+    "L1GasAnalytics",
+    "LoadBalancedProvider",
+    "ReceiptStore",
+    "RetryableTicketTracker",
+    "SequencerFeed",
+    "TraceProfiler",
     "NETWORKS",
 ]
@@ -0,0 +1,195 @@
+from array import array
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from ape.api.transactions import ReceiptAPI
+from ape.utils.basemodel import ManagerAccessMixin
+
+# NOTE: Used when a receipt has no sender, or no receiver or created contract.
+_NO_ADDRESS = ""
+
+
+class GasUsageSummary:
+    """
+    Totals of L2 execution gas and L1 calldata gas per group,
+    such as per sender, per contract or per block.
+    """
+
+    def __init__(self, keys: list, counts: np.ndarray, l2_gas: np.ndarray, l1_gas: np.ndarray):
+        self.keys = keys
+        self.counts = counts
+        self.l2_gas = l2_gas
+        self.l1_gas = l1_gas
+        self._indices = {key: index for index, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """
+        Iterate over the groups as ``(key, count, l2_gas, l1_gas)`` tuples.
+        """
+        yield from zip(
+            self.keys,
+            self.counts.tolist(),
+            self.l2_gas.tolist(),
+            self.l1_gas.tolist(),
+            strict=True,
+        )
+
+    def __getitem__(self, key) -> tuple:
+        return self._get_row(self._indices[key])
+
+    def _get_row(self, index: int) -> tuple:
+        return (
+            self.keys[index],
+            int(self.counts[index]),
+            int(self.l2_gas[index]),
+            int(self.l1_gas[index]),
+        )
+
+    @property
+    def l1_ratio(self) -> np.ndarray:
+        """
+        The share of each group's total gas used for L1 calldata.
+        """
+        total = self.l1_gas + self.l2_gas
+        return np.divide(
+            self.l1_gas, total, out=np.zeros(len(total), dtype=np.float64), where=total > 0
+        )
+
+    def top(self, count: int = 10, by: str = "l1_gas") -> list[tuple]:
+        """
+        Get the groups with the highest value of the given column.
+
+        Args:
+            count (int): The number of groups to return. Defaults to ``10``.
+            by (str): The column to sort by: ``"counts"``, ``"l2_gas"``,
+              ``"l1_gas"`` or ``"l1_ratio"``. Defaults to ``"l1_gas"``.
+
+        Returns:
+            list[tuple]: ``(key, count, l2_gas, l1_gas)`` tuples.
+        """
+        values = getattr(self, by)
+        indices = np.argsort(values, kind="stable")[::-1][:count]
+        return [self._get_row(index) for index in indices.tolist()]
+
+
+class L1GasAnalytics(ManagerAccessMixin):
+    """
+    Aggregates the L2 execution gas and L1 calldata gas (``gasUsedForL1``)
+    of many receipts. Receipt fields are collected into flat columns, so the
+    per-sender, per-contract and per-block breakdowns are vectorized.
+
+    Usage example::
+
+        analytics = L1GasAnalytics()
+        analytics.add_block_range(start_block, stop_block)
+        analytics.by_contract().top(10)
+    """
+
+    def __init__(self, receipts: Iterable[ReceiptAPI] = ()):
+        self._block_numbers = array("q")
+        self._gas_used = array("q")
+        self._gas_used_for_l1 = array("q")
+        self._sender_ids = array("q")
+        self._contract_ids = array("q")
+        self._senders: dict[str, int] = {}
+        self._contracts: dict[str, int] = {}
+        self.add(receipts)
+
+    def __len__(self) -> int:
+        return len(self._block_numbers)
+
+    @property
+    def total_l1_gas(self) -> int:
+        """
+        The total gas used for L1 calldata.
+        """
+        return int(self._column(self._gas_used_for_l1).sum())
+
+    @property
+    def total_l2_gas(self) -> int:
+        """
+        The total gas used for L2 execution.
+        """
+        return int(self._l2_gas.sum())
+
+    def add(self, receipts: Iterable[ReceiptAPI]):
+        """
+        Add receipts to the analysis.
+
+        Args:
+            receipts (Iterable[:class:`~ape.api.transactions.ReceiptAPI`]): The receipts.
+        """
+        for receipt in receipts:
+            transaction = receipt.transaction
+            contract = transaction.receiver or receipt.contract_address or _NO_ADDRESS
+            self._block_numbers.append(receipt.block_number)
+            self._gas_used.append(receipt.gas_used)
+            self._gas_used_for_l1.append(getattr(receipt, "gas_used_for_L1", 0))
+            self._sender_ids.append(_get_id(self._senders, transaction.sender or _NO_ADDRESS))
+            self._contract_ids.append(_get_id(self._contracts, contract))
+
+    def add_block_range(self, start_block: int, stop_block: int):
+        """
+        Get and add the receipts for every block in the given range.
+
+        Args:
+            start_block (int): The first block in the range.
+            stop_block (int): The last block in the range (inclusive).
+        """
+        ecosystem = self.provider.network.ecosystem
+        for block_number in range(start_block, stop_block + 1):
+            self.add(ecosystem.decode_block_receipts(block_number))  # type: ignore[attr-defined]
+
+    def by_sender(self) -> GasUsageSummary:
+        """
+        Get the gas usage per transaction sender.
+        """
+        return self._summarize(self._column(self._sender_ids), list(self._senders))
+
+    def by_contract(self) -> GasUsageSummary:
+        """
+        Get the gas usage per called (or created) contract.
+        """
+        return self._summarize(self._column(self._contract_ids), list(self._contracts))
+
+    def by_block(self) -> GasUsageSummary:
+        """
+        Get the gas usage per block.
+        """
+        block_numbers, group_ids = np.unique(self._column(self._block_numbers), return_inverse=True)
+        return self._summarize(group_ids, block_numbers.tolist())
+
+    @property
+    def _l2_gas(self) -> np.ndarray:
+        # NOTE: Arbitrum's `gasUsed` includes the L1 component.
+        return self._column(self._gas_used) - self._column(self._gas_used_for_l1)
+
+    def _summarize(self, group_ids: np.ndarray, keys: list) -> GasUsageSummary:
+        size = len(keys)
+        return GasUsageSummary(
+            keys,
+            np.bincount(group_ids, minlength=size),
+            _sum_by_group(group_ids, self._l2_gas, size),
+            _sum_by_group(group_ids, self._column(self._gas_used_for_l1), size),
+        )
+
+    @staticmethod
+    def _column(values: array) -> np.ndarray:
+        # NOTE: Shares memory with the underlying array (no copy).
+        return np.frombuffer(values, dtype=np.int64)
+
+
+def _get_id(ids: dict[str, int], key: str) -> int:
+    if key not in ids:
+        ids[key] = len(ids)
+
+    return ids[key]
+
+
+def _sum_by_group(group_ids: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    totals = np.zeros(size, dtype=np.int64)
+    np.add.at(totals, group_ids, values)
+    return totals
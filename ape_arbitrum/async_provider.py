@@ -0,0 +1,410 @@
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from ape.api.providers import BlockAPI
+from ape.api.transactions import ReceiptAPI, TransactionAPI
+from ape.exceptions import ProviderError, TransactionNotFoundError
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+from eth_utils import to_hex
+from web3 import AsyncHTTPProvider, AsyncWeb3, WebSocketProvider
+from web3.exceptions import TransactionNotFound
+
+from .ecosystem import MIN_CONFIRMATIONS_POLL_INTERVAL, ApeArbitrumError
+
+if TYPE_CHECKING:
+    from ape.types import AddressType, BlockID
+
+    from .ecosystem import Arbitrum
+
+# NOTE: The most open HTTP connections to the node, which are kept alive between requests.
+DEFAULT_MAX_CONNECTIONS = 100
+
+# NOTE: The number of seconds to wait for a single request.
+DEFAULT_REQUEST_TIMEOUT = 30
+
+# NOTE: The number of seconds to wait for a transaction to be included.
+DEFAULT_RECEIPT_TIMEOUT = 120
+
+
+class AsyncArbitrumProvider(ManagerAccessMixin):
+    """
+    An asyncio client for an Arbitrum node, so receipts, blocks and calls can be
+    awaited and many requests can share one event loop. HTTP(S) URLs use a pool
+    of keep-alive connections and websocket URLs use one persistent connection.
+    Results are decoded with the Arbitrum ecosystem, like the synchronous provider,
+    using the client's chain ID, confirmations and block time rather than the
+    connected network's, so nothing blocks the event loop.
+
+    Usage example::
+
+        async with AsyncArbitrumProvider("https://arb1.arbitrum.io/rpc") as provider:
+            blocks = await asyncio.gather(*(provider.get_block(n) for n in range(100)))
+            receipt = await provider.get_receipt(txn_hash, required_confirmations=2)
+
+    Args:
+        uri (str | None): The node's HTTP(S) or websocket URL. Defaults to the
+          connected provider's HTTP URL.
+        max_connections (int): The most open HTTP connections.
+        request_timeout (float): The number of seconds to wait for a single request.
+        max_concurrency (int | None): The most requests in flight at once.
+          Defaults to ``max_connections``.
+        required_confirmations (int): The confirmations receipts wait for by default.
+        block_time (float): The seconds between blocks, which sets how often
+          confirmations are polled.
+    """
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        max_concurrency: int | None = None,
+        required_confirmations: int = 0,
+        block_time: float = 1,
+    ):
+        if uri is None and (uri := getattr(self.provider, "http_uri", None)) is None:
+            raise ApeArbitrumError("The connected provider has no HTTP URL.")
+
+        self.uri = uri
+        self.max_connections = max_connections
+        self.request_timeout = request_timeout
+        self.max_concurrency = max_concurrency or max_connections
+        self.required_confirmations = required_confirmations
+        self.block_time = block_time
+        self._web3: AsyncWeb3 | None = None
+        self._session: ClientSession | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._chain_id: int | None = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.disconnect()
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        Whether :meth:`connect` was called.
+        """
+        return self._web3 is not None
+
+    @property
+    def web3(self) -> AsyncWeb3:
+        """
+        The connected ``AsyncWeb3`` instance.
+        """
+        if self._web3 is None:
+            raise ApeArbitrumError("The async provider is not connected.")
+
+        return self._web3
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        The number of seconds between checks for new confirmations.
+        """
+        # NOTE: Poll at the same interval as the synchronous receipts.
+        return max(self.block_time / 2, MIN_CONFIRMATIONS_POLL_INTERVAL)
+
+    @property
+    def ecosystem(self) -> "Arbitrum":
+        """
+        The ecosystem decoding the results.
+        """
+        return self.network_manager.get_ecosystem("arbitrum")  # type: ignore[return-value]
+
+    async def connect(self):
+        """
+        Open the connection pool, or the websocket connection.
+        """
+        if self._web3 is not None:
+            return
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.uri.startswith(("ws://", "wss://")):
+            web3 = AsyncWeb3(WebSocketProvider(self.uri, request_timeout=self.request_timeout))
+            await web3.provider.connect()
+
+        else:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=self.max_connections),
+                timeout=ClientTimeout(total=self.request_timeout),
+            )
+            provider = AsyncHTTPProvider(self.uri)
+            await provider.cache_async_session(self._session)
+            web3 = AsyncWeb3(provider)
+
+        self._web3 = web3
+
+    async def disconnect(self):
+        """
+        Close the connections.
+        """
+        web3, self._web3 = self._web3, None
+        if web3 is not None and isinstance(web3.provider, WebSocketProvider):
+            await web3.provider.disconnect()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def make_request(self, method: str, params: list | None = None) -> Any:
+        """
+        Make a raw JSON-RPC request.
+
+        Args:
+            method (str): The RPC method.
+            params (list | None): The RPC parameters.
+
+        Returns:
+            Any: The raw result.
+        """
+        async with self._get_semaphore():
+            response = await self.web3.provider.make_request(method, params or [])  # type: ignore[arg-type]
+
+        if "error" in response:
+            error = response["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise ProviderError(f"{method}: {message}")
+
+        return response.get("result")
+
+    async def make_requests(
+        self, requests: Iterable[tuple[str, list]], return_exceptions: bool = False
+    ) -> list[Any]:
+        """
+        Make many raw JSON-RPC requests concurrently.
+
+        Args:
+            requests (Iterable[tuple[str, list]]): The methods and their parameters.
+            return_exceptions (bool): Set to ``True`` to return errors in place
+              of their results instead of raising the first one.
+
+        Returns:
+            list[Any]: The raw results, in order.
+        """
+        return await asyncio.gather(
+            *(self.make_request(method, params) for method, params in requests),
+            return_exceptions=return_exceptions,
+        )
+
+    async def get_chain_id(self) -> int:
+        """
+        Get the chain ID, which is only requested once.
+
+        Returns:
+            int
+        """
+        if self._chain_id is None:
+            self._chain_id = int(await self.make_request("eth_chainId"), 16)
+
+        return self._chain_id
+
+    async def get_block_number(self) -> int:
+        """
+        Get the number of the latest block.
+
+        Returns:
+            int
+        """
+        return int(await self.make_request("eth_blockNumber"), 16)
+
+    async def get_balance(self, address: "AddressType", block_id: "BlockID | None" = None) -> int:
+        """
+        Get the balance of an account.
+
+        Args:
+            address (:class:`~ape.types.address.AddressType`): The account.
+            block_id (:class:`~ape.types.BlockID` | None): The block. Defaults to the latest.
+
+        Returns:
+            int
+        """
+        async with self._get_semaphore():
+            return await self.web3.eth.get_balance(address, block_identifier=block_id)
+
+    async def get_nonce(self, address: "AddressType", block_id: "BlockID | None" = None) -> int:
+        """
+        Get the number of transactions sent by an account.
+
+        Args:
+            address (:class:`~ape.types.address.AddressType`): The account.
+            block_id (:class:`~ape.types.BlockID` | None): The block. Defaults to the latest.
+
+        Returns:
+            int
+        """
+        async with self._get_semaphore():
+            return await self.web3.eth.get_transaction_count(address, block_identifier=block_id)
+
+    async def get_block(self, block_id: "BlockID") -> BlockAPI:
+        """
+        Get a block.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block.
+
+        Returns:
+            :class:`~ape.api.providers.BlockAPI`
+        """
+        async with self._get_semaphore():
+            block = await self.web3.eth.get_block(block_id)  # type: ignore[arg-type]
+
+        return self.ecosystem.decode_block(dict(block))
+
+    async def send_call(self, txn: TransactionAPI, block_id: "BlockID | None" = None) -> HexBytes:
+        """
+        Execute a call without creating a transaction.
+
+        Args:
+            txn (:class:`~ape.api.transactions.TransactionAPI`): The call.
+            block_id (:class:`~ape.types.BlockID` | None): The block. Defaults to the latest.
+
+        Returns:
+            HexBytes: The returned data.
+        """
+        arguments: dict[str, Any] = {"data": HexBytes(txn.data).to_0x_hex()}
+        if txn.receiver:
+            arguments["to"] = txn.receiver
+        if txn.sender:
+            arguments["from"] = txn.sender
+        if txn.value:
+            arguments["value"] = to_hex(txn.value)
+        if txn.gas_limit:
+            arguments["gas"] = to_hex(txn.gas_limit)
+
+        block = to_hex(block_id) if isinstance(block_id, int) else block_id or "latest"
+        return HexBytes(await self.make_request("eth_call", [arguments, block]))
+
+    async def send_transaction(
+        self, txn: TransactionAPI, required_confirmations: int | None = None
+    ) -> ReceiptAPI:
+        """
+        Send a signed transaction and wait for its receipt.
+
+        Args:
+            txn (:class:`~ape.api.transactions.TransactionAPI`): The signed transaction.
+            required_confirmations (int | None): The confirmations to wait for.
+              Defaults to the transaction's.
+
+        Returns:
+            :class:`~ape.api.transactions.ReceiptAPI`
+        """
+        if txn.signature is None:
+            raise ApeArbitrumError("The transaction is not signed.")
+
+        txn_hash = await self.make_request(
+            "eth_sendRawTransaction", [HexBytes(txn.serialize_transaction()).to_0x_hex()]
+        )
+        if required_confirmations is None:
+            required_confirmations = txn.required_confirmations
+
+        return await self.get_receipt(txn_hash, required_confirmations=required_confirmations)
+
+    async def get_receipt(
+        self,
+        txn_hash: str,
+        required_confirmations: int | None = None,
+        timeout: float | None = None,
+    ) -> ReceiptAPI:
+        """
+        Wait for a transaction to be included and get its receipt.
+
+        Args:
+            txn_hash (str): The transaction hash.
+            required_confirmations (int | None): The confirmations to wait for.
+              Defaults to :attr:`required_confirmations`.
+            timeout (float | None): The number of seconds to wait for the transaction
+              to be included.
+
+        Returns:
+            :class:`~ape.api.transactions.ReceiptAPI`
+        """
+        timeout = timeout or DEFAULT_RECEIPT_TIMEOUT
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            # NOTE: Only hold a concurrency slot for each poll, not while waiting,
+            #   so pending transactions don't starve the other requests.
+            async with self._get_semaphore():
+                try:
+                    receipt = await self.web3.eth.get_transaction_receipt(
+                        txn_hash  # type: ignore[arg-type]
+                    )
+                    break
+                except TransactionNotFound:
+                    pass
+
+            if loop.time() >= deadline:
+                raise TransactionNotFoundError(
+                    transaction_hash=txn_hash,
+                    error_message=f"Transaction '{txn_hash}' not included after {timeout} seconds.",
+                )
+
+            await asyncio.sleep(MIN_CONFIRMATIONS_POLL_INTERVAL)
+
+        async with self._get_semaphore():
+            txn = await self.web3.eth.get_transaction(txn_hash)  # type: ignore[arg-type]
+
+        data = {**txn, **receipt}
+        if "effectiveGasPrice" in data:
+            data["gasPrice"] = data["effectiveGasPrice"]
+        # NOTE: Set the transaction defaults, so decoding does not look them up
+        #   through the synchronous provider.
+        if data.get("chainId") is None:
+            data["chainId"] = await self.get_chain_id()
+        if required_confirmations is None:
+            required_confirmations = self.required_confirmations
+
+        data["required_confirmations"] = required_confirmations
+        return await self.await_confirmations(self.ecosystem.decode_receipt(data))
+
+    async def get_receipts(
+        self, txn_hashes: Iterable[str], required_confirmations: int | None = None
+    ) -> list[ReceiptAPI]:
+        """
+        Get many receipts concurrently.
+
+        Args:
+            txn_hashes (Iterable[str]): The transaction hashes.
+            required_confirmations (int | None): The confirmations to wait for.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]: The receipts, in order.
+        """
+        return await asyncio.gather(
+            *(
+                self.get_receipt(txn_hash, required_confirmations=required_confirmations)
+                for txn_hash in txn_hashes
+            )
+        )
+
+    async def await_confirmations(self, receipt: ReceiptAPI) -> ReceiptAPI:
+        """
+        Wait until a receipt has its required confirmations, without blocking the event loop.
+
+        Args:
+            receipt (:class:`~ape.api.transactions.ReceiptAPI`): The receipt.
+
+        Returns:
+            :class:`~ape.api.transactions.ReceiptAPI`: The same receipt.
+        """
+        if not receipt.required_confirmations or receipt.failed:
+            return receipt
+
+        target = receipt.block_number + receipt.required_confirmations
+        while await self.get_block_number() < target:
+            await asyncio.sleep(self.poll_interval)
+
+        return receipt
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            raise ApeArbitrumError("The async provider is not connected.")
+
+        return self._semaphore
@@ -0,0 +1,505 @@
+import random
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ape.exceptions import ProviderError
+from ape_node import Node
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    RequestException,
+)
+from web3 import Web3
+from web3.providers import HTTPProvider, JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+if TYPE_CHECKING:
+    from ape.api.providers import BlockAPI
+    from ape.api.transactions import ReceiptAPI
+    from ape.types import BlockID
+
+    from .cache import BlockCache
+
+# NOTE: Methods whose results depend on the node's view of pending transactions.
+#   They always go to the same endpoint, so nonces and sends stay consistent.
+STICKY_METHODS = frozenset(
+    (
+        "eth_getTransactionCount",
+        "eth_sendRawTransaction",
+        "eth_sendTransaction",
+        "eth_signTransaction",
+    )
+)
+
+# NOTE: JSON-RPC error codes that mean the endpoint is rate-limiting or overloaded.
+RATE_LIMIT_ERROR_CODES = frozenset((-32005, 429))
+
+# NOTE: The weight of the newest sample in an endpoint's average latency.
+LATENCY_SMOOTHING = 0.3
+
+# NOTE: The latency assumed for endpoints without samples yet.
+DEFAULT_LATENCY = 0.1
+
+
+class _EndpointError(Exception):
+    # An endpoint answered, but with a rate-limit error.
+    def __init__(self, response: Any):
+        super().__init__(str(response.get("error") if isinstance(response, dict) else response))
+        self.response = response
+
+
+class Endpoint:
+    """
+    An RPC endpoint and its health.
+
+    Args:
+        uri (str): The endpoint's HTTP URL.
+        request_kwargs (dict | None): Arguments for each HTTP request, such as ``headers``.
+    """
+
+    def __init__(self, uri: str, request_kwargs: dict | None = None):
+        self.uri = uri
+        # NOTE: Failures go to the next endpoint rather than retrying this one.
+        self.provider = HTTPProvider(
+            uri, request_kwargs=request_kwargs, exception_retry_configuration=None
+        )
+        self.latency: float | None = None
+        """The average seconds per request."""
+
+        self.block_number: int | None = None
+        """The latest block of the endpoint, as of the last health check."""
+
+        self.healthy = True
+        self.requests = 0
+        self.failures = 0
+        self.retry_at = 0.0
+
+    def __repr__(self) -> str:
+        return f"<Endpoint {self.uri} healthy={self.healthy} latency={self.latency}>"
+
+    def record_latency(self, seconds: float):
+        """
+        Add a latency sample to the average.
+
+        Args:
+            seconds (float): The duration of a request.
+        """
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_SMOOTHING * (seconds - self.latency)
+
+
+class LoadBalancedProvider(JSONBaseProvider):
+    """
+    A web3 provider that spreads requests across several RPC endpoints.
+
+    * Reads go to a healthy endpoint picked at random, weighted by the inverse
+      of its average latency, so faster endpoints get more of the traffic.
+    * Reads that take longer than ``hedge_delay`` are also sent to a second
+      endpoint, and the first response is used.
+    * Nonce-sensitive methods (see ``STICKY_METHODS``) always go to one endpoint,
+      which only changes when it becomes unhealthy.
+    * Endpoints that fail, or rate-limit, are skipped until ``failure_cooldown``
+      passes or a health check finds them healthy again. Health checks also mark
+      endpoints that fall more than ``max_block_lag`` blocks behind as unhealthy.
+
+    Usage example::
+
+        provider = LoadBalancedProvider(["https://a.example", "https://b.example"])
+        provider.start_health_checks()
+        web3 = Web3(provider)
+        ...
+        provider.close()
+
+    Args:
+        endpoints (Sequence[str]): The endpoints' HTTP URLs.
+        request_kwargs (dict | None): Arguments for each HTTP request, such as ``headers``.
+        hedge_delay (float | None): The number of seconds before a read is also sent
+          to a second endpoint. Defaults to ``None``, which disables hedging.
+        health_check_interval (float): The number of seconds between health checks.
+        max_block_lag (int): The most blocks an endpoint may be behind the others.
+        failure_cooldown (float): The number of seconds a failed endpoint is skipped for.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        request_kwargs: dict | None = None,
+        hedge_delay: float | None = None,
+        health_check_interval: float = 15,
+        max_block_lag: int = 20,
+        failure_cooldown: float = 30,
+    ):
+        if not endpoints:
+            raise ProviderError("A load-balanced provider requires at least one endpoint.")
+
+        super().__init__()
+        self.endpoints = [Endpoint(uri, request_kwargs=request_kwargs) for uri in endpoints]
+        self.hedge_delay = hedge_delay
+        self.health_check_interval = health_check_interval
+        self.max_block_lag = max_block_lag
+        self.failure_cooldown = failure_cooldown
+        self._sticky: Endpoint | None = None
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * len(self.endpoints) + 2, thread_name_prefix="ape-arbitrum-rpc"
+        )
+        self._stop = threading.Event()
+        self._health_thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} endpoints={len(self.endpoints)}>"
+
+    @property
+    def sticky_endpoint(self) -> Endpoint:
+        """
+        The endpoint nonce-sensitive methods are sent to.
+        """
+        with self._lock:
+            if self._sticky is None or not self._is_available(self._sticky, time.monotonic()):
+                candidates = self._get_candidates(set())
+                self._sticky = min(
+                    candidates or self.endpoints,
+                    key=lambda endpoint: endpoint.latency or DEFAULT_LATENCY,
+                )
+
+            return self._sticky
+
+    @property
+    def stats(self) -> list[dict]:
+        """
+        The health, latency and request counts of each endpoint.
+        """
+        return [
+            {
+                "uri": endpoint.uri,
+                "healthy": endpoint.healthy,
+                "latency": endpoint.latency,
+                "block_number": endpoint.block_number,
+                "requests": endpoint.requests,
+                "failures": endpoint.failures,
+            }
+            for endpoint in self.endpoints
+        ]
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        def send(provider: HTTPProvider) -> RPCResponse:
+            return provider.make_request(method, params)
+
+        if method in STICKY_METHODS:
+            return self._send_sticky(send)
+
+        return self._send_read(send)
+
+    def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        def send(provider: HTTPProvider) -> list[RPCResponse] | RPCResponse:
+            return provider.make_batch_request(requests)
+
+        if any(method in STICKY_METHODS for method, _ in requests):
+            return self._send_sticky(send)
+
+        return self._send_read(send)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(endpoint.provider.is_connected(show_traceback) for endpoint in self.endpoints)
+
+    def check_health(self):
+        """
+        Request the latest block from every endpoint, updating their latencies
+        and marking those that fail or fall behind as unhealthy.
+        """
+
+        def check(endpoint: Endpoint) -> int | None:
+            try:
+                response = self._call(endpoint, lambda p: p.make_request("eth_blockNumber", []))
+            except (RequestException, _EndpointError):
+                return None
+
+            result = response.get("result")
+            return int(result, 16) if isinstance(result, str) else result
+
+        block_numbers = list(self._executor.map(check, self.endpoints))
+        best = max((n for n in block_numbers if n is not None), default=None)
+        now = time.monotonic()
+        with self._lock:
+            for endpoint, block_number in zip(self.endpoints, block_numbers, strict=True):
+                endpoint.block_number = block_number
+                if block_number is None or best is None:
+                    self._mark_failed(endpoint, now)
+                elif best - block_number > self.max_block_lag:
+                    endpoint.healthy = False
+                    endpoint.retry_at = now + self.health_check_interval
+                else:
+                    endpoint.healthy = True
+
+    def start_health_checks(self):
+        """
+        Check the endpoints now, and then every ``health_check_interval`` seconds
+        in a background thread.
+        """
+        self.check_health()
+        if self._health_thread is not None:
+            return
+
+        self._stop.clear()
+        self._health_thread = threading.Thread(
+            target=self._run_health_checks, name="ape-arbitrum-health", daemon=True
+        )
+        self._health_thread.start()
+
+    def stop_health_checks(self):
+        """
+        Stop the background health checks.
+        """
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join()
+            self._health_thread = None
+
+    def close(self):
+        """
+        Stop the health checks and the threads hedged requests are sent from.
+        """
+        self.stop_health_checks()
+        # NOTE: Don't wait for slow endpoints to answer requests no one is waiting for.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_health_checks(self):
+        while not self._stop.wait(self.health_check_interval):
+            self.check_health()
+
+    def _send_sticky(self, send: Callable[[HTTPProvider], Any]) -> Any:
+        tried: set[Endpoint] = set()
+        while True:
+            endpoint = self.sticky_endpoint
+            if endpoint in tried:
+                raise ProviderError(f"All {len(self.endpoints)} endpoints failed.")
+
+            tried.add(endpoint)
+            try:
+                return self._call(endpoint, send)
+            except RequestsConnectionError:
+                # NOTE: The request never reached the node, so it is safe to send elsewhere.
+                #   Other failures, such as timeouts, may have been sent and are raised.
+                continue
+
+            except RequestException as err:
+                raise ProviderError(f"Request to '{endpoint.uri}' failed: {err}") from err
+
+            except _EndpointError as err:
+                return err.response
+
+    def _send_read(self, send: Callable[[HTTPProvider], Any]) -> Any:
+        tried: set[Endpoint] = set()
+        pending: dict[Future, Endpoint] = {}
+        error: Exception | None = None
+        hedged = self.hedge_delay is None or len(self.endpoints) < 2
+        while True:
+            if not pending and (endpoint := self._choose(tried)) is not None:
+                tried.add(endpoint)
+                if hedged and not pending:
+                    # NOTE: Without hedging, there is no need for another thread.
+                    try:
+                        return self._call(endpoint, send)
+                    except (RequestException, _EndpointError) as err:
+                        error = err
+                        continue
+
+                pending[self._executor.submit(self._call, endpoint, send)] = endpoint
+
+            if not pending:
+                if isinstance(error, _EndpointError):
+                    return error.response
+
+                raise error or ProviderError("No endpoints available.")
+
+            done, _ = wait(
+                pending, timeout=None if hedged else self.hedge_delay, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                # NOTE: Slow response; send the same request to another endpoint too.
+                hedged = True
+                if (endpoint := self._choose(tried)) is not None:
+                    tried.add(endpoint)
+                    pending[self._executor.submit(self._call, endpoint, send)] = endpoint
+
+                continue
+
+            for future in done:
+                del pending[future]
+                try:
+                    return future.result()
+                except (RequestException, _EndpointError) as err:
+                    error = err
+
+    def _call(self, endpoint: Endpoint, send: Callable[[HTTPProvider], Any]) -> Any:
+        start = time.monotonic()
+        try:
+            response = send(endpoint.provider)
+        except RequestException:
+            with self._lock:
+                self._mark_failed(endpoint, time.monotonic())
+
+            raise
+
+        now = time.monotonic()
+        with self._lock:
+            endpoint.requests += 1
+            if _is_rate_limited(response):
+                self._mark_failed(endpoint, now)
+                raise _EndpointError(response)
+
+            endpoint.record_latency(now - start)
+            endpoint.failures = 0
+
+        return response
+
+    def _choose(self, exclude: set[Endpoint]) -> Endpoint | None:
+        with self._lock:
+            candidates = self._get_candidates(exclude)
+            if not candidates:
+                # NOTE: Try unhealthy endpoints rather than failing outright.
+                candidates = [endpoint for endpoint in self.endpoints if endpoint not in exclude]
+                if not candidates:
+                    return None
+
+            weights = [1 / max(e.latency or DEFAULT_LATENCY, 0.001) for e in candidates]
+            return self._random.choices(candidates, weights=weights)[0]
+
+    def _get_candidates(self, exclude: set[Endpoint]) -> list[Endpoint]:
+        now = time.monotonic()
+        return [
+            endpoint
+            for endpoint in self.endpoints
+            if endpoint not in exclude and self._is_available(endpoint, now)
+        ]
+
+    def _is_available(self, endpoint: Endpoint, now: float) -> bool:
+        # NOTE: Unhealthy endpoints get another chance once their cooldown passes.
+        return endpoint.healthy or now >= endpoint.retry_at
+
+    def _mark_failed(self, endpoint: Endpoint, now: float):
+        endpoint.healthy = False
+        endpoint.failures += 1
+        endpoint.retry_at = now + self.failure_cooldown
+
+
+class ArbitrumNode(Node):
+    """
+    A node provider that spreads requests across the endpoints in the network's
+    ``load_balancer`` config, when set. Otherwise, the same as ``ape_node.Node``.
+    With ``block_cache.enabled`` configured, blocks and receipts are served
+    from the chain's :class:`~ape_arbitrum.cache.BlockCache`.
+
+    Usage example (``ape-config.yaml``)::
+
+        arbitrum:
+          mainnet:
+            load_balancer:
+              endpoints:
+                - https://arb1.arbitrum.io/rpc
+                - https://arbitrum.example.com
+    """
+
+    # NOTE: Keep the name of the ``ape_node`` provider this replaces.
+    NAME: ClassVar[str] = "node"
+
+    _load_balancer: LoadBalancedProvider | None = None
+    _block_cache: "BlockCache | None" = None
+
+    @property
+    def load_balancer(self) -> LoadBalancedProvider | None:
+        """
+        The load-balanced web3 provider, when connected with several endpoints.
+        """
+        return self._load_balancer
+
+    @property
+    def uri(self) -> str:
+        if (config := self._get_load_balancer_config()) is not None:
+            return config.endpoints[0]
+
+        return super().uri
+
+    @property
+    def http_uri(self) -> str | None:
+        if self._load_balancer is not None:
+            return self._load_balancer.sticky_endpoint.uri
+        if (config := self._get_load_balancer_config()) is not None:
+            return config.endpoints[0]
+
+        return super().http_uri
+
+    def connect(self):
+        super().connect()
+        if self._load_balancer is not None:
+            self._load_balancer.start_health_checks()
+
+        # NOTE: Resolved once, rather than reading the config on every request.
+        ecosystem = self.network.ecosystem
+        config = getattr(ecosystem.config, "block_cache", None)
+        if config is not None and config.enabled:
+            self._block_cache = ecosystem.get_block_cache(self.chain_id)  # type: ignore[attr-defined]
+
+    def disconnect(self):
+        if self._load_balancer is not None:
+            self._load_balancer.close()
+            self._load_balancer = None
+
+        self._block_cache = None
+        super().disconnect()
+
+    def get_block(self, block_id: "BlockID") -> "BlockAPI":
+        if self._block_cache is None:
+            return super().get_block(block_id)
+
+        return self._block_cache.get_block(block_id, request=super().get_block)
+
+    def get_receipt(
+        self, txn_hash: str, required_confirmations: int = 0, timeout: int | None = None, **kwargs
+    ) -> "ReceiptAPI":
+        if self._block_cache is None or required_confirmations or kwargs:
+            # NOTE: Waiting for confirmations, or sent transactions, skip the cache.
+            return super().get_receipt(
+                txn_hash, required_confirmations=required_confirmations, timeout=timeout, **kwargs
+            )
+
+        return self._block_cache.get_receipt(
+            txn_hash, request=lambda h: super(ArbitrumNode, self).get_receipt(h, timeout=timeout)
+        )
+
+    def _set_web3(self):
+        if (config := self._get_load_balancer_config()) is None:
+            super()._set_web3()
+            return
+
+        self._client_version = None
+        headers = self.network_manager.get_request_headers(
+            self.network.ecosystem.name, self.network.name, self.name
+        )
+        self._load_balancer = LoadBalancedProvider(
+            config.endpoints,
+            request_kwargs={"headers": headers, "timeout": config.request_timeout},
+            hedge_delay=config.hedge_delay,
+            health_check_interval=config.health_check_interval,
+            max_block_lag=config.max_block_lag,
+            failure_cooldown=config.failure_cooldown,
+        )
+        self._web3 = Web3(self._load_balancer, middleware=[])
+
+    def _get_load_balancer_config(self) -> Any:
+        config = getattr(self.network.config, "load_balancer", None)
+        return config if config is not None and config.endpoints else None
+
+
+def _is_rate_limited(response: Any) -> bool:
+    if not isinstance(response, dict) or not isinstance(error := response.get("error"), dict):
+        return False
+
+    return error.get("code") in RATE_LIMIT_ERROR_CODES
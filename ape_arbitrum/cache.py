@@ -0,0 +1,388 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from typing import TYPE_CHECKING, Any, cast
+
+from ape.api.providers import BlockAPI
+from ape.api.transactions import ReceiptAPI
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+
+if TYPE_CHECKING:
+    from ape.types import BlockID
+
+# NOTE: The approximate memory (in bytes) of a decoded block, receipt and log.
+#   Measured with `tracemalloc`, to estimate the size of the cache without walking the objects.
+BLOCK_SIZE_ESTIMATE = 1_600
+RECEIPT_SIZE_ESTIMATE = 3_300
+LOG_SIZE_ESTIMATE = 600
+
+
+class _CacheEntry:
+    __slots__ = ("block", "complete", "receipts", "size", "updated")
+
+    def __init__(self):
+        self.block: BlockAPI | None = None
+        self.receipts: dict[bytes, ReceiptAPI] = {}
+        self.complete = False
+        self.size = 0
+        self.updated = time.monotonic()
+
+
+class BlockCache(ManagerAccessMixin):
+    """
+    A bounded, thread-safe cache of decoded blocks and receipts, keyed by
+    block number and evicted least-recently-used first once the estimated
+    memory exceeds ``max_bytes``.
+
+    Finalized blocks (those at or below the node's ``finalized`` block) can't
+    change, so they are served from the cache until evicted. Unsafe blocks
+    near the head are only served for ``unsafe_ttl`` seconds and are then
+    requested again. When a block doesn't match the cached blocks around it,
+    e.g. after a reorg, the cached unsafe blocks from that height are dropped.
+
+    Each chain has its own cache (see :attr:`~ape_arbitrum.ecosystem.Arbitrum.block_cache`),
+    and with ``block_cache.enabled`` configured, the ``node`` provider serves
+    ``get_block()`` and ``get_receipt()`` from it.
+
+    Usage example::
+
+        cache = networks.arbitrum.block_cache
+        block = cache.get_block(12345)
+        receipt = cache.get_receipt(txn_hash)
+        print(cache.hits, cache.misses)
+
+    Args:
+        max_bytes (int): The most memory the cached blocks and receipts may use, estimated.
+        unsafe_ttl (float): The number of seconds unsafe blocks are served for.
+        finality_ttl (float): The number of seconds between requests for the
+          ``finalized`` block.
+    """
+
+    def __init__(
+        self, max_bytes: int = 64 * 1024 * 1024, unsafe_ttl: float = 1, finality_ttl: float = 60
+    ):
+        self.max_bytes = max_bytes
+        self.unsafe_ttl = unsafe_ttl
+        self.finality_ttl = finality_ttl
+        self.finalized_block: int | None = None
+        """The highest known finalized block number."""
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self._block_hashes: dict[bytes, int] = {}
+        self._txn_hashes: dict[bytes, int] = {}
+        self._finality_checked: float | None = None
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The share of lookups served from the cache.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """
+        The cache metrics, such as for exporting to a monitoring system.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "blocks": len(self._entries),
+            "bytes": self.size,
+        }
+
+    def get_block(
+        self, block_id: "BlockID", request: Callable[["BlockID"], BlockAPI] | None = None
+    ) -> BlockAPI:
+        """
+        Get a block, from the cache when possible. Tags such as ``"latest"``
+        always request the block, which is then cached by number.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block number, hash or tag.
+            request (Callable | None): Requests the block on a miss.
+              Defaults to the provider's ``get_block()``.
+
+        Returns:
+            :class:`~ape.api.providers.BlockAPI`
+        """
+        number = self._get_block_number(block_id)
+        if number is not None and (entry := self._lookup(number, _has_block)):
+            return cast("BlockAPI", entry.block)
+
+        self._count_miss()
+        block = (request or self.provider.get_block)(block_id)
+        if block_id == "finalized" and block.number is not None:
+            self.set_finalized(block.number)
+
+        self.put_block(block)
+        return block
+
+    def get_receipt(
+        self, txn_hash: str, request: Callable[[str], ReceiptAPI] | None = None
+    ) -> ReceiptAPI:
+        """
+        Get a receipt, from the cache when possible.
+
+        Args:
+            txn_hash (str): The transaction hash.
+            request (Callable | None): Requests the receipt on a miss.
+              Defaults to the provider's ``get_receipt()``.
+
+        Returns:
+            :class:`~ape.api.transactions.ReceiptAPI`
+        """
+        key = bytes(HexBytes(txn_hash))
+        number = self._txn_hashes.get(key)
+        if number is not None and (entry := self._lookup(number, lambda e: key in e.receipts)):
+            return entry.receipts[key]
+
+        self._count_miss()
+        receipt = (request or self.provider.get_receipt)(txn_hash)
+        self.put_receipts([receipt])
+        return receipt
+
+    def get_block_receipts(self, block_id: "BlockID") -> list[ReceiptAPI]:
+        """
+        Get all the receipts of a block, from the cache when possible.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block number, hash or tag.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]
+        """
+        number = self._get_block_number(block_id)
+        if number is not None and (entry := self._lookup(number, _is_complete)):
+            return list(entry.receipts.values())
+
+        self._count_miss()
+        ecosystem = self.network_manager.get_ecosystem("arbitrum")
+        receipts = ecosystem.decode_block_receipts(block_id)  # type: ignore[attr-defined]
+        if receipts:
+            self.put_receipts(receipts, complete=True)
+
+        return receipts
+
+    def put_block(self, block: BlockAPI):
+        """
+        Add a block, dropping the cached unsafe blocks it shows were reorged.
+
+        Args:
+            block (:class:`~ape.api.providers.BlockAPI`): The block.
+        """
+        if block.number is None or block.hash is None:
+            # NOTE: Pending blocks have no number or hash yet.
+            return
+
+        number = block.number
+        block_hash = bytes(block.hash)
+        with self._lock:
+            if self._get_cached_hash(number) not in (None, block_hash):
+                self._invalidate(number)
+
+            if self._get_cached_hash(number - 1) not in (None, bytes(block.parent_hash)):
+                self._invalidate(number - 1)
+
+            child = self._entries.get(number + 1)
+            if child and child.block and bytes(child.block.parent_hash) != block_hash:
+                self._invalidate(number + 1)
+
+            entry = self._get_or_create_entry(number)
+            if entry.block is None:
+                entry.size += BLOCK_SIZE_ESTIMATE
+                self.size += BLOCK_SIZE_ESTIMATE
+            else:
+                self._block_hashes.pop(bytes(entry.block.hash or b""), None)
+
+            entry.block = block
+            entry.updated = time.monotonic()
+            self._block_hashes[block_hash] = number
+            self._evict()
+
+    def put_receipts(self, receipts: list[ReceiptAPI], complete: bool = False):
+        """
+        Add receipts.
+
+        Args:
+            receipts (list[:class:`~ape.api.transactions.ReceiptAPI`]): The receipts.
+            complete (bool): Whether these are all the receipts of their block.
+        """
+        with self._lock:
+            for receipt in receipts:
+                entry = self._get_or_create_entry(receipt.block_number)
+                key = bytes(HexBytes(receipt.txn_hash))
+                if key not in entry.receipts:
+                    size = _estimate_receipt_size(receipt)
+                    entry.size += size
+                    self.size += size
+
+                entry.receipts[key] = receipt
+                entry.updated = time.monotonic()
+                self._txn_hashes[key] = receipt.block_number
+
+            if complete and receipts:
+                self._entries[receipts[0].block_number].complete = True
+
+            self._evict()
+
+    def set_finalized(self, number: int):
+        """
+        Set the highest finalized block, so blocks up to it are served without expiring.
+
+        Args:
+            number (int): The finalized block number.
+        """
+        with self._lock:
+            self.finalized_block = max(number, self.finalized_block or 0)
+            self._finality_checked = time.monotonic()
+
+    def invalidate(self, number: int):
+        """
+        Drop the cached unsafe blocks from the given height, such as after a reorg.
+
+        Args:
+            number (int): The lowest block number to drop.
+        """
+        with self._lock:
+            self._invalidate(number)
+
+    def clear(self):
+        """
+        Remove all the cached blocks and receipts.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._block_hashes.clear()
+            self._txn_hashes.clear()
+            self.size = 0
+
+    def _lookup(self, number: int, is_cached: Callable[[_CacheEntry], bool]) -> _CacheEntry | None:
+        if number in self._entries and self._is_expired(number):
+            # NOTE: The block may have been finalized since it was cached.
+            self._refresh_finality()
+
+        with self._lock:
+            entry = self._entries.get(number)
+            # NOTE: Only a hit when the entry has what the caller needs,
+            #   e.g. not for a block when only some of its receipts are cached.
+            if entry is None or not is_cached(entry) or self._is_expired(number):
+                return None
+
+            self._entries.move_to_end(number)
+            self.hits += 1
+            return entry
+
+    def _is_expired(self, number: int) -> bool:
+        if self.finalized_block is not None and number <= self.finalized_block:
+            return False
+
+        entry = self._entries.get(number)
+        return entry is None or time.monotonic() - entry.updated >= self.unsafe_ttl
+
+    def _refresh_finality(self):
+        checked = self._finality_checked
+        if checked is not None and time.monotonic() - checked < self.finality_ttl:
+            return
+
+        self._finality_checked = time.monotonic()
+        block = self.provider.get_block("finalized")
+        if block.number is not None:
+            self.set_finalized(block.number)
+
+    def _count_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def _get_block_number(self, block_id: "BlockID") -> int | None:
+        if isinstance(block_id, int):
+            return block_id
+
+        if isinstance(block_id, bytes) or (isinstance(block_id, str) and len(block_id) == 66):
+            return self._block_hashes.get(bytes(HexBytes(block_id)))
+
+        # NOTE: Tags, such as "latest", move and are always requested.
+        return None
+
+    def _get_cached_hash(self, number: int) -> bytes | None:
+        entry = self._entries.get(number)
+        return bytes(entry.block.hash or b"") if entry and entry.block else None
+
+    def _get_or_create_entry(self, number: int) -> _CacheEntry:
+        if (entry := self._entries.get(number)) is None:
+            entry = self._entries[number] = _CacheEntry()
+        else:
+            self._entries.move_to_end(number)
+
+        return entry
+
+    def _invalidate(self, number: int):
+        finalized = self.finalized_block if self.finalized_block is not None else -1
+        for key in [key for key in self._entries if key >= max(number, finalized + 1)]:
+            self._remove(key)
+            self.invalidations += 1
+
+    def _evict(self):
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, number: int):
+        entry = self._entries.pop(number)
+        self.size -= entry.size
+        if entry.block is not None:
+            self._block_hashes.pop(bytes(entry.block.hash or b""), None)
+
+        for key in entry.receipts:
+            self._txn_hashes.pop(key, None)
+
+
+def _has_block(entry: _CacheEntry) -> bool:
+    return entry.block is not None
+
+
+def _is_complete(entry: _CacheEntry) -> bool:
+    return entry.complete
+
+
+def _estimate_receipt_size(receipt: ReceiptAPI) -> int:
+    # NOTE: Lazy receipts are sized from their raw data, as reading their
+    #   `transaction` or `logs` would create them.
+    fields = receipt.__dict__
+    if (transaction := fields.get("transaction")) is not None:
+        data_size = len(transaction.data or b"")
+    else:
+        data_size = getattr(receipt, "_data_size", 0)
+
+    if (logs := fields.get("logs")) is None:
+        logs = getattr(receipt, "_raw_logs", None) or []
+
+    size = RECEIPT_SIZE_ESTIMATE + data_size
+    for log in logs:
+        topics = log.get("topics") or []
+        size += LOG_SIZE_ESTIMATE + _get_byte_size(log.get("data")) + 32 * len(topics)
+
+    return size
+
+
+def _get_byte_size(value: Any) -> int:
+    # NOTE: Raw data may still be hex-encoded.
+    if isinstance(value, str):
+        return len(value.removeprefix("0x")) // 2
+
+    return len(value or b"")
@@ -0,0 +1,166 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+from ape.api.transactions import ReceiptAPI
+from eth_pydantic_types import HexBytes
+
+RECEIPT_DTYPE = np.dtype(
+    [
+        ("block_number", np.int64),
+        ("txn_hash", np.uint8, (32,)),
+        ("status", np.uint8),
+        ("type", np.uint8),
+        ("gas_used", np.uint64),
+        ("gas_used_for_L1", np.uint64),
+        ("gas_price", np.uint64),
+    ]
+)
+"""
+The columns stored for each receipt. Transaction hashes are stored as raw bytes
+rather than a ``bytes`` dtype, which would drop trailing zero-bytes.
+"""
+
+STATUS_UNKNOWN = 255
+"""The stored ``status`` of receipts without one, such as pending receipts."""
+
+
+def receipts_to_array(receipts: Iterable[ReceiptAPI]) -> np.ndarray:
+    """
+    Convert receipts to a structured array, sorted by block number.
+
+    Args:
+        receipts (Iterable[:class:`~ape.api.transactions.ReceiptAPI`]): The receipts.
+
+    Returns:
+        ``numpy.ndarray``: An array with the :data:`RECEIPT_DTYPE` columns.
+    """
+    rows = [
+        (
+            receipt.block_number,
+            bytes(HexBytes(receipt.txn_hash)),
+            STATUS_UNKNOWN if receipt.status is None else receipt.status,
+            receipt.transaction.type,
+            receipt.gas_used,
+            getattr(receipt, "gas_used_for_L1", 0),
+            getattr(receipt, "gas_price", 0),
+        )
+        for receipt in receipts
+    ]
+    array = np.empty(len(rows), dtype=RECEIPT_DTYPE)
+    if not rows:
+        return array
+
+    columns = list(zip(*rows, strict=True))
+    array["txn_hash"] = np.frombuffer(b"".join(columns[1]), dtype=np.uint8).reshape(-1, 32)
+    for name, column in zip(RECEIPT_DTYPE.names or (), columns, strict=True):
+        if name != "txn_hash":
+            array[name] = column
+
+    return np.sort(array, order="block_number", kind="stable")
+
+
+def get_txn_hash(row: np.void) -> str:
+    """
+    Get the transaction hash of a stored receipt as a hex string.
+
+    Args:
+        row (``numpy.void``): A row from a receipt array.
+
+    Returns:
+        str
+    """
+    return HexBytes(row["txn_hash"].tobytes()).to_0x_hex()
+
+
+class ReceiptStore:
+    """
+    A directory of columnar receipt files, one per written batch. Files are named
+    by their block range and memory-mapped when read, so querying a block range
+    only reads the overlapping files from disk and nothing is re-validated.
+
+    Usage example::
+
+        store = ReceiptStore(path)
+        store.write(networks.arbitrum.decode_block_receipts(block_number))
+        receipts = store.query(start_block, stop_block)
+        total_l1_gas = receipts["gas_used_for_L1"].sum()
+
+    Args:
+        path (Path): The directory to store receipts in.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def __len__(self) -> int:
+        return sum(len(self._load(path)) for path, _, _ in self._files)
+
+    def write(self, receipts: Iterable[ReceiptAPI] | np.ndarray) -> Path | None:
+        """
+        Store a batch of receipts. Arrays are sorted by block number first,
+        as file names and queries rely on the order.
+
+        Args:
+            receipts (Iterable[:class:`~ape.api.transactions.ReceiptAPI`] | ``numpy.ndarray``):
+              The receipts, or an array from :func:`receipts_to_array`.
+
+        Returns:
+            Path | None: The new file, or ``None`` when there were no receipts.
+        """
+        array = receipts if isinstance(receipts, np.ndarray) else receipts_to_array(receipts)
+        if not len(array):
+            return None
+
+        if np.any(np.diff(array["block_number"]) < 0):
+            array = np.sort(array, order="block_number", kind="stable")
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        start, stop = int(array["block_number"][0]), int(array["block_number"][-1])
+        path = self.path / f"{start:012d}-{stop:012d}-{len(list(self._files)):06d}.npy"
+        np.save(path, array, allow_pickle=False)
+        return path
+
+    def query(self, start_block: int = 0, stop_block: int | None = None) -> np.ndarray:
+        """
+        Get the stored receipts in a block range.
+
+        Args:
+            start_block (int): The first block. Defaults to ``0``.
+            stop_block (int | None): The last block (inclusive). Defaults to no limit.
+
+        Returns:
+            ``numpy.ndarray``: The receipts, sorted by block number.
+        """
+        stop = np.iinfo(np.int64).max if stop_block is None else stop_block
+        chunks = [
+            _select_block_range(self._load(path), start_block, stop)
+            for path, file_start, file_stop in self._files
+            if file_start <= stop and file_stop >= start_block
+        ]
+        if not chunks:
+            return np.empty(0, dtype=RECEIPT_DTYPE)
+
+        array = np.concatenate(chunks)
+        return np.sort(array, order="block_number", kind="stable")
+
+    @property
+    def _files(self) -> Iterator[tuple[Path, int, int]]:
+        if not self.path.is_dir():
+            return
+
+        for path in sorted(self.path.glob("*.npy")):
+            start, stop, _ = path.stem.split("-")
+            yield path, int(start), int(stop)
+
+    @staticmethod
+    def _load(path: Path) -> np.ndarray:
+        return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def _select_block_range(array: np.ndarray, start_block: int, stop_block: int) -> np.ndarray:
+    # NOTE: Arrays are sorted by block number, so a binary search finds the range.
+    block_numbers = array["block_number"]
+    start = np.searchsorted(block_numbers, start_block, side="left")
+    stop = np.searchsorted(block_numbers, stop_block, side="right")
+    return array[start:stop]
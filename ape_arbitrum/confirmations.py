@@ -0,0 +1,137 @@
+import time
+from collections.abc import Iterable
+
+from ape.api.transactions import ReceiptAPI
+from ape.exceptions import TransactionError
+from ape.utils.basemodel import ManagerAccessMixin
+from tqdm import tqdm  # type: ignore
+
+from .ecosystem import (
+    MIN_CONFIRMATIONS_POLL_INTERVAL,
+    NONCELESS_TRANSACTION_TYPES,
+    ApeArbitrumError,
+)
+
+
+class ConfirmationTracker(ManagerAccessMixin):
+    """
+    Waits for many receipts to be confirmed while checking the chain head only
+    once per poll, rather than once per receipt. Internal (type 106) and other
+    system receipts skip the sender-nonce check, as they don't increase a nonce.
+
+    Usage example::
+
+        tracker = ConfirmationTracker(receipts)
+        resolved = tracker.wait()
+    """
+
+    def __init__(self, receipts: Iterable[ReceiptAPI] = ()):
+        self.resolved: list[ReceiptAPI] = []
+        self._pending: list[ReceiptAPI] = []
+        for receipt in receipts:
+            self.register(receipt)
+
+    @property
+    def pending(self) -> list[ReceiptAPI]:
+        """
+        The receipts still waiting for their required confirmations.
+        """
+        return list(self._pending)
+
+    def register(self, receipt: ReceiptAPI):
+        """
+        Start tracking a receipt. Failed receipts and receipts not requiring
+        any confirmations are resolved immediately.
+
+        Args:
+            receipt (:class:`~ape.api.transactions.ReceiptAPI`): The receipt to track.
+        """
+        try:
+            receipt.raise_for_status()
+        except TransactionError:
+            # Skip waiting for confirmations when the transaction has failed.
+            self.resolved.append(receipt)
+            return
+
+        if not receipt.required_confirmations:
+            self.resolved.append(receipt)
+        else:
+            self._pending.append(receipt)
+
+    def poll(self) -> list[ReceiptAPI]:
+        """
+        Check the chain head once and resolve every receipt that has
+        reached its required confirmations.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]: The newly resolved receipts.
+        """
+        if not self._pending:
+            return []
+
+        head = self.provider.get_block("latest").number or 0
+        sender_nonces: dict[str, int] = {}
+        resolved = []
+        pending = []
+        for receipt in self._pending:
+            if head - receipt.block_number < receipt.required_confirmations:
+                pending.append(receipt)
+                continue
+
+            transaction = receipt.transaction
+            if transaction.type not in NONCELESS_TRANSACTION_TYPES and (
+                sender := transaction.sender
+            ):
+                # NOTE: Only request each sender's nonce once per poll.
+                if sender not in sender_nonces:
+                    sender_nonces[sender] = self.provider.get_nonce(sender)
+
+                if sender_nonces[sender] == transaction.nonce:
+                    pending.append(receipt)
+                    continue
+
+            resolved.append(receipt)
+
+        self._pending = pending
+        self.resolved.extend(resolved)
+        return resolved
+
+    def wait(self, timeout: float | None = None, show_progress: bool = True) -> list[ReceiptAPI]:
+        """
+        Wait until all the registered receipts are confirmed.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait.
+              Defaults to waiting indefinitely.
+            show_progress (bool): Set to ``False`` to hide the progress bar.
+              Defaults to ``True``.
+
+        Raises:
+            :class:`~ape_arbitrum.ecosystem.ApeArbitrumError`: When the timeout is reached.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]: All the resolved receipts.
+        """
+        if not self._pending:
+            return self.resolved
+
+        for receipt in self._pending:
+            receipt._log_submission()
+
+        poll_interval = max(self.provider.network.block_time / 2, MIN_CONFIRMATIONS_POLL_INTERVAL)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with tqdm(total=len(self._pending), disable=not show_progress) as progress_bar:
+            progress_bar.set_description("Confirmed receipts")
+            while self._pending:
+                progress_bar.update(len(self.poll()))
+                if not self._pending:
+                    break
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ApeArbitrumError(
+                        f"Timed out waiting for {len(self._pending)} receipt(s) to confirm."
+                    )
+
+                time.sleep(poll_interval)
+
+        return self.resolved
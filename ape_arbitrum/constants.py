@@ -0,0 +1,35 @@
+# NOTE: Static network metadata lives here, separate from the ecosystem,
+#   so registering networks does not import the ecosystem's dependencies.
+NETWORKS = {
+    # chain_id, network_id
+    "mainnet": (42161, 42161),
+    "sepolia": (421614, 421614),
+    "nova": (42170, 42170),
+}
+
+# NOTE: The first Nitro block (and sequencer message), per chain. Arbitrum One
+#   started at a non-zero block when it migrated to Nitro, and older blocks
+#   can only be traced with the classic `arbtrace_*` methods.
+GENESIS_BLOCKS = {42161: 22_207_817}
+
+DEPOSIT_TRANSACTION_TYPE = 100
+UNSIGNED_TRANSACTION_TYPE = 101
+CONTRACT_TRANSACTION_TYPE = 102
+RETRY_TRANSACTION_TYPE = 104
+SUBMIT_RETRYABLE_TRANSACTION_TYPE = 105
+INTERNAL_TRANSACTION_TYPE = 106
+
+# NOTE: Transactions created by ArbOS or from L1 messages don't increase the sender's nonce.
+NONCELESS_TRANSACTION_TYPES = frozenset(
+    (
+        DEPOSIT_TRANSACTION_TYPE,
+        CONTRACT_TRANSACTION_TYPE,
+        RETRY_TRANSACTION_TYPE,
+        SUBMIT_RETRYABLE_TRANSACTION_TYPE,
+        INTERNAL_TRANSACTION_TYPE,
+    )
+)
+
+# NOTE: Use a hard-coded gas limit for testing
+#   because the block gasLimit is extremely high in Arbitrum networks.
+LOCAL_GAS_LIMIT = 30_000_000
@@ -1,13 +1,20 @@
+import asyncio
+import random
 import time
-from typing import ClassVar, cast
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast, get_args
 
+from ape.api.config import PluginConfig
 from ape.api.transactions import ConfirmationsProgressBar, ReceiptAPI, TransactionAPI
 from ape.exceptions import ApeException, TransactionError
 from ape.logging import logger
-from ape.types import GasLimit, HexInt, TransactionSignature
+from ape.types import AddressType, AutoGasLimit, GasLimit, HexInt, TransactionSignature
 from ape.utils.misc import DEFAULT_LIVE_NETWORK_BASE_FEE_MULTIPLIER
 from ape_ethereum.ecosystem import BaseEthereumConfig, Ethereum, NetworkConfig
 from ape_ethereum.transactions import (
+    AccessList,
     AccessListTransaction,
     DynamicFeeTransaction,
     Receipt,
@@ -16,25 +23,108 @@ from ape_ethereum.transactions import (
     TransactionType as EthTransactionType,
 )
 from eth_pydantic_types import HexBytes
+from ethpm_types import MethodABI
+from pydantic import BaseModel, model_validator
 from pydantic.fields import Field
+from web3.exceptions import MethodUnavailable
 
-NETWORKS = {
-    # chain_id, network_id
-    "mainnet": (42161, 42161),
-    "sepolia": (421614, 421614),
-    "nova": (42170, 42170),
-}
-INTERNAL_TRANSACTION_TYPE = 106
+from .constants import (  # noqa: F401
+    CONTRACT_TRANSACTION_TYPE,
+    DEPOSIT_TRANSACTION_TYPE,
+    INTERNAL_TRANSACTION_TYPE,
+    LOCAL_GAS_LIMIT,
+    NETWORKS,
+    NONCELESS_TRANSACTION_TYPES,
+    RETRY_TRANSACTION_TYPE,
+    SUBMIT_RETRYABLE_TRANSACTION_TYPE,
+    UNSIGNED_TRANSACTION_TYPE,
+)
+from .instrumentation import instrumentation
+
+if TYPE_CHECKING:
+    from ape.types import BlockID
+    from ape_ethereum.transactions import BaseTransaction
+    from ethpm_types import EventABI
+
+    from .cache import BlockCache
+    from .fees import FeeOracle
+    from .finality import FinalityTracker
+    from .gas import GasEstimateCache
+    from .logs import LogScanner
+    from .nonces import NonceManager
+    from .precompiles import ArbitrumPrecompiles
+
+_NetworkConfigT = TypeVar("_NetworkConfigT", bound=NetworkConfig)
+_StateT = TypeVar("_StateT")
+
+# NOTE: The shortest time to wait between checks for new confirmations.
+MIN_CONFIRMATIONS_POLL_INTERVAL = 0.1
 
-# NOTE: Use a hard-coded gas limit for testing
-#   because the block gasLimit is extremely high in Arbitrum networks.
-LOCAL_GAS_LIMIT = 30_000_000
+# NOTE: The number of seconds to wait for a sender's nonce to increase (as in ape).
+NONCE_INCREMENT_TIMEOUT = 20
 
 
 class InternalTransaction(StaticFeeTransaction):
     type: int = Field(default=INTERNAL_TRANSACTION_TYPE, exclude=True)
 
 
+class DepositTransaction(StaticFeeTransaction):
+    """
+    An ETH deposit from L1 (type 100).
+    """
+
+    type: int = Field(default=DEPOSIT_TRANSACTION_TYPE, exclude=True)
+    request_id: HexBytes | None = Field(default=None, alias="requestId")
+
+
+class UnsignedTransaction(StaticFeeTransaction):
+    """
+    An unsigned transaction sent from L1 on behalf of a sender (type 101).
+    """
+
+    type: int = Field(default=UNSIGNED_TRANSACTION_TYPE, exclude=True)
+
+
+class ContractTransaction(StaticFeeTransaction):
+    """
+    A call from an L1 contract, without a nonce (type 102).
+    """
+
+    type: int = Field(default=CONTRACT_TRANSACTION_TYPE, exclude=True)
+    request_id: HexBytes | None = Field(default=None, alias="requestId")
+
+
+class RetryTransaction(StaticFeeTransaction):
+    """
+    An attempt to redeem a retryable ticket (type 104), scheduled
+    either automatically when the ticket is created or by a manual redeem.
+    """
+
+    type: int = Field(default=RETRY_TRANSACTION_TYPE, exclude=True)
+    ticket_id: HexBytes | None = Field(default=None, alias="ticketId")
+    refund_to: AddressType | None = Field(default=None, alias="refundTo")
+    max_refund: HexInt = Field(default=0, alias="maxRefund")
+    submission_fee_refund: HexInt = Field(default=0, alias="submissionFeeRefund")
+
+
+class SubmitRetryableTransaction(StaticFeeTransaction):
+    """
+    The creation of a retryable ticket from L1 (type 105).
+    Its transaction hash is the ticket ID.
+    """
+
+    type: int = Field(default=SUBMIT_RETRYABLE_TRANSACTION_TYPE, exclude=True)
+    request_id: HexBytes | None = Field(default=None, alias="requestId")
+    l1_base_fee: HexInt = Field(default=0, alias="l1BaseFee")
+    deposit_value: HexInt = Field(default=0, alias="depositValue")
+    retry_to: AddressType | None = Field(default=None, alias="retryTo")
+    retry_value: HexInt = Field(default=0, alias="retryValue")
+    retry_data: HexBytes = Field(default=HexBytes(""), alias="retryData")
+    beneficiary: AddressType | None = None
+    max_submission_fee: HexInt = Field(default=0, alias="maxSubmissionFee")
+    refund_to: AddressType | None = Field(default=None, alias="refundTo")
+
+
 class ApeArbitrumError(ApeException):
     """
     Raised in the ape-arbitrum plugin.
@@ -44,16 +134,17 @@ class ApeArbitrumError(ApeException):
 class ArbitrumReceipt(Receipt):
     gas_used_for_L1: HexInt = Field(default=0, alias="gasUsedForL1")
 
+    @instrumentation.instrument("await_confirmations")
     def await_confirmations(self) -> "ReceiptAPI":
         """
-        Overridden to handle skipping nonce-check for internal txns.
+        Overridden to handle skipping nonce-check for internal and other system txns.
         """
 
-        if self.type != INTERNAL_TRANSACTION_TYPE:
+        if self.type not in NONCELESS_TRANSACTION_TYPES:
             return super().await_confirmations()
 
         # This logic is copied from ape-ethereum but removes the nonce-increase
-        # waiting, as internal transactions don't increase a nonce (apparently).
+        # waiting, as system transactions don't increase a nonce.
 
         try:
             self.raise_for_status()
@@ -78,27 +169,152 @@ class ArbitrumReceipt(Receipt):
 
         logger.info(log_message)
 
-        if self.required_confirmations:
-            with ConfirmationsProgressBar(self.required_confirmations) as progress_bar:
-                while confirmations_occurred < self.required_confirmations:
-                    confirmations_occurred = self._confirmations_occurred
-                    progress_bar.confs = confirmations_occurred
+        self._await_confirmations()
+        return self
+
+    async def await_confirmations_async(self) -> "ReceiptAPI":
+        """
+        Wait for a transaction to be considered confirmed without blocking the
+        event loop, so that many receipts can be awaited at once. The blocking
+        RPC calls run in a worker thread between ``asyncio.sleep()`` intervals.
+
+        Returns:
+            :class:`~ape.api.ReceiptAPI`: The receipt that is now confirmed.
+        """
+        if self.type not in NONCELESS_TRANSACTION_TYPES:
+            # NOTE: Internal and other system transactions don't increase a nonce.
+            await self._await_sender_nonce_increment_async()
+
+        try:
+            self.raise_for_status()
+        except TransactionError:
+            # Skip waiting for confirmations when the transaction has failed.
+            return self
+
+        if not self.required_confirmations:
+            return self
 
-                    if confirmations_occurred == self.required_confirmations:
-                        break
+        confirmations_occurred = await asyncio.to_thread(self._get_confirmations_occurred)
+        if confirmations_occurred >= self.required_confirmations:
+            return self
 
-                    time_to_sleep = int(self._block_time / 2)
-                    time.sleep(time_to_sleep)
+        self._log_submission()
+        while confirmations_occurred < self.required_confirmations:
+            await asyncio.sleep(self._confirmations_poll_interval)
+            confirmations_occurred = await asyncio.to_thread(self._get_confirmations_occurred)
 
         return self
 
+    async def _await_sender_nonce_increment_async(self):
+        # NOTE: Like `_await_sender_nonce_increment()`, but only each nonce
+        #   check runs in a worker thread, so waiting does not hold one.
+        if not self.sender:
+            return
+
+        sender_nonce = await asyncio.to_thread(self.provider.get_nonce, self.sender)
+        for _ in range(NONCE_INCREMENT_TIMEOUT):
+            if sender_nonce != self.nonce:
+                return
+
+            await asyncio.sleep(1)
+            sender_nonce = await asyncio.to_thread(self.provider.get_nonce, self.sender)
+
+        if sender_nonce != self.nonce:
+            return
+
+        tx_err = TransactionError("Timeout waiting for sender's nonce to increase.")
+        self.error = tx_err
+        if self.transaction.raise_on_revert:
+            raise tx_err
+
+    @property
+    def _confirmations_poll_interval(self) -> float:
+        # NOTE: Arbitrum's block time is 1 second, so truncating half of it to
+        #   an integer (like ape-ethereum does) would poll in a busy-loop.
+        return max(self._block_time / 2, MIN_CONFIRMATIONS_POLL_INTERVAL)
+
+    def _await_confirmations(self):
+        """
+        Overridden to check the chain head once per poll and sleep
+        for a fractional part of the block time.
+        """
+        if not self.required_confirmations:
+            return
+
+        with ConfirmationsProgressBar(self.required_confirmations) as progress_bar:
+            while True:
+                confirmations_occurred = self._confirmations_occurred
+                progress_bar.confs = min(confirmations_occurred, self.required_confirmations)
+                if confirmations_occurred >= self.required_confirmations:
+                    break
+
+                time.sleep(self._confirmations_poll_interval)
+
+    @instrumentation.instrument("await_confirmations.poll")
+    def _get_confirmations_occurred(self) -> int:
+        return self._confirmations_occurred
+
+
+class LazyArbitrumReceipt(ArbitrumReceipt):
+    """
+    An :class:`ArbitrumReceipt` that keeps its ``transaction`` and ``logs``
+    as raw data until they are first accessed. Useful when scanning many
+    receipts but only reading fields such as ``status`` or ``gas_used``.
+    """
+
+    transaction: TransactionAPI | None = None  # type: ignore[assignment]
+    logs: list[dict] | None = None  # type: ignore[assignment]
+
+    _transaction_factory: Callable[[], TransactionAPI] | None = None
+    _raw_logs: list | None = None
+    _data_size: int = 0
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "transaction" and self._transaction_factory is not None:
+            self.__dict__["transaction"] = self._transaction_factory()
+            self._transaction_factory = None
+            return self.__dict__["transaction"]
+
+        if name == "logs" and self._raw_logs is not None:
+            self.__dict__["logs"] = [dict(log) for log in self._raw_logs]
+            self._raw_logs = None
+            return self.__dict__["logs"]
+
+        return super().__getattr__(name)
+
+    def model_dump(self, *args, **kwargs) -> dict[str, Any]:
+        self._materialize()
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs) -> str:
+        self._materialize()
+        return super().model_dump_json(*args, **kwargs)
+
+    def _defer(
+        self, transaction_factory: Callable[[], TransactionAPI], logs: list, data_size: int = 0
+    ):
+        self._transaction_factory = transaction_factory
+        self._raw_logs = logs
+        # NOTE: Kept so the receipt can be sized, e.g. by the block cache, without
+        #   creating the transaction.
+        self._data_size = data_size
+
+        # NOTE: Removing the fields from the instance makes the next access
+        #   go through `__getattr__`, where they are created and cached.
+        del self.__dict__["transaction"]
+        del self.__dict__["logs"]
+
+    def _materialize(self):
+        _ = self.transaction
+        _ = self.logs
+
 
 def _create_config(
     required_confirmations: int = 1,
     block_time: int = 1,
-    cls: type = NetworkConfig,
+    cls: type[_NetworkConfigT] = NetworkConfig,  # type: ignore[assignment]
     **kwargs,
-) -> NetworkConfig:
+) -> _NetworkConfigT:
     return cls(
         required_confirmations=required_confirmations,
         block_time=block_time,
@@ -108,19 +324,454 @@ def _create_config(
     )
 
 
+def _is_network_config(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, NetworkConfig)
+
+
+def _create_key_aliases(aliases: dict[str, tuple[str, ...]]) -> dict[str, tuple[str, int]]:
+    # Maps each key to its canonical key and its precedence (lower wins),
+    # so that normalizing data only takes a single pass.
+    return {
+        key: (canonical_key, precedence)
+        for canonical_key, keys in aliases.items()
+        for precedence, key in enumerate(keys)
+    }
+
+
+def _normalize_keys(data: dict, aliases: dict[str, tuple[str, int]]) -> dict:
+    result: dict = {}
+    precedences: dict[str, int] = {}
+    for key, value in data.items():
+        if key not in aliases:
+            result[key] = value
+            continue
+
+        canonical_key, precedence = aliases[key]
+        if precedences.get(canonical_key, precedence) < precedence:
+            # A preferred alias was already found.
+            continue
+
+        result[canonical_key] = value
+        precedences[canonical_key] = precedence
+
+    return result
+
+
+def _get_types(annotation: Any) -> set[type]:
+    # The classes in a (possibly nested) annotation, such as `int` in `HexInt | None`.
+    if args := get_args(annotation):
+        return set().union(*(_get_types(arg) for arg in args))
+
+    return {annotation} if isinstance(annotation, type) else set()
+
+
+def _to_int(value: Any) -> Any:
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def _to_hex_bytes(value: Any) -> Any:
+    return value if isinstance(value, HexBytes) else HexBytes(value)
+
+
+def _to_access_list(value: Any) -> Any:
+    return [AccessList.model_validate(dict(item)) for item in value]
+
+
+def _create_trusted_fields(
+    model: type[BaseModel], aliases: dict[str, tuple[str, int]]
+) -> dict[str, tuple[str, Callable | None]]:
+    # Maps each key of a node's data (the field names and aliases) to its field
+    # and a cheap conversion, for building the model without validation.
+    fields: dict[str, tuple[str, Callable | None]] = {}
+    for name, field in model.model_fields.items():
+        types = _get_types(field.annotation)
+        converter: Callable | None = None
+        if AccessList in types:
+            converter = _to_access_list
+        elif any(issubclass(cls, bytes) for cls in types):
+            converter = _to_hex_bytes
+        elif int in types:
+            converter = _to_int
+
+        fields[name] = (name, converter)
+        if field.alias:
+            fields[field.alias] = (name, converter)
+
+    for key, (canonical_key, _) in aliases.items():
+        if key not in fields and canonical_key in fields:
+            fields[key] = fields[canonical_key]
+
+    return fields
+
+
+def _create_trusted_transaction_fields(
+    transaction_types: dict[int, type[TransactionAPI]], aliases: dict[str, tuple[str, int]]
+) -> dict[int, tuple[type[TransactionAPI], dict[str, tuple[str, Callable | None]]]]:
+    return {
+        version: (txn_class, _create_trusted_fields(txn_class, aliases))
+        for version, txn_class in transaction_types.items()
+    }
+
+
+class LoadBalancerConfig(PluginConfig):
+    """
+    Settings for spreading a network's requests across several RPC endpoints.
+    See :class:`~ape_arbitrum.balancer.LoadBalancedProvider`.
+    """
+
+    endpoints: list[str] = []
+    """The HTTP URLs of the endpoints. Requests use a single node when empty."""
+
+    hedge_delay: float | None = 0.5
+    """
+    The number of seconds before a slow read is also sent to another endpoint.
+    Set to ``None`` to disable hedging.
+    """
+
+    health_check_interval: float = 15
+    """The number of seconds between checks of every endpoint."""
+
+    max_block_lag: int = 20
+    """The most blocks an endpoint may fall behind the others and stay healthy."""
+
+    failure_cooldown: float = 30
+    """The number of seconds an endpoint that failed a request is skipped for."""
+
+    request_timeout: float = 30
+    """The number of seconds to wait for a response."""
+
+
+class ArbitrumNetworkConfig(NetworkConfig):
+    """
+    The config of an Arbitrum network.
+    """
+
+    load_balancer: LoadBalancerConfig = LoadBalancerConfig()
+
+
+class BlockCacheConfig(PluginConfig):
+    """
+    Settings for the cache of decoded blocks and receipts.
+    """
+
+    enabled: bool = False
+    """Set to ``True`` for the ``node`` provider to serve blocks and receipts from the cache."""
+
+    max_bytes: int = 64 * 1024 * 1024
+    """The most memory (estimated, in bytes) the cached blocks and receipts may use."""
+
+    unsafe_ttl: float = 1
+    """The number of seconds blocks that are not yet finalized are served for."""
+
+    finality_ttl: float = 60
+    """The number of seconds between requests for the ``finalized`` block."""
+
+
+class GasEstimateCacheConfig(PluginConfig):
+    """
+    Settings for re-using gas estimates of repeated transactions on live networks.
+    """
+
+    enabled: bool = False
+    """Set to ``True`` to cache gas estimates."""
+
+    ttl: float = 60
+    """
+    The length, in seconds, of the wall-clock time buckets estimates are re-used within.
+    Buckets do not follow L1 base fee changes.
+    """
+
+    size: int = 1024
+    """The maximum number of cached estimates."""
+
+    multiplier: float = 1.1
+    """A safety multiplier applied to the cached estimates."""
+
+    calldata_bucket_size: int = 32
+    """Transactions with calldata lengths in the same bucket share an estimate."""
+
+
+class InstrumentationConfig(PluginConfig):
+    """
+    Settings for recording the performance of the plugin's hot paths.
+    """
+
+    enabled: bool = False
+    """
+    Set to ``True`` to record call counts, latencies and allocations. See
+    :class:`~ape_arbitrum.instrumentation.Instrumentation`.
+    """
+
+
+class TrustedDecodeConfig(PluginConfig):
+    """
+    Settings for decoding data from a trusted node, such as your own, without validation.
+    """
+
+    enabled: bool = False
+    """
+    Set to ``True`` to decode receipts and their transactions without validation
+    by default. See :meth:`~ape_arbitrum.ecosystem.Arbitrum.decode_receipts`.
+    """
+
+    validation_sample_rate: float = 0.01
+    """The fraction of trusted receipts to also decode with validation and compare."""
+
+
+class FeeOracleConfig(PluginConfig):
+    """
+    Settings for predicting transaction fees from recent blocks.
+    """
+
+    enabled: bool = False
+    """
+    Set to ``True`` to fill in the fees of dynamic-fee transactions on live networks
+    from the :class:`~ape_arbitrum.fees.FeeOracle`, rather than per transaction.
+    """
+
+    window: int = 20
+    """The number of recent blocks to predict from."""
+
+    multiplier: float = 1.2
+    """The headroom applied to the predicted base fee."""
+
+
 class ArbitrumConfig(BaseEthereumConfig):
     DEFAULT_TRANSACTION_TYPE: ClassVar[int] = EthTransactionType.STATIC.value
     DEFAULT_LOCAL_GAS_LIMIT: ClassVar[GasLimit] = LOCAL_GAS_LIMIT
-    mainnet: NetworkConfig = _create_config()
-    sepolia: NetworkConfig = _create_config()
-    nova: NetworkConfig = _create_config(is_mainnet=True)
+    NETWORKS: ClassVar[dict[str, tuple[int, int]]] = NETWORKS
+    mainnet: ArbitrumNetworkConfig = _create_config(cls=ArbitrumNetworkConfig)
+    sepolia: ArbitrumNetworkConfig = _create_config(cls=ArbitrumNetworkConfig)
+    nova: ArbitrumNetworkConfig = _create_config(cls=ArbitrumNetworkConfig, is_mainnet=True)
+    block_cache: BlockCacheConfig = BlockCacheConfig()
+    gas_estimate_cache: GasEstimateCacheConfig = GasEstimateCacheConfig()
+    instrumentation: InstrumentationConfig = InstrumentationConfig()
+    trusted_decode: TrustedDecodeConfig = TrustedDecodeConfig()
+    fee_oracle: FeeOracleConfig = FeeOracleConfig()
+
+    @model_validator(mode="before")
+    @classmethod
+    def load_network_configs(cls, values):
+        # NOTE: Keep the plugin's own settings from loading as custom networks.
+        values = dict(values)
+        settings = {
+            name: values.pop(name)
+            for name, field in cls.model_fields.items()
+            if not _is_network_config(field.annotation) and name in values
+        }
+        return {**super().load_network_configs(values), **settings}
 
 
 class Arbitrum(Ethereum):
+    _transaction_types: ClassVar[dict[int, type[TransactionAPI]]] = {
+        EthTransactionType.STATIC.value: StaticFeeTransaction,
+        EthTransactionType.DYNAMIC.value: DynamicFeeTransaction,
+        EthTransactionType.ACCESS_LIST.value: AccessListTransaction,
+        DEPOSIT_TRANSACTION_TYPE: DepositTransaction,
+        UNSIGNED_TRANSACTION_TYPE: UnsignedTransaction,
+        CONTRACT_TRANSACTION_TYPE: ContractTransaction,
+        RETRY_TRANSACTION_TYPE: RetryTransaction,
+        SUBMIT_RETRYABLE_TRANSACTION_TYPE: SubmitRetryableTransaction,
+        INTERNAL_TRANSACTION_TYPE: InternalTransaction,
+    }
+    _transaction_key_aliases: ClassVar[dict[str, tuple[str, int]]] = _create_key_aliases(
+        {
+            "max_priority_fee": (
+                "max_priority_fee",
+                "max_priority_fee_per_gas",
+                "maxPriorityFeePerGas",
+                "maxPriorityFee",
+            ),
+            "max_fee": ("max_fee", "max_fee_per_gas", "maxFeePerGas", "maxFee"),
+            "gas": ("gas", "gas_limit", "gasLimit"),
+            "gas_price": ("gas_price", "gasPrice"),
+            "type": (
+                "type",
+                "txType",
+                "tx_type",
+                "txnType",
+                "txn_type",
+                "transactionType",
+                "transaction_type",
+            ),
+            "chainId": ("chainId", "chain_id"),
+            "access_list": ("access_list", "accessList"),
+            # NOTE: `input` takes precedence over `data`.
+            "data": ("input", "data"),
+        }
+    )
+    # NOTE: Precomputed per transaction type, for decoding trusted data without validation.
+    _trusted_transaction_fields: ClassVar[
+        dict[int, tuple[type[TransactionAPI], dict[str, tuple[str, Callable | None]]]]
+    ] = _create_trusted_transaction_fields(_transaction_types, _transaction_key_aliases)
+    _receipt_key_aliases: ClassVar[dict[str, tuple[str, int]]] = _create_key_aliases(
+        {
+            "txn_hash": (
+                "hash",
+                "txHash",
+                "txn_hash",
+                "txnHash",
+                "transactionHash",
+                "transaction_hash",
+            ),
+            "gas_limit": ("gas", "gas_limit", "gasLimit"),
+            "gas_price": ("gas_price", "gasPrice"),
+            "gas_used": ("gas_used", "gasUsed"),
+            "gas_used_for_L1": ("gas_used_for_L1", "gasUsedForL1"),
+        }
+    )
+
     @property
     def config(self) -> ArbitrumConfig:  # type: ignore[override]
         return cast("ArbitrumConfig", self.config_manager.get_config("arbitrum"))
 
+    @property
+    def block_cache(self) -> "BlockCache":
+        """
+        The cache of decoded blocks and receipts of the connected chain,
+        configured by ``block_cache``.
+        """
+        return self.get_block_cache(self.provider.chain_id)
+
+    @property
+    def fee_oracle(self) -> "FeeOracle":
+        """
+        Predicts the connected chain's transaction fees from its recent blocks,
+        configured by ``fee_oracle``.
+        """
+        from .fees import FeeOracle
+
+        config = self._fee_oracle_config
+        return self._get_chain_state(
+            "fee_oracle",
+            partial(
+                FeeOracle, self.precompiles, window=config.window, multiplier=config.multiplier
+            ),
+        )
+
+    @property
+    def finality(self) -> "FinalityTracker":
+        """
+        Tracks the L1 batches and finality of the connected chain's L2 blocks.
+        """
+        from .finality import FinalityTracker
+
+        return self._get_chain_state("finality", partial(FinalityTracker, self.precompiles))
+
+    @cached_property
+    def gas_estimate_cache(self) -> "GasEstimateCache":
+        """
+        The cache of gas estimates used by :meth:`encode_transaction`
+        when ``gas_estimate_cache.enabled`` is configured.
+        """
+        from .gas import GasEstimateCache
+
+        config = self.config.gas_estimate_cache
+        return GasEstimateCache(
+            ttl=config.ttl,
+            size=config.size,
+            multiplier=config.multiplier,
+            calldata_bucket_size=config.calldata_bucket_size,
+        )
+
+    @cached_property
+    def nonces(self) -> "NonceManager":
+        """
+        The local nonce allocator used by
+        :class:`~ape_arbitrum.nonces.TransactionPipeline`.
+        """
+        from .nonces import NonceManager
+
+        return NonceManager()
+
+    @cached_property
+    def precompiles(self) -> "ArbitrumPrecompiles":
+        """
+        A client for the ``ArbGasInfo`` and ``NodeInterface`` precompiles.
+        """
+        from .precompiles import ArbitrumPrecompiles
+
+        return ArbitrumPrecompiles(self)
+
+    def get_block_cache(self, chain_id: int) -> "BlockCache":
+        """
+        Get the cache of decoded blocks and receipts of a chain, configured by ``block_cache``.
+
+        Args:
+            chain_id (int): The ID of the chain.
+
+        Returns:
+            :class:`~ape_arbitrum.cache.BlockCache`
+        """
+        from .cache import BlockCache
+
+        def create() -> BlockCache:
+            config = self.config.block_cache
+            return BlockCache(
+                max_bytes=config.max_bytes,
+                unsafe_ttl=config.unsafe_ttl,
+                finality_ttl=config.finality_ttl,
+            )
+
+        return self._get_chain_state("block_cache", create, chain_id=chain_id)
+
+    def scan_logs(
+        self,
+        address: str | Sequence[str] | None = None,
+        events: Sequence["EventABI"] = (),
+        start_block: int = 0,
+        stop_block: int | None = None,
+        **kwargs,
+    ) -> "LogScanner":
+        """
+        Create a log scanner with a block window that adapts to Arbitrum's block density.
+
+        Args:
+            address (str | Sequence[str] | None): Only get logs from these contracts.
+            events (Sequence[EventABI]): Decode the logs with these events.
+            start_block (int): The first block to scan, such as a saved checkpoint.
+            stop_block (int | None): The last block to scan. Defaults to the latest block.
+            **kwargs: Additional :class:`~ape_arbitrum.logs.LogScanner` arguments.
+
+        Returns:
+            :class:`~ape_arbitrum.logs.LogScanner`
+        """
+        from .logs import LogScanner
+
+        return LogScanner(
+            address=address,
+            events=events,
+            start_block=start_block,
+            stop_block=stop_block,
+            **kwargs,
+        )
+
+    def encode_transaction(
+        self,
+        address: AddressType,
+        abi: MethodABI,
+        *args,
+        **kwargs,
+    ) -> "BaseTransaction":
+        """
+        NOTE: Overridden to use cached gas estimates when configured.
+        """
+        txn = super().encode_transaction(address, abi, *args, **kwargs)
+        if (
+            txn.gas_limit is None
+            and self.config.gas_estimate_cache.enabled
+            and (provider := self.network_manager.active_provider)
+            and (
+                provider.network.gas_limit == "auto"
+                or isinstance(provider.network.gas_limit, AutoGasLimit)
+            )
+        ):
+            # NOTE: Setting the gas limit skips the estimate in `prepare_transaction()`.
+            txn.gas_limit = self.gas_estimate_cache.get_gas_limit(txn, provider.estimate_gas_cost)
+
+        return txn
+
+    @instrumentation.instrument("create_transaction")
     def create_transaction(self, **kwargs) -> TransactionAPI:
         """
         Returns a transaction using the given constructor kwargs.
@@ -133,28 +784,85 @@ class Arbitrum(Ethereum):
         """
 
         # Handle all aliases.
-        tx_data = dict(kwargs)
-        tx_data = _correct_key(
-            "max_priority_fee",
-            tx_data,
-            ("max_priority_fee_per_gas", "maxPriorityFeePerGas", "maxPriorityFee"),
-        )
-        tx_data = _correct_key("max_fee", tx_data, ("max_fee_per_gas", "maxFeePerGas", "maxFee"))
-        tx_data = _correct_key("gas", tx_data, ("gas_limit", "gasLimit"))
-        tx_data = _correct_key("gas_price", tx_data, ("gasPrice",))
-        tx_data = _correct_key(
-            "type",
-            tx_data,
-            (
-                "txType",
-                "tx_type",
-                "txnType",
-                "txn_type",
-                "transactionType",
-                "transaction_type",
-            ),
+        tx_data = _normalize_keys(kwargs, self._transaction_key_aliases)
+        return self._create_transaction(tx_data)
+
+    @instrumentation.instrument("create_transactions")
+    def create_transactions(
+        self, kwargs_list: Iterable[dict], max_workers: int | None = None
+    ) -> list[TransactionAPI]:
+        """
+        Create many transactions, such as when a bot submits in bulk. The
+        network-wide defaults (chain ID, required confirmations and transaction
+        type) are resolved once for the whole batch, and each distinct value
+        or type needing conversion (e.g. ``"1 ether"``) is only converted once.
+
+        Args:
+            kwargs_list (Iterable[dict]): The kwargs of each transaction,
+              as given to :meth:`create_transaction`.
+            max_workers (int | None): Create the transactions in a thread pool
+              of this size. Defaults to creating them in the calling thread.
+
+        Returns:
+            list[:class:`~ape.api.transactions.TransactionAPI`]: The transactions, in order.
+        """
+        defaults = self._get_transaction_defaults()
+        default_type = self.default_transaction_type.value
+        conversions: dict[Any, int] = {}
+
+        def convert(value: Any) -> int:
+            if isinstance(value, int):
+                return value
+
+            if not isinstance(value, Hashable):
+                return self.conversion_manager.convert(value, int)
+
+            if value not in conversions:
+                conversions[value] = self.conversion_manager.convert(value, int)
+
+            return conversions[value]
+
+        items = []
+        for kwargs in kwargs_list:
+            tx_data = _normalize_keys(kwargs, self._transaction_key_aliases)
+            for key, value in defaults.items():
+                if tx_data.get(key) is None:
+                    tx_data[key] = value
+
+            if "value" in tx_data:
+                tx_data["value"] = convert(tx_data["value"] or 0)
+            if tx_data.get("type") is not None and not isinstance(
+                tx_data["type"], EthTransactionType
+            ):
+                tx_data["type"] = convert(tx_data["type"])
+
+            items.append(tx_data)
+
+        create = partial(
+            self._create_transaction,
+            default_type=default_type,
+            use_fee_oracle=self._use_fee_oracle(),
         )
+        if not max_workers or max_workers < 2:
+            return [create(tx_data) for tx_data in items]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(create, items))
+
+    def _use_fee_oracle(self) -> bool:
+        if not self._fee_oracle_config.enabled:
+            return False
+
+        # NOTE: Providers are only active once connected, so this needs no request.
+        provider = self.network_manager.active_provider
+        return provider is not None and not provider.network.is_dev
 
+    def _create_transaction(
+        self,
+        tx_data: dict,
+        default_type: int | None = None,
+        use_fee_oracle: bool | None = None,
+    ) -> TransactionAPI:
         # Handle unique value specifications, such as "1 ether".
         if "value" in tx_data and not isinstance(tx_data["value"], int):
             value = tx_data["value"] or 0  # Convert None to 0.
@@ -165,17 +873,10 @@ class Arbitrum(Ethereum):
             tx_data["data"] = b""
 
         # Deduce the transaction type.
-        transaction_types: dict[int, type[TransactionAPI]] = {
-            EthTransactionType.STATIC.value: StaticFeeTransaction,
-            EthTransactionType.DYNAMIC.value: DynamicFeeTransaction,
-            EthTransactionType.ACCESS_LIST.value: AccessListTransaction,
-            INTERNAL_TRANSACTION_TYPE: InternalTransaction,
-        }
-
         if "type" in tx_data:
             if tx_data["type"] is None:
                 # Explicit `None` means used default.
-                version = self.default_transaction_type.value
+                version = self._get_default_type(default_type)
             elif isinstance(tx_data["type"], EthTransactionType):
                 version = tx_data["type"].value
             elif isinstance(tx_data["type"], int):
@@ -188,10 +889,10 @@ class Arbitrum(Ethereum):
             version = EthTransactionType.STATIC.value
         elif "max_fee" in tx_data or "max_priority_fee" in tx_data:
             version = EthTransactionType.DYNAMIC.value
-        elif "access_list" in tx_data or "accessList" in tx_data:
+        elif "access_list" in tx_data:
             version = EthTransactionType.ACCESS_LIST.value
         else:
-            version = self.default_transaction_type.value
+            version = self._get_default_type(default_type)
 
         tx_data["type"] = version
 
@@ -200,7 +901,18 @@ class Arbitrum(Ethereum):
         if "gas_price" in tx_data and tx_data["gas_price"] is None:
             del tx_data["gas_price"]
 
-        txn_class = transaction_types[version]
+        if (
+            version == EthTransactionType.DYNAMIC.value
+            and tx_data.get("max_fee") is None
+            and (self._use_fee_oracle() if use_fee_oracle is None else use_fee_oracle)
+        ):
+            # NOTE: Saves fetching the base and priority fees for each transaction.
+            estimate = self.fee_oracle.get_fee_estimate()
+            tx_data["max_fee"] = estimate.max_fee
+            if tx_data.get("max_priority_fee") is None:
+                tx_data["max_priority_fee"] = estimate.max_priority_fee
+
+        txn_class = self._transaction_types[version]
 
         if "required_confirmations" not in tx_data or tx_data["required_confirmations"] is None:
             # Attempt to use default required-confirmations from `ape-config.yaml`.
@@ -219,9 +931,6 @@ class Arbitrum(Ethereum):
         ) and self.network_manager.active_provider is not None:
             tx_data["chainId"] = self.provider.chain_id
 
-        if "input" in tx_data:
-            tx_data["data"] = tx_data.pop("input")
-
         if all(field in tx_data for field in ("v", "r", "s")):
             tx_data["signature"] = TransactionSignature(
                 v=tx_data["v"],
@@ -234,28 +943,40 @@ class Arbitrum(Ethereum):
 
         return txn_class(**tx_data)
 
-    def decode_receipt(self, data: dict) -> ReceiptAPI:
+    @instrumentation.instrument("decode_receipt")
+    def decode_receipt(
+        self, data: dict, lazy: bool = False, trusted: bool | None = None
+    ) -> ReceiptAPI:
         """
         NOTE: Overridden to use custom receipt class.
+
+        Args:
+            data (dict): The receipt data.
+            lazy (bool): Set to ``True`` to return a :class:`LazyArbitrumReceipt`,
+              which only creates the transaction and logs when they are accessed.
+              Defaults to ``False``.
+            trusted (bool | None): Set to ``True`` to skip validation for data from
+              a trusted node. Defaults to the ``trusted_decode`` config.
+
+        Returns:
+            :class:`~ape.api.transactions.ReceiptAPI`
         """
+        config = self._trusted_decode_config
+        if config.enabled if trusted is None else trusted:
+            return self._decode_trusted_receipt(
+                data,
+                lazy=lazy,
+                default_type=self._get_default_type(),
+                validation_sample_rate=config.validation_sample_rate,
+            )
+
         status = data.get("status")
         if status:
             status = self.conversion_manager.convert(status, int)
             status = TransactionStatusEnum(status)
 
-        txn_hash = None
-        hash_key_choices = (
-            "hash",
-            "txHash",
-            "txnHash",
-            "transactionHash",
-            "transaction_hash",
-        )
-        for choice in hash_key_choices:
-            if choice in data:
-                txn_hash = data[choice]
-                break
-
+        receipt_data = _normalize_keys(data, self._receipt_key_aliases)
+        txn_hash = receipt_data.get("txn_hash")
         if txn_hash:
             txn_hash = txn_hash.hex() if isinstance(txn_hash, HexBytes) else txn_hash
 
@@ -266,36 +987,236 @@ class Arbitrum(Ethereum):
         elif "input" in data and isinstance(data["input"], str):
             data["input"] = HexBytes(data["input"])
 
+        # NOTE: Unlike the other keys, these fall back to the camelCase key when
+        #   the snake_case one is set but empty, such as `None`.
         block_number = data.get("block_number") or data.get("blockNumber")
         if block_number is None:
             raise ValueError("Block number cannot be None")
 
+        receipt_kwargs = {
+            "block_number": block_number,
+            "contract_address": data.get("contract_address") or data.get("contractAddress"),
+            "gas_limit": receipt_data.get("gas_limit") or 0,
+            "gas_price": receipt_data.get("gas_price") or 0,
+            "gas_used": receipt_data.get("gas_used") or 0,
+            "gasUsedForL1": receipt_data.get("gas_used_for_L1") or 0,
+            "status": status,
+            "txn_hash": txn_hash,
+        }
+        if lazy:
+            receipt = LazyArbitrumReceipt(**receipt_kwargs)
+            receipt._defer(
+                partial(self.create_transaction, **data),
+                data.get("logs", []),
+                data_size=len(data.get("input") or data.get("data") or b""),
+            )
+            return receipt
+
         return ArbitrumReceipt(
-            block_number=block_number,
-            contract_address=data.get("contract_address") or data.get("contractAddress"),
-            gas_limit=data.get("gas", data.get("gas_limit", data.get("gasLimit"))) or 0,
-            gas_price=data.get("gas_price", data.get("gasPrice")) or 0,
-            gas_used=data.get("gas_used", data.get("gasUsed")) or 0,
-            gasUsedForL1=data.get("gas_used_for_L1", data.get("gasUsedForL1")) or 0,
+            **receipt_kwargs,
             logs=data.get("logs", []),
-            status=status,
-            txn_hash=txn_hash,
             transaction=self.create_transaction(**data),
         )
 
+    def decode_receipts(
+        self, data: Iterable[dict], lazy: bool = False, trusted: bool | None = None
+    ) -> Iterator[ReceiptAPI]:
+        """
+        Decode many receipts, such as when ingesting a range of blocks.
+        The network-wide transaction defaults (chain ID and required confirmations)
+        are resolved once for the whole batch rather than once per receipt.
 
-def _correct_key(key: str, data: dict, alt_keys: tuple[str, ...]) -> dict:
-    if key in data:
-        return data
+        Data from a trusted node, such as your own, can skip validation: the
+        receipts and transactions are built with ``model_construct()`` from the
+        node's keys, using field mappings precomputed per transaction type, and
+        only a sample of them is also decoded with validation and compared.
 
-    # Check for alternative.
-    for possible_key in alt_keys:
-        if possible_key not in data:
-            continue
+        Args:
+            data (Iterable[dict]): Receipt data, such as from ``eth_getBlockReceipts``
+              merged with the transaction data.
+            lazy (bool): Set to ``True`` to defer creating each receipt's
+              transaction and logs until accessed. Defaults to ``False``.
+            trusted (bool | None): Set to ``True`` to skip validation for data from
+              a trusted node. Defaults to the ``trusted_decode`` config.
+
+        Returns:
+            Iterator[:class:`~ape.api.transactions.ReceiptAPI`]
+        """
+        defaults = self._get_transaction_defaults()
+        config = self._trusted_decode_config
+        trusted = config.enabled if trusted is None else trusted
+        default_type = self._get_default_type() if trusted else None
+        for receipt_data in data:
+            for key, value in defaults.items():
+                if receipt_data.get(key) is None:
+                    receipt_data[key] = value
+
+            if default_type is None:
+                yield self.decode_receipt(receipt_data, lazy=lazy, trusted=False)
+            else:
+                yield self._decode_trusted_receipt(
+                    receipt_data,
+                    lazy=lazy,
+                    default_type=default_type,
+                    validation_sample_rate=config.validation_sample_rate,
+                )
+
+    @instrumentation.instrument("decode_block_receipts")
+    def decode_block_receipts(
+        self, block_id: "BlockID", lazy: bool = False, trusted: bool | None = None
+    ) -> list[ReceiptAPI]:
+        """
+        Get and decode all the receipts in a block. Uses one request for the
+        block's transactions and one for its receipts, when the node supports
+        ``eth_getBlockReceipts``.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The ID of the block.
+            lazy (bool): Set to ``True`` to defer creating each receipt's
+              transaction and logs until accessed. Defaults to ``False``.
+            trusted (bool | None): Set to ``True`` to skip validation for data from
+              a trusted node. Defaults to the ``trusted_decode`` config.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]
+        """
+        web3 = self.provider.web3  # type: ignore[attr-defined]
+        block = web3.eth.get_block(block_id, full_transactions=True)
+        transactions = block.get("transactions", [])
+
+        try:
+            receipts = web3.eth.get_block_receipts(block["number"])
+        except MethodUnavailable:
+            # NOTE: Not all nodes support `eth_getBlockReceipts` (e.g. local test providers).
+            receipts = [web3.eth.get_transaction_receipt(txn["hash"]) for txn in transactions]
+
+        if len(receipts) != len(transactions):
+            raise ApeArbitrumError(
+                f"Block '{block['number']}' has {len(transactions)} transactions "
+                f"but {len(receipts)} receipts."
+            )
+
+        data = []
+        for txn, receipt in zip(transactions, receipts, strict=True):
+            receipt_data = {**txn, **receipt}
+            if "effectiveGasPrice" in receipt_data:
+                receipt_data["gasPrice"] = receipt_data["effectiveGasPrice"]
+
+            data.append(receipt_data)
+
+        return list(self.decode_receipts(data, lazy=lazy, trusted=trusted))
+
+    def _decode_trusted_receipt(
+        self, data: dict, lazy: bool, default_type: int, validation_sample_rate: float
+    ) -> ReceiptAPI:
+        # NOTE: Trusted data has the node's (camelCase) keys and formatted values.
+        txn_hash = data.get("transactionHash") or data.get("hash")
+        status = data.get("status")
+        receipt_kwargs = {
+            "block_number": data["blockNumber"],
+            "contract_address": data.get("contractAddress"),
+            "gas_limit": data.get("gas") or 0,
+            "gas_price": data.get("gasPrice") or 0,
+            "gas_used": data.get("gasUsed") or 0,
+            "gas_used_for_L1": _to_int(data.get("gasUsedForL1") or 0),
+            "status": None if status is None else TransactionStatusEnum(_to_int(status)),
+            "txn_hash": f"0x{txn_hash.hex()}" if isinstance(txn_hash, bytes) else txn_hash,
+        }
+        receipt: ArbitrumReceipt
+        if lazy:
+            receipt = LazyArbitrumReceipt.model_construct(
+                **receipt_kwargs, transaction=None, logs=None
+            )
+            receipt._defer(
+                partial(self._create_trusted_transaction, data, default_type),
+                data.get("logs", []),
+                data_size=len(data.get("input") or data.get("data") or b""),
+            )
+        else:
+            receipt = ArbitrumReceipt.model_construct(
+                **receipt_kwargs,
+                logs=[dict(log) for log in data.get("logs", [])],
+                transaction=self._create_trusted_transaction(data, default_type),
+            )
+
+        if validation_sample_rate and random.random() < validation_sample_rate:
+            self._validate_trusted_receipt(receipt, data)
+
+        return receipt
+
+    def _create_trusted_transaction(self, data: dict, default_type: int) -> TransactionAPI:
+        version = data.get("type")
+        version = default_type if version is None else _to_int(version)
+        if (trusted_fields := self._trusted_transaction_fields.get(version)) is None:
+            # NOTE: Unknown types get the regular handling (and its error).
+            return self.create_transaction(**data)
+
+        txn_class, fields = trusted_fields
+        values: dict = {}
+        for key, value in data.items():
+            if (field := fields.get(key)) is not None:
+                name, converter = field
+                values[name] = value if converter is None or value is None else converter(value)
+
+        values["type"] = version
+        if issubclass(txn_class, StaticFeeTransaction):
+            # NOTE: Computed by a validator on the model.
+            values["max_fee"] = (values.get("gas_limit") or 0) * (values.get("gas_price") or 0)
+
+        if "v" in data and "r" in data and "s" in data:
+            values["signature"] = TransactionSignature(
+                v=_to_int(data["v"]), r=bytes(HexBytes(data["r"])), s=bytes(HexBytes(data["s"]))
+            )
+
+        txn = txn_class.model_construct(**values)
+        # NOTE: Set in `__init__()`, which construction skips.
+        txn.__dict__["_raise_on_revert"] = True
+        return txn
+
+    def _validate_trusted_receipt(self, receipt: ReceiptAPI, data: dict):
+        expected = self.decode_receipt(dict(data), trusted=False)
+        if (
+            receipt.model_dump() != expected.model_dump()
+            or receipt.transaction.signature != expected.transaction.signature
+        ):
+            raise ApeArbitrumError(
+                f"Receipt '{receipt.txn_hash}' decoded from trusted data "
+                "does not match its validated decode."
+            )
+
+    def _get_default_type(self, default_type: int | None = None) -> int:
+        # NOTE: Only resolve the default type, which reads the config, when not given.
+        return self.default_transaction_type.value if default_type is None else default_type
+
+    def _get_transaction_defaults(self) -> dict:
+        defaults: dict = {"required_confirmations": 0}
+        if provider := self.network_manager.active_provider:
+            defaults["required_confirmations"] = provider.network.required_confirmations
+            defaults["chainId"] = provider.chain_id
+
+        return defaults
+
+    @cached_property
+    def _fee_oracle_config(self) -> FeeOracleConfig:
+        # NOTE: Resolved once, as it is checked for every transaction created.
+        return self.config.fee_oracle
+
+    @cached_property
+    def _trusted_decode_config(self) -> TrustedDecodeConfig:
+        # NOTE: Resolved once, as reading the config is slow next to a trusted decode.
+        return self.config.trusted_decode
+
+    @cached_property
+    def _chain_states(self) -> dict[tuple[str, int], Any]:
+        return {}
 
-        # Alt found: use it.
-        new_data = {k: v for k, v in data.items() if k not in alt_keys}
-        new_data[key] = data[possible_key]
-        return new_data
+    def _get_chain_state(
+        self, name: str, create: Callable[[], _StateT], chain_id: int | None = None
+    ) -> _StateT:
+        # NOTE: The ecosystem is shared by all its networks, so state about
+        #   blocks is kept per chain, and switching networks doesn't mix it up.
+        key = (name, self.provider.chain_id if chain_id is None else chain_id)
+        if (state := self._chain_states.get(key)) is None:
+            state = self._chain_states.setdefault(key, create())
 
-    return data
+        return state
@@ -0,0 +1,455 @@
+import asyncio
+import base64
+import json
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+import rlp  # type: ignore[import-untyped]
+from ape.api.transactions import TransactionAPI
+from ape.logging import logger
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_account import Account
+from eth_account._utils.legacy_transactions import Transaction as LegacyTransaction
+from eth_account.typed_transactions import TypedTransaction
+from eth_pydantic_types import HexBytes
+from eth_utils import keccak, to_checksum_address
+from pydantic import BaseModel
+from websockets.asyncio.client import connect
+from websockets.exceptions import InvalidHandshake, WebSocketException
+
+from .constants import (
+    CONTRACT_TRANSACTION_TYPE,
+    DEPOSIT_TRANSACTION_TYPE,
+    GENESIS_BLOCKS,
+    INTERNAL_TRANSACTION_TYPE,
+    SUBMIT_RETRYABLE_TRANSACTION_TYPE,
+    UNSIGNED_TRANSACTION_TYPE,
+)
+from .ecosystem import ApeArbitrumError
+
+if TYPE_CHECKING:
+    from .ecosystem import Arbitrum
+
+FEED_URLS = {
+    42161: "wss://arb1.arbitrum.io/feed",
+    42170: "wss://nova.arbitrum.io/feed",
+    421614: "wss://sepolia-rollup.arbitrum.io/feed",
+}
+
+# NOTE: The request header used to resume the feed after a sequence number.
+REQUESTED_SEQUENCE_NUMBER_HEADER = "Arbitrum-Requested-Sequence-Number"
+
+# L1 message kinds (the message header's "kind").
+L1_MESSAGE_L2_MESSAGE = 3
+L1_MESSAGE_SUBMIT_RETRYABLE = 9
+L1_MESSAGE_ETH_DEPOSIT = 12
+
+# L2 message kinds (the first byte of an L2 message).
+L2_MESSAGE_UNSIGNED_USER_TX = 0
+L2_MESSAGE_CONTRACT_TX = 1
+L2_MESSAGE_BATCH = 3
+L2_MESSAGE_SIGNED_TX = 4
+
+# NOTE: The deepest nesting of L2 message batches nodes accept.
+MAX_L2_MESSAGE_BATCH_DEPTH = 16
+
+ARBOS_ADDRESS = "0x00000000000000000000000000000000000A4B05"
+START_BLOCK_SELECTOR = keccak(text="startBlock(uint256,uint64,uint64,uint64)")[:4]
+
+
+class FeedMessage(BaseModel):
+    """
+    A message from the sequencer feed. Each message becomes one L2 block.
+    """
+
+    sequence_number: int
+    block_number: int
+    kind: int
+    sender: str
+    l1_block_number: int
+    timestamp: int
+    request_id: HexBytes | None = None
+    l1_base_fee: int | None = None
+    transactions: list[TransactionAPI] = []
+    """The transactions of the block, starting with its internal (type 106) transaction."""
+
+
+class SequencerFeedDecoder:
+    """
+    Decodes sequencer feed broadcasts into :class:`FeedMessage` objects, with
+    transactions created by :meth:`~ape_arbitrum.ecosystem.Arbitrum.create_transaction`.
+    The internal ``startBlock`` transaction each block starts with is not in
+    the feed, so it is created like the node does.
+
+    Args:
+        ecosystem (:class:`~ape_arbitrum.ecosystem.Arbitrum`): The ecosystem.
+        chain_id (int): The chain ID of the feed.
+        genesis_block (int | None): The L2 block of sequence number ``0``.
+          Defaults to the known value of the chain, else ``0``.
+        recover_senders (bool): Set to ``False`` to skip recovering the senders
+          of signed transactions, which costs an ``ecrecover`` each.
+    """
+
+    def __init__(
+        self,
+        ecosystem: "Arbitrum",
+        chain_id: int,
+        genesis_block: int | None = None,
+        recover_senders: bool = True,
+    ):
+        self.ecosystem = ecosystem
+        self.chain_id = chain_id
+        self.genesis_block = (
+            GENESIS_BLOCKS.get(chain_id, 0) if genesis_block is None else genesis_block
+        )
+        self.recover_senders = recover_senders
+        self._last_timestamp: int | None = None
+
+    def decode(self, broadcast: str | bytes | dict) -> list[FeedMessage]:
+        """
+        Decode a feed broadcast.
+
+        Args:
+            broadcast (str | bytes | dict): The broadcast, as received.
+
+        Returns:
+            list[:class:`FeedMessage`]: The messages, which may be none.
+        """
+        data = broadcast if isinstance(broadcast, dict) else json.loads(broadcast)
+        return [self.decode_message(message) for message in data.get("messages") or []]
+
+    def decode_message(self, data: dict) -> FeedMessage:
+        """
+        Decode one message of a broadcast.
+
+        Args:
+            data (dict): The message, with its ``sequenceNumber``.
+
+        Returns:
+            :class:`FeedMessage`
+        """
+        l1_message = data["message"]["message"]
+        header = l1_message["header"]
+        request_id = header.get("requestId")
+        message = FeedMessage(
+            sequence_number=data["sequenceNumber"],
+            block_number=self.genesis_block + data["sequenceNumber"],
+            kind=header["kind"],
+            sender=to_checksum_address(header["sender"]),
+            l1_block_number=header["blockNumber"],
+            timestamp=header["timestamp"],
+            request_id=HexBytes(request_id) if request_id else None,
+            l1_base_fee=header.get("baseFeeL1"),
+        )
+        payload = base64.b64decode(l1_message.get("l2Msg") or "")
+        message.transactions = [self._create_start_block(message)]
+        if message.kind == L1_MESSAGE_L2_MESSAGE:
+            message.transactions.extend(self._decode_l2_message(message, payload))
+        elif message.kind == L1_MESSAGE_ETH_DEPOSIT:
+            message.transactions.append(self._decode_deposit(message, payload))
+        elif message.kind == L1_MESSAGE_SUBMIT_RETRYABLE:
+            message.transactions.append(self._decode_submit_retryable(message, payload))
+
+        self._last_timestamp = message.timestamp
+        return message
+
+    def _create_start_block(self, message: FeedMessage) -> TransactionAPI:
+        time_passed = message.timestamp - (self._last_timestamp or message.timestamp)
+        data = START_BLOCK_SELECTOR + b"".join(
+            value.to_bytes(32, "big")
+            for value in (
+                message.l1_base_fee or 0,
+                message.l1_block_number,
+                message.block_number,
+                max(time_passed, 0),
+            )
+        )
+        return self.ecosystem.create_transaction(
+            type=INTERNAL_TRANSACTION_TYPE,
+            chainId=self.chain_id,
+            sender=ARBOS_ADDRESS,
+            receiver=ARBOS_ADDRESS,
+            data=data,
+            gas_limit=0,
+            gas_price=0,
+            nonce=0,
+        )
+
+    def _decode_l2_message(
+        self, message: FeedMessage, payload: bytes, depth: int = 0
+    ) -> list[TransactionAPI]:
+        if not payload:
+            return []
+
+        kind, body = payload[0], payload[1:]
+        if kind == L2_MESSAGE_SIGNED_TX:
+            return [self._decode_signed_transaction(body)]
+
+        if kind == L2_MESSAGE_BATCH:
+            if depth >= MAX_L2_MESSAGE_BATCH_DEPTH:
+                raise ApeArbitrumError("L2 message batch is nested too deeply.")
+
+            transactions = []
+            for item in _split_batch(body):
+                transactions.extend(self._decode_l2_message(message, item, depth + 1))
+
+            return transactions
+
+        if kind in (L2_MESSAGE_UNSIGNED_USER_TX, L2_MESSAGE_CONTRACT_TX):
+            has_nonce = kind == L2_MESSAGE_UNSIGNED_USER_TX
+            words, data = _read_words(body, 5 if has_nonce else 4)
+            gas_limit, max_fee, *nonce, to, value = words
+            return [
+                self.ecosystem.create_transaction(
+                    type=UNSIGNED_TRANSACTION_TYPE if has_nonce else CONTRACT_TRANSACTION_TYPE,
+                    chainId=self.chain_id,
+                    sender=message.sender,
+                    receiver=_to_address(to),
+                    value=value,
+                    data=data,
+                    gas_limit=gas_limit,
+                    gas_price=max_fee,
+                    nonce=nonce[0] if nonce else 0,
+                    requestId=message.request_id,
+                )
+            ]
+
+        # NOTE: Other kinds, such as heartbeats, have no transactions.
+        return []
+
+    def _decode_signed_transaction(self, raw: bytes) -> TransactionAPI:
+        fields: dict[str, Any]
+        if raw and raw[0] < 0x7F:
+            fields = dict(TypedTransaction.from_bytes(HexBytes(raw)).as_dict())
+        else:
+            fields = rlp.decode(raw, LegacyTransaction).as_dict()
+            fields["type"] = 0
+
+        fields["r"] = fields["r"].to_bytes(32, "big")
+        fields["s"] = fields["s"].to_bytes(32, "big")
+        if fields.get("to"):
+            fields["to"] = to_checksum_address(fields["to"])
+        if "accessList" in fields:
+            fields["accessList"] = list(fields["accessList"])
+        if self.recover_senders:
+            fields["sender"] = Account.recover_transaction(raw)
+
+        fields.setdefault("chainId", self.chain_id)
+        return self.ecosystem.create_transaction(**fields)
+
+    def _decode_deposit(self, message: FeedMessage, payload: bytes) -> TransactionAPI:
+        return self.ecosystem.create_transaction(
+            type=DEPOSIT_TRANSACTION_TYPE,
+            chainId=self.chain_id,
+            sender=message.sender,
+            receiver=to_checksum_address(payload[:20]),
+            value=int.from_bytes(payload[20:52], "big"),
+            requestId=message.request_id,
+        )
+
+    def _decode_submit_retryable(self, message: FeedMessage, payload: bytes) -> TransactionAPI:
+        words, rest = _read_words(payload, 9)
+        (
+            retry_to,
+            retry_value,
+            deposit_value,
+            max_submission_fee,
+            refund_to,
+            beneficiary,
+            gas_limit,
+            max_fee,
+            data_length,
+        ) = words
+        return self.ecosystem.create_transaction(
+            type=SUBMIT_RETRYABLE_TRANSACTION_TYPE,
+            chainId=self.chain_id,
+            sender=message.sender,
+            requestId=message.request_id,
+            l1BaseFee=message.l1_base_fee or 0,
+            depositValue=deposit_value,
+            retryTo=_to_address(retry_to),
+            retryValue=retry_value,
+            retryData=rest[:data_length],
+            beneficiary=_to_address(beneficiary),
+            maxSubmissionFee=max_submission_fee,
+            refundTo=_to_address(refund_to),
+            gas_limit=gas_limit,
+            gas_price=max_fee,
+        )
+
+
+class SequencerFeed(ManagerAccessMixin):
+    """
+    Streams messages from the Arbitrum sequencer feed, so transactions can be
+    observed as soon as they are sequenced instead of when blocks are polled.
+
+    Received messages are buffered in a bounded queue. When the consumer falls
+    behind and the buffer is full, the feed stops reading from the connection
+    until there is room. After a disconnect, the feed reconnects with an
+    exponential backoff and resumes after the last received sequence number.
+
+    Usage example::
+
+        feed = SequencerFeed()
+        for message in feed:
+            for txn in message.transactions:
+                ...
+
+        # Or, in a coroutine:
+        async for message in feed.stream():
+            ...
+
+    Args:
+        url (str | None): The feed URL. Defaults to the public feed of the connected network.
+        chain_id (int | None): The chain ID of the feed. Defaults to the connected network's.
+        genesis_block (int | None): The L2 block of sequence number ``0``.
+        recover_senders (bool): Set to ``False`` to skip recovering the senders
+          of signed transactions.
+        buffer_size (int): The most received messages waiting for the consumer.
+        reconnect_delay (float): The seconds to wait before the first reconnect.
+        max_reconnect_delay (float): The longest wait between reconnects.
+        max_reconnects (int | None): The most consecutive failed connections
+          before raising. Defaults to reconnecting indefinitely.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        chain_id: int | None = None,
+        genesis_block: int | None = None,
+        recover_senders: bool = True,
+        buffer_size: int = 1024,
+        reconnect_delay: float = 1,
+        max_reconnect_delay: float = 30,
+        max_reconnects: int | None = None,
+    ):
+        self.chain_id = self.provider.chain_id if chain_id is None else chain_id
+        if url is None and (url := FEED_URLS.get(self.chain_id)) is None:
+            raise ApeArbitrumError(f"No known sequencer feed for chain '{self.chain_id}'.")
+
+        self.url = url
+        self.decoder = SequencerFeedDecoder(
+            self.network_manager.get_ecosystem("arbitrum"),  # type: ignore[arg-type]
+            self.chain_id,
+            genesis_block=genesis_block,
+            recover_senders=recover_senders,
+        )
+        self.buffer_size = buffer_size
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_reconnects = max_reconnects
+        self.sequence_number: int | None = None
+        """The last received sequence number."""
+
+    def __iter__(self) -> Iterator[FeedMessage]:
+        return self.messages()
+
+    def messages(self) -> Iterator[FeedMessage]:
+        """
+        Stream the messages in the calling thread. The connection is only read
+        while waiting for the next message.
+
+        Returns:
+            Iterator[:class:`FeedMessage`]
+        """
+        loop = asyncio.new_event_loop()
+        stream = self.stream()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(stream.aclose())
+            loop.close()
+
+    async def stream(self) -> AsyncGenerator[FeedMessage, None]:
+        """
+        Stream the messages.
+
+        Returns:
+            AsyncGenerator[:class:`FeedMessage`, None]
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.buffer_size)
+        reader = asyncio.create_task(self._read(queue))
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, BaseException):
+                    raise item
+
+                yield item
+        finally:
+            reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await reader
+
+    async def _read(self, queue: asyncio.Queue):
+        failures = 0
+        delay = self.reconnect_delay
+        try:
+            while True:
+                try:
+                    async with connect(
+                        self.url, additional_headers=self._get_headers(), max_size=None
+                    ) as connection:
+                        failures = 0
+                        delay = self.reconnect_delay
+                        async for broadcast in connection:
+                            for message in self.decoder.decode(broadcast):
+                                if (
+                                    self.sequence_number is not None
+                                    and message.sequence_number <= self.sequence_number
+                                ):
+                                    # NOTE: Skip messages repeated after resuming.
+                                    continue
+
+                                self.sequence_number = message.sequence_number
+
+                                # NOTE: Waits while the buffer is full, which stops reading.
+                                await queue.put(message)
+
+                except (OSError, TimeoutError, InvalidHandshake, WebSocketException) as err:
+                    failures += 1
+                    if self.max_reconnects is not None and failures > self.max_reconnects:
+                        raise ApeArbitrumError(
+                            f"Unable to connect to the sequencer feed: {err}"
+                        ) from err
+
+                    logger.debug(f"Sequencer feed disconnected: {err}")
+
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+        except Exception as err:
+            await queue.put(err)
+
+    def _get_headers(self) -> dict[str, str]:
+        if self.sequence_number is None:
+            return {}
+
+        return {REQUESTED_SEQUENCE_NUMBER_HEADER: str(self.sequence_number + 1)}
+
+
+def _split_batch(data: bytes) -> Iterator[bytes]:
+    # NOTE: Each item is prefixed by its length as a big-endian uint64.
+    index = 0
+    while index + 8 <= len(data):
+        length = int.from_bytes(data[index : index + 8], "big")
+        index += 8
+        yield data[index : index + length]
+        index += length
+
+
+def _read_words(data: bytes, count: int) -> tuple[list[int], bytes]:
+    if len(data) < count * 32:
+        raise ApeArbitrumError("Feed message is too short.")
+
+    words = [int.from_bytes(data[i * 32 : (i + 1) * 32], "big") for i in range(count)]
+    return words, data[count * 32 :]
+
+
+def _to_address(value: int) -> str:
+    return to_checksum_address(value.to_bytes(20, "big"))
@@ -0,0 +1,193 @@
+import math
+import time
+from collections import deque
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from ape.utils.basemodel import ManagerAccessMixin
+from pydantic import BaseModel
+
+from .precompiles import GasPrices, to_int
+
+if TYPE_CHECKING:
+    from .precompiles import ArbitrumPrecompiles
+
+# NOTE: The L1 calldata cost is charged in L2 gas, at the L2 base fee. Each byte
+#   of (compressed) calldata is priced by ArbGasInfo, plus a fixed per-transaction overhead.
+L1_FIXED_OVERHEAD_BYTES = 140
+
+
+class FeeSample(BaseModel):
+    """
+    The fees of one L2 block.
+    """
+
+    block_number: int
+    base_fee: int
+    """The L2 base fee, in wei per gas."""
+
+    l1_price_per_byte: int
+    """The cost of posting a byte of calldata to L1, in wei, from ``ArbGasInfo``."""
+
+
+class FeeEstimate(BaseModel):
+    """
+    Predicted fees for a transaction sent now.
+    """
+
+    max_fee: int
+    max_priority_fee: int
+    base_fee: int
+    """The latest L2 base fee."""
+
+    l1_price_per_byte: int
+    """The highest L1 calldata price in the window."""
+
+    block_number: int
+    """The latest block the prediction is based on."""
+
+
+class FeeOracle(ManagerAccessMixin):
+    """
+    Predicts the fees of Arbitrum transactions from a rolling window of recent blocks.
+
+    The L2 base fee sits at its floor unless the chain is congested, so ``max_fee``
+    only needs headroom above the window's peak (and its recent rise), rather than
+    a multiple of the base fee sized for Ethereum. The priority fee is ``0``, as the
+    sequencer orders transactions first-come, first-served. The variance is in the
+    L1 calldata price, which is charged as extra gas, so :meth:`predict_l1_gas`
+    sizes gas limits from the window's highest L1 price.
+
+    The window refreshes with a single batched request (the latest block and the
+    ``ArbGasInfo`` prices) at most once per ``refresh_interval``, however many
+    transactions are created, and blocks seen elsewhere can be added with
+    :meth:`add_block`.
+
+    Usage example::
+
+        oracle = networks.arbitrum.fee_oracle
+        estimate = oracle.get_fee_estimate()
+        txn = networks.arbitrum.create_transaction(max_fee=estimate.max_fee, ...)
+
+    Args:
+        precompiles (:class:`~ape_arbitrum.precompiles.ArbitrumPrecompiles`): The
+          precompile client.
+        window (int): The number of recent blocks to predict from.
+        multiplier (float): The headroom applied to the predicted base fee.
+        refresh_interval (float | None): The least number of seconds between
+          refreshes. Defaults to the network's block time.
+    """
+
+    def __init__(
+        self,
+        precompiles: "ArbitrumPrecompiles",
+        window: int = 20,
+        multiplier: float = 1.2,
+        refresh_interval: float | None = None,
+    ):
+        self.precompiles = precompiles
+        self.window = window
+        self.multiplier = multiplier
+        self.refresh_interval = refresh_interval
+        self.refreshes = 0
+        self._samples: deque[FeeSample] = deque(maxlen=window)
+        self._refreshed_at: float | None = None
+        self._lock = Lock()
+        self._refresh_lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def samples(self) -> list[FeeSample]:
+        """
+        The samples in the window, oldest first.
+        """
+        with self._lock:
+            return list(self._samples)
+
+    def add_block(self, block: dict, prices: GasPrices):
+        """
+        Add a block to the window. Blocks that are not newer than the
+        latest sample are ignored.
+
+        Args:
+            block (dict): The raw block header, with ``number`` and ``baseFeePerGas``.
+            prices (:class:`~ape_arbitrum.precompiles.GasPrices`): The prices at the block.
+        """
+        base_fee = block.get("baseFeePerGas", block.get("base_fee_per_gas")) or 0
+        sample = FeeSample(
+            block_number=to_int(block["number"]),
+            base_fee=to_int(base_fee),
+            l1_price_per_byte=prices.per_l1_calldata_byte,
+        )
+        with self._lock:
+            if not self._samples or sample.block_number > self._samples[-1].block_number:
+                self._samples.append(sample)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Add the latest block to the window, unless it has samples and was
+        refreshed within ``refresh_interval``.
+
+        Args:
+            force (bool): Set to ``True`` to refresh regardless of the interval.
+
+        Returns:
+            bool: ``True`` when a request was made.
+        """
+        interval = self.refresh_interval
+        if interval is None:
+            # NOTE: Providers are only active once connected, so this needs no request.
+            provider = self.network_manager.active_provider
+            interval = provider.network.block_time if provider is not None else 0
+
+        # NOTE: Concurrent callers wait for the refresh in flight, and then use its
+        #   window, rather than an empty one. A failed refresh is tried again.
+        with self._refresh_lock:
+            now = time.monotonic()
+            is_fresh = self._refreshed_at is not None and now - self._refreshed_at < interval
+            if not force and is_fresh and len(self):
+                return False
+
+            block, prices = self.precompiles.get_block_and_prices("latest")
+            self.add_block(block, prices)
+            self._refreshed_at = now
+            self.refreshes += 1
+            return True
+
+    def get_fee_estimate(self) -> FeeEstimate:
+        """
+        Predict the fees of a transaction sent now, refreshing the window if due.
+
+        Returns:
+            :class:`FeeEstimate`
+        """
+        self.refresh()
+        samples = self.samples
+        latest = samples[-1]
+        peak = max(sample.base_fee for sample in samples)
+        # NOTE: Under congestion, the base fee keeps rising for a while.
+        rise = max(latest.base_fee - samples[0].base_fee, 0)
+        return FeeEstimate(
+            max_fee=math.ceil(max(peak, latest.base_fee + rise) * self.multiplier),
+            max_priority_fee=0,
+            base_fee=latest.base_fee,
+            l1_price_per_byte=max(sample.l1_price_per_byte for sample in samples),
+            block_number=latest.block_number,
+        )
+
+    def predict_l1_gas(self, data_size: int) -> int:
+        """
+        Predict the gas charged for posting a transaction's calldata to L1,
+        using the highest L1 price in the window.
+
+        Args:
+            data_size (int): The size of the (signed) transaction, in bytes.
+
+        Returns:
+            int: The L1 component of the gas, to add to the L2 execution gas.
+        """
+        estimate = self.get_fee_estimate()
+        l1_cost = (data_size + L1_FIXED_OVERHEAD_BYTES) * estimate.l1_price_per_byte
+        return math.ceil(l1_cost / max(estimate.base_fee, 1))
@@ -0,0 +1,334 @@
+import time
+from bisect import bisect_right
+from collections.abc import Iterable
+from enum import IntEnum
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from ape.api.transactions import ReceiptAPI
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+
+from .ecosystem import ApeArbitrumError
+from .precompiles import batch_request, to_int
+
+if TYPE_CHECKING:
+    from .precompiles import ArbitrumPrecompiles
+
+# NOTE: Batches are posted every few minutes and L1 finality takes about 15 minutes.
+DEFAULT_POLL_INTERVAL = 30
+
+# NOTE: The number of seconds the L1 confirmations of a batch are re-used for (an L1 slot).
+DEFAULT_CONFIRMATIONS_TTL = 12
+
+
+class FinalityLevel(IntEnum):
+    """
+    How final an L2 block is, from least to most.
+    """
+
+    SEQUENCED = 0
+    """Included in a block by the sequencer, but not yet posted to L1."""
+
+    POSTED = 1
+    """Posted to L1 in a batch."""
+
+    SAFE = 2
+    """Posted in a batch that is in a safe L1 block."""
+
+    FINALIZED = 3
+    """Posted in a batch that is in a finalized L1 block."""
+
+
+class BatchIndex:
+    """
+    The known L2 block ranges of L1 batches. Batches post contiguous ranges of
+    blocks in order, so blocks between two blocks of the same batch are in that
+    batch too, and can be looked up without a request.
+    """
+
+    def __init__(self):
+        self._starts: list[int] = []
+        self._intervals: list[tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def get_batch(self, block_number: int) -> int | None:
+        """
+        Get the batch of a block, if it is within a known range.
+
+        Args:
+            block_number (int): The L2 block number.
+
+        Returns:
+            int | None: The batch number, or ``None`` if unknown.
+        """
+        index = bisect_right(self._starts, block_number) - 1
+        if index >= 0:
+            start, end, batch = self._intervals[index]
+            if start <= block_number <= end:
+                return batch
+
+        return None
+
+    def get_range(self, batch: int) -> tuple[int, int] | None:
+        """
+        Get the known L2 block range of a batch.
+
+        Args:
+            batch (int): The batch number.
+
+        Returns:
+            tuple[int, int] | None: The first and last known blocks of the batch.
+        """
+        for start, end, interval_batch in self._intervals:
+            if interval_batch == batch:
+                return start, end
+
+        return None
+
+    def add(self, block_number: int, batch: int):
+        """
+        Record the batch of a block, extending the batch's known range.
+
+        Args:
+            block_number (int): The L2 block number.
+            batch (int): The batch number.
+        """
+        index = bisect_right(self._starts, block_number) - 1
+        for neighbor in (index, index + 1):
+            if 0 <= neighbor < len(self._intervals):
+                start, end, interval_batch = self._intervals[neighbor]
+                if interval_batch == batch:
+                    self._set(neighbor, min(start, block_number), max(end, block_number), batch)
+                    return
+
+        self._starts.insert(index + 1, block_number)
+        self._intervals.insert(index + 1, (block_number, block_number, batch))
+
+    def _set(self, index: int, start: int, end: int, batch: int):
+        self._starts[index] = start
+        self._intervals[index] = (start, end, batch)
+
+
+class FinalityTracker(ManagerAccessMixin):
+    """
+    Tracks the L1 finality of L2 blocks. ``required_confirmations`` only
+    counts L2 blocks, which the sequencer can produce before anything is
+    posted to L1.
+
+    The L1 batch of each block comes from ``NodeInterface.findBatchContainingBlock``.
+    Found batches are kept in a :class:`BatchIndex`, and the blocks between known
+    ones are found by bisection, so many lookups share a few batched requests.
+    The safe and finalized levels come from the node's ``safe`` and ``finalized``
+    blocks, which follow the L1 blocks the batches were posted in.
+
+    Usage example::
+
+        finality = networks.arbitrum.finality
+        finality.wait(receipts, level=FinalityLevel.FINALIZED)
+
+    Args:
+        precompiles (:class:`~ape_arbitrum.precompiles.ArbitrumPrecompiles`): The
+          precompile client.
+        confirmations_ttl (float): The number of seconds the L1 confirmations
+          of a batch are re-used for.
+    """
+
+    def __init__(
+        self,
+        precompiles: "ArbitrumPrecompiles",
+        confirmations_ttl: float = DEFAULT_CONFIRMATIONS_TTL,
+    ):
+        self.precompiles = precompiles
+        self.confirmations_ttl = confirmations_ttl
+        self.index = BatchIndex()
+        self._confirmations: dict[int, tuple[int, float]] = {}
+        self._lock = Lock()
+
+    def find_batch(self, block_number: int) -> int | None:
+        """
+        Find the L1 batch that posted an L2 block.
+
+        Args:
+            block_number (int): The L2 block number.
+
+        Returns:
+            int | None: The batch number, or ``None`` if not yet posted.
+        """
+        return self.find_batches([block_number])[block_number]
+
+    def find_batches(self, block_numbers: Iterable[int]) -> dict[int, int | None]:
+        """
+        Find the L1 batches that posted many L2 blocks. Blocks within known
+        batch ranges need no requests, and the rest take one batched request
+        per round of bisection.
+
+        Args:
+            block_numbers (Iterable[int]): The L2 block numbers.
+
+        Returns:
+            dict[int, int | None]: The batch number of each block, or ``None``
+            if not yet posted.
+        """
+        batches: dict[int, int | None] = {}
+        unknown = []
+        with self._lock:
+            for block_number in sorted(set(block_numbers)):
+                if (batch := self.index.get_batch(block_number)) is None:
+                    unknown.append(block_number)
+                else:
+                    batches[block_number] = batch
+
+        # NOTE: Blocks are posted in order, so when both ends of a run of blocks are in
+        #   the same batch (or both not yet posted), so is everything in between.
+        runs = [unknown] if unknown else []
+        while runs:
+            ends = sorted({n for run in runs for n in (run[0], run[-1])} - batches.keys())
+            for block_number, batch in zip(
+                ends, self.precompiles.find_batches_containing_blocks(ends), strict=True
+            ):
+                batches[block_number] = batch
+
+            next_runs: list[list[int]] = []
+            for run in runs:
+                first, last = batches[run[0]], batches[run[-1]]
+                if first == last:
+                    batches.update(dict.fromkeys(run[1:-1], first))
+                elif len(run) > 2:
+                    middle = len(run) // 2
+                    next_runs.extend((run[: middle + 1], run[middle:]))
+
+            runs = next_runs
+
+        with self._lock:
+            for block_number in unknown:
+                if (batch := batches[block_number]) is not None:
+                    self.index.add(block_number, batch)
+
+        return batches
+
+    def get_l1_confirmations(self, block_numbers: Iterable[int]) -> dict[int, int]:
+        """
+        Get the number of L1 blocks confirming the batches that posted many L2 blocks.
+        Blocks in the same batch share one request.
+
+        Args:
+            block_numbers (Iterable[int]): The L2 block numbers.
+
+        Returns:
+            dict[int, int]: The L1 confirmations of each block, ``0`` if not yet posted.
+        """
+        batches = self.find_batches(block_numbers)
+        now = time.monotonic()
+        stale: dict[int, int] = {}
+        with self._lock:
+            for batch in {batch for batch in batches.values() if batch is not None}:
+                cached = self._confirmations.get(batch)
+                stale_batch = cached is None or now - cached[1] >= self.confirmations_ttl
+                if stale_batch and (block_range := self.index.get_range(batch)) is not None:
+                    stale[batch] = block_range[0]
+
+        # NOTE: Confirmations are per batch, so ask about any one block of each.
+        requests = [("eth_getBlockByNumber", [hex(n), False]) for n in stale.values()]
+        blocks = batch_request(self.provider, requests)
+        hashes = [HexBytes(block["hash"]) for block in blocks]
+        confirmations = self.precompiles.get_l1_confirmations(hashes) if hashes else []
+        with self._lock:
+            for batch, count in zip(stale, confirmations, strict=True):
+                self._confirmations[batch] = (count, now)
+
+            return {
+                block_number: 0 if batch is None else self._confirmations[batch][0]
+                for block_number, batch in batches.items()
+            }
+
+    def get_finality(self, block_number: int) -> FinalityLevel:
+        """
+        Get the finality of an L2 block.
+
+        Args:
+            block_number (int): The L2 block number.
+
+        Returns:
+            :class:`FinalityLevel`
+        """
+        return self.get_finalities([block_number])[block_number]
+
+    def get_finalities(self, block_numbers: Iterable[int]) -> dict[int, FinalityLevel]:
+        """
+        Get the finality of many L2 blocks. The safe and finalized blocks are
+        requested once, and batches are only looked up for the newer blocks.
+
+        Args:
+            block_numbers (Iterable[int]): The L2 block numbers.
+
+        Returns:
+            dict[int, :class:`FinalityLevel`]
+        """
+        block_numbers = set(block_numbers)
+        safe, finalized = (
+            to_int(block["number"])
+            for block in batch_request(
+                self.provider,
+                [
+                    ("eth_getBlockByNumber", ["safe", False]),
+                    ("eth_getBlockByNumber", ["finalized", False]),
+                ],
+            )
+        )
+        levels = {}
+        for block_number in block_numbers:
+            if block_number <= finalized:
+                levels[block_number] = FinalityLevel.FINALIZED
+            elif block_number <= safe:
+                levels[block_number] = FinalityLevel.SAFE
+
+        batches = self.find_batches(block_numbers - levels.keys())
+        for block_number, batch in batches.items():
+            levels[block_number] = (
+                FinalityLevel.SEQUENCED if batch is None else FinalityLevel.POSTED
+            )
+
+        return levels
+
+    def wait(
+        self,
+        blocks: Iterable[int | ReceiptAPI],
+        level: FinalityLevel = FinalityLevel.FINALIZED,
+        timeout: float | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> dict[int, FinalityLevel]:
+        """
+        Wait for many L2 blocks, or the blocks of receipts, to reach a finality level.
+        All the blocks are checked together once per poll.
+
+        Args:
+            blocks (Iterable[int | :class:`~ape.api.transactions.ReceiptAPI`]): The
+              L2 block numbers or receipts.
+            level (:class:`FinalityLevel`): The level to wait for. Defaults to ``FINALIZED``.
+            timeout (float | None): The number of seconds to wait. Defaults to no limit.
+            poll_interval (float): The number of seconds between checks.
+
+        Returns:
+            dict[int, :class:`FinalityLevel`]: The finality of each block.
+        """
+        block_numbers = {
+            block.block_number if isinstance(block, ReceiptAPI) else block for block in blocks
+        }
+        deadline = None if timeout is None else time.monotonic() + timeout
+        levels: dict[int, FinalityLevel] = {}
+        pending = block_numbers
+        while True:
+            levels.update(self.get_finalities(pending))
+            pending = {n for n in pending if levels[n] < level}
+            if not pending:
+                return levels
+
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise ApeArbitrumError(
+                    f"Timed out waiting for {len(pending)} block(s) to be {level.name.lower()}."
+                )
+
+            time.sleep(poll_interval)
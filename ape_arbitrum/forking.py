@@ -0,0 +1,437 @@
+import json
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ape.exceptions import ApeException
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+from eth_utils import to_hex
+
+from .precompiles import batch_request, to_int
+
+if TYPE_CHECKING:
+    from ape.api.providers import ProviderAPI
+
+# NOTE: The state requests a forked node makes upstream, by the index of their block parameter.
+STATE_METHODS = {
+    "eth_getBalance": 1,
+    "eth_getTransactionCount": 1,
+    "eth_getCode": 1,
+    "eth_getStorageAt": 2,
+}
+
+# NOTE: ArbOS precompiles (ArbSys, ArbGasInfo, NodeInterface, etc.) are implemented natively
+#   by the node rather than by code and storage, so there is no state worth pre-warming.
+PRECOMPILE_ADDRESSES = frozenset(
+    f"0x{number:040x}" for number in (*range(0x64, 0x73), 0xC8, 0xC9, 0xFF)
+)
+
+
+class ForkStateCache(ManagerAccessMixin):
+    """
+    A disk cache of the account balances, nonces, code and storage slots that
+    a ``*-fork`` network reads from its upstream network at the fork block.
+    State at a fixed block never changes, so each value is only requested
+    upstream once and is shared by every later session forking the same block.
+
+    Usage example::
+
+        upstream = networks.arbitrum.mainnet.get_provider("node")
+        cache = ForkStateCache(upstream, fork_block=250_000_000)
+        cache.prewarm({token.address: [0, 1, 2], router.address: []})
+
+        # Point the fork's upstream URL at the cache.
+        with cache.serve() as server:
+            ...  # e.g. anvil --fork-url {server.uri}
+
+    Args:
+        upstream (:class:`~ape.api.providers.ProviderAPI`): The connected provider
+          of the network being forked.
+        fork_block (int): The block the network is forked at.
+        path (Path | None): The cache directory. Defaults to a folder in the ape data folder.
+        chain_id (int | None): The upstream chain ID. Defaults to requesting it from upstream.
+        max_workers (int): The number of contracts pre-warmed at once.
+    """
+
+    def __init__(
+        self,
+        upstream: "ProviderAPI",
+        fork_block: int,
+        path: Path | None = None,
+        chain_id: int | None = None,
+        max_workers: int = 8,
+    ):
+        self.upstream = upstream
+        self.fork_block = fork_block
+        self.chain_id = upstream.chain_id if chain_id is None else chain_id
+        self.max_workers = max_workers
+        base_path = self.config_manager.DATA_FOLDER / "arbitrum" / "fork_cache"
+        self.path = Path(path) if path is not None else base_path
+        self.hits = 0
+        self.misses = 0
+        self._accounts: dict[str, dict] = {}
+        self._account_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """
+        The folder for the chain and fork block, with a file per account
+        and a log of its storage slots.
+        """
+        return self.path / str(self.chain_id) / str(self.fork_block)
+
+    def get_balance(self, address: str) -> int:
+        """
+        Get the balance of an account at the fork block.
+
+        Args:
+            address (str): The account.
+
+        Returns:
+            int
+        """
+        return self._get_account(address)["balance"]
+
+    def get_nonce(self, address: str) -> int:
+        """
+        Get the nonce of an account at the fork block.
+
+        Args:
+            address (str): The account.
+
+        Returns:
+            int
+        """
+        return self._get_account(address)["nonce"]
+
+    def get_code(self, address: str) -> HexBytes:
+        """
+        Get the code of a contract at the fork block.
+
+        Args:
+            address (str): The contract.
+
+        Returns:
+            HexBytes
+        """
+        return HexBytes(self._get_account(address)["code"])
+
+    def get_storage(self, address: str, slot: int) -> HexBytes:
+        """
+        Get a storage slot of a contract at the fork block.
+
+        Args:
+            address (str): The contract.
+            slot (int): The storage slot.
+
+        Returns:
+            HexBytes
+        """
+        key = to_hex(slot)
+        account = self._load(address)
+        if account is not None and key in account["storage"]:
+            self.hits += 1
+            return HexBytes(account["storage"][key])
+
+        self.misses += 1
+        (value,) = self._request([self._create_request("eth_getStorageAt", address, key)])
+        account = self._save(address, storage={key: _to_data(value)})
+        return HexBytes(account["storage"][key])
+
+    def prewarm(self, contracts: Iterable[str] | Mapping[str, Iterable[int]]):
+        """
+        Fetch and store the state of many contracts in parallel, each in a
+        single batch. Contracts already in the cache are only requested for
+        their missing storage slots.
+
+        Args:
+            contracts (Iterable[str] | Mapping[str, Iterable[int]]): The contracts,
+              or a mapping of the contracts to the storage slots to fetch.
+        """
+        slots_by_address = (
+            {address: list(slots) for address, slots in contracts.items()}
+            if isinstance(contracts, Mapping)
+            else dict.fromkeys(contracts, [])
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(self._prewarm, address, slots)
+                for address, slots in slots_by_address.items()
+                if address.lower() not in PRECOMPILE_ADDRESSES
+            ]
+            for future in futures:
+                future.result()
+
+    def make_request(self, method: str, params: list) -> Any:
+        """
+        Serve a JSON-RPC request. State requests at the fork block use the cache
+        and everything else is forwarded upstream.
+
+        Args:
+            method (str): The RPC method.
+            params (list): The RPC parameters.
+
+        Returns:
+            Any: The raw RPC result.
+        """
+        if method == "eth_chainId":
+            return to_hex(self.chain_id)
+
+        block_index = STATE_METHODS.get(method)
+        if block_index is None or not self._is_fork_block(params, block_index):
+            return self.upstream.make_request(method, params)
+
+        address = params[0]
+        if method == "eth_getBalance":
+            return to_hex(self.get_balance(address))
+        if method == "eth_getTransactionCount":
+            return to_hex(self.get_nonce(address))
+        if method == "eth_getCode":
+            return self.get_code(address).to_0x_hex()
+
+        return self.get_storage(address, to_int(params[1])).to_0x_hex()
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> "ForkCacheServer":
+        """
+        Serve the cache as a JSON-RPC endpoint, to use as a forked node's upstream URL.
+
+        Args:
+            host (str): The host to listen on. Defaults to ``"127.0.0.1"``.
+            port (int): The port to listen on. Defaults to a free port.
+
+        Returns:
+            :class:`~ape_arbitrum.forking.ForkCacheServer`: The running server.
+        """
+        server = ForkCacheServer(self, host=host, port=port)
+        server.start()
+        return server
+
+    def _prewarm(self, address: str, slots: list[int]):
+        account = self._load(address)
+        is_cached = account is not None and _is_complete(account)
+        requests = []
+        if not is_cached:
+            requests = [
+                self._create_request(method, address)
+                for method in ("eth_getBalance", "eth_getTransactionCount", "eth_getCode")
+            ]
+
+        stored_slots = account["storage"] if account else {}
+        keys = [key for key in map(to_hex, slots) if key not in stored_slots]
+        requests.extend(self._create_request("eth_getStorageAt", address, key) for key in keys)
+        if not requests:
+            return
+
+        results = self._request(requests)
+        fields = {}
+        if not is_cached:
+            balance, nonce, code, *results = results
+            fields = {"balance": to_int(balance), "nonce": to_int(nonce), "code": _to_data(code)}
+
+        # NOTE: Save the account and all its slots at once, rather than a write per slot.
+        self._save(
+            address,
+            storage={key: _to_data(value) for key, value in zip(keys, results, strict=True)},
+            **fields,
+        )
+
+    def _get_account(self, address: str) -> dict:
+        if (account := self._load(address)) is not None and _is_complete(account):
+            self.hits += 1
+            return account
+
+        self.misses += 1
+        balance, nonce, code = self._request(
+            [
+                self._create_request(method, address)
+                for method in ("eth_getBalance", "eth_getTransactionCount", "eth_getCode")
+            ]
+        )
+        return self._save(
+            address, balance=to_int(balance), nonce=to_int(nonce), code=_to_data(code)
+        )
+
+    def _load(self, address: str) -> dict | None:
+        key = address.lower()
+        with self._get_lock(key):
+            if key in self._accounts:
+                return self._accounts[key]
+
+            file = self.directory / f"{key}.json"
+            slots_file = file.with_suffix(".slots")
+            if not file.is_file() and not slots_file.is_file():
+                return None
+
+            account: dict = json.loads(file.read_text()) if file.is_file() else {}
+            account["storage"] = _read_slots(slots_file)
+            self._accounts[key] = account
+            return account
+
+    def _save(self, address: str, storage: dict | None = None, **fields) -> dict:
+        key = address.lower()
+        with self._get_lock(key):
+            account = self._accounts.setdefault(key, {"storage": {}})
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file = self.directory / f"{key}.json"
+            if fields:
+                account.update(fields)
+                data = {name: value for name, value in account.items() if name != "storage"}
+
+                # NOTE: Write a temporary file and rename it, so readers never see a partial file.
+                temp_file = file.with_suffix(f".{threading.get_ident()}.tmp")
+                temp_file.write_text(json.dumps(data))
+                temp_file.replace(file)
+
+            if storage:
+                # NOTE: Slots are appended to a log, so storing a slot doesn't rewrite the others.
+                account["storage"].update(storage)
+                with file.with_suffix(".slots").open("a") as slots_file:
+                    slots_file.write(f"{json.dumps(storage)}\n")
+
+            return account
+
+    def _get_lock(self, key: str) -> threading.Lock:
+        # NOTE: Only finding the account's lock is global, so accounts are read and written
+        #   in parallel.
+        with self._lock:
+            return self._account_locks.setdefault(key, threading.Lock())
+
+    def _create_request(self, method: str, address: str, *args: str) -> tuple[str, list]:
+        return method, [address, *args, to_hex(self.fork_block)]
+
+    def _request(self, requests: list[tuple[str, list]]) -> list[Any]:
+        return batch_request(self.upstream, requests)
+
+    def _is_fork_block(self, params: list, block_index: int) -> bool:
+        if len(params) <= block_index:
+            return False
+
+        block = params[block_index]
+        if isinstance(block, dict):
+            block = block.get("blockNumber")
+
+        try:
+            return to_int(block) == self.fork_block
+        except (TypeError, ValueError):
+            # NOTE: Block tags, such as "latest", are forwarded.
+            return False
+
+
+class ForkCacheServer:
+    """
+    A local JSON-RPC endpoint in front of a :class:`~ape_arbitrum.forking.ForkStateCache`.
+    Supports single and batch requests.
+
+    Args:
+        cache (:class:`~ape_arbitrum.forking.ForkStateCache`): The cache to serve.
+        host (str): The host to listen on.
+        port (int): The port to listen on, or ``0`` for a free port.
+    """
+
+    def __init__(self, cache: ForkStateCache, host: str = "127.0.0.1", port: int = 0):
+        self.cache = cache
+        self.host = host
+        self._server = ThreadingHTTPServer((host, port), _create_handler(cache))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def uri(self) -> str:
+        """
+        The URL to use as the upstream of a forked node.
+        """
+        return f"http://{self.host}:{self._server.server_port}"
+
+    def start(self):
+        """
+        Start serving requests in a background thread.
+        """
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop serving requests.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _create_handler(cache: ForkStateCache) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if isinstance(body, list):
+                response: Any = [self._respond(request) for request in body]
+            else:
+                response = self._respond(body)
+
+            data = json.dumps(response).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            # NOTE: Don't print a line per request.
+            pass
+
+        def _respond(self, request: dict) -> dict:
+            response = {"jsonrpc": "2.0", "id": request.get("id")}
+            try:
+                result = cache.make_request(request["method"], request.get("params", []))
+            except ApeException as err:
+                return {**response, "error": {"code": -32000, "message": str(err)}}
+
+            return {**response, "result": _to_json(result)}
+
+    return Handler
+
+
+def _is_complete(account: dict) -> bool:
+    # NOTE: Accounts may only have storage slots cached, without the account fields.
+    return "code" in account
+
+
+def _to_data(value: Any) -> str:
+    return HexBytes(value).to_0x_hex()
+
+
+def _read_slots(file: Path) -> dict:
+    storage: dict = {}
+    if not file.is_file():
+        return storage
+
+    for line in file.read_text().splitlines():
+        try:
+            storage.update(json.loads(line))
+        except ValueError:
+            # NOTE: A session may have stopped part-way through appending a line.
+            continue
+
+    return storage
+
+
+def _to_json(value: Any) -> Any:
+    # NOTE: Cached quantities are already hex strings and forwarded results are raw JSON,
+    #   where numbers (e.g. ``structLogs`` gas and depth) are meant to stay numbers.
+    #   Only bytes, which JSON can't represent, are encoded.
+    if isinstance(value, bytes):
+        return HexBytes(value).to_0x_hex()
+    if isinstance(value, Mapping):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_to_json(item) for item in value]
+
+    return value
@@ -0,0 +1,101 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+
+from ape.api.transactions import TransactionAPI
+
+GasEstimateKey = tuple[str | None, bytes, int, int]
+
+
+class GasEstimateCache:
+    """
+    A bounded cache of gas estimates for repeated transactions. Estimates are
+    keyed by the receiver, the method selector, the calldata length (rounded
+    to a bucket) and the current time bucket. Arbitrum gas estimates include
+    the L1 calldata component, which moves with the L1 base fee, so estimates
+    are only re-used within a bucket of ``ttl`` seconds of wall-clock time.
+    Buckets do not follow L1 price changes: an estimate can be re-used after the
+    L1 price moves within a bucket, which the ``multiplier`` should cover.
+
+    Args:
+        ttl (float): The length of a time bucket, in seconds.
+        size (int): The maximum number of estimates to keep.
+        multiplier (float): A safety multiplier applied to cached estimates.
+        calldata_bucket_size (int): The calldata length (in bytes) of each bucket.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        size: int = 1024,
+        multiplier: float = 1.1,
+        calldata_bucket_size: int = 32,
+    ):
+        self.ttl = ttl
+        self.size = size
+        self.multiplier = multiplier
+        self.calldata_bucket_size = calldata_bucket_size
+        self.hits = 0
+        self.misses = 0
+        self._estimates: OrderedDict[GasEstimateKey, int] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._estimates)
+
+    def get_key(self, txn: TransactionAPI) -> GasEstimateKey:
+        """
+        Get the cache key for the given transaction.
+
+        Args:
+            txn (:class:`~ape.api.transactions.TransactionAPI`): The transaction.
+
+        Returns:
+            tuple: The receiver, selector, calldata bucket and time bucket.
+        """
+        data = bytes(txn.data)
+        return (
+            txn.receiver,
+            data[:4],
+            len(data) // self.calldata_bucket_size,
+            int(time.time() // self.ttl),
+        )
+
+    def get_gas_limit(self, txn: TransactionAPI, estimate: Callable[[TransactionAPI], int]) -> int:
+        """
+        Get a gas limit for the given transaction, only calling ``estimate``
+        when there is no estimate for a similar transaction in this time bucket.
+
+        Args:
+            txn (:class:`~ape.api.transactions.TransactionAPI`): The transaction.
+            estimate (Callable): Estimates the gas of a transaction on a cache miss,
+              such as ``provider.estimate_gas_cost``.
+
+        Returns:
+            int: The estimate with the safety multiplier applied.
+        """
+        key = self.get_key(txn)
+        with self._lock:
+            gas = self._estimates.get(key)
+            if gas is not None:
+                self._estimates.move_to_end(key)
+                self.hits += 1
+
+        if gas is None:
+            gas = estimate(txn)
+            with self._lock:
+                self.misses += 1
+                self._estimates[key] = gas
+                self._estimates.move_to_end(key)
+                while len(self._estimates) > self.size:
+                    self._estimates.popitem(last=False)
+
+        return int(gas * self.multiplier)
+
+    def clear(self):
+        """
+        Remove all cached estimates.
+        """
+        with self._lock:
+            self._estimates.clear()
@@ -0,0 +1,269 @@
+import sys
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from ape.utils.basemodel import ManagerAccessMixin
+from web3.middleware import Web3Middleware
+
+# NOTE: The upper bounds (in seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class Histogram:
+    """
+    The calls of one instrumented entry point or RPC method.
+    """
+
+    __slots__ = ("allocated_blocks", "bucket_counts", "count", "errors", "sum")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.sum = 0.0
+        self.allocated_blocks = 0
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean latency, in seconds.
+        """
+        return self.sum / self.count if self.count else 0.0
+
+    def observe(self, elapsed: float, allocated_blocks: int = 0, failed: bool = False):
+        """
+        Record a call.
+
+        Args:
+            elapsed (float): The latency, in seconds.
+            allocated_blocks (int): The change in the number of allocated memory blocks.
+            failed (bool): Whether the call raised.
+        """
+        self.count += 1
+        self.errors += failed
+        self.sum += elapsed
+        self.allocated_blocks += allocated_blocks
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile from the histogram buckets.
+
+        Args:
+            q (float): The quantile, between ``0`` and ``1``.
+
+        Returns:
+            float: The upper bound of the bucket containing the quantile, in seconds.
+        """
+        rank = q * self.count
+        total = 0
+        for bound, count in zip((*LATENCY_BUCKETS, float("inf")), self.bucket_counts, strict=True):
+            total += count
+            if total >= rank and total:
+                return bound
+
+        return 0.0
+
+
+class Instrumentation(ManagerAccessMixin):
+    """
+    Records call counts, latency histograms and allocation counts for the hot
+    paths of the plugin, such as ``create_transaction``, ``decode_receipt`` and
+    confirmation polling, along with the RPC requests they make.
+
+    Instrumentation is off unless ``instrumentation.enabled`` is configured or
+    :attr:`enabled` is set, and instrumented functions only check a flag when off.
+    Allocation counts are the net change in CPython's allocated memory blocks
+    during the call, so they include allocations made by other threads.
+
+    Usage example::
+
+        from ape_arbitrum.instrumentation import instrumentation
+
+        instrumentation.enabled = True
+        ...
+        print(instrumentation.calls["create_transaction"].mean)
+        print(instrumentation.to_prometheus())
+    """
+
+    def __init__(self):
+        self.calls: dict[str, Histogram] = {}
+        self.rpc: dict[str, Histogram] = {}
+        self._enabled: bool | None = None
+        self._lock = threading.Lock()
+        self._instrumented_web3: weakref.WeakSet = weakref.WeakSet()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether calls are recorded. Defaults to the ``instrumentation.enabled`` config.
+        Set to ``None`` to use the config again.
+        """
+        if self._enabled is None:
+            config = self.config_manager.get_config("arbitrum")
+            self._enabled = bool(config.instrumentation.enabled)
+
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool | None):
+        self._enabled = value
+
+    def instrument(self, name: str) -> Callable[[_F], _F]:
+        """
+        Create a decorator recording the calls of a function.
+
+        Args:
+            name (str): The name to record the calls under.
+
+        Returns:
+            Callable: The decorator.
+        """
+
+        def decorator(fn: _F) -> _F:
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                # NOTE: Only check a flag when disabled, so the overhead is negligible.
+                enabled = self._enabled
+                if enabled is None:
+                    enabled = self.enabled
+                if not enabled:
+                    return fn(*args, **kwargs)
+
+                self._instrument_provider()
+                blocks = sys.getallocatedblocks()
+                start = time.perf_counter()
+                failed = True
+                try:
+                    result = fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    elapsed = time.perf_counter() - start
+                    self.observe(name, elapsed, sys.getallocatedblocks() - blocks, failed=failed)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def observe(self, name: str, elapsed: float, allocated_blocks: int = 0, failed: bool = False):
+        """
+        Record a call of an entry point.
+
+        Args:
+            name (str): The entry point.
+            elapsed (float): The latency, in seconds.
+            allocated_blocks (int): The change in the number of allocated memory blocks.
+            failed (bool): Whether the call raised.
+        """
+        with self._lock:
+            histogram = self.calls.get(name) or self.calls.setdefault(name, Histogram())
+            histogram.observe(elapsed, allocated_blocks, failed=failed)
+
+    def observe_rpc(self, method: str, elapsed: float, failed: bool = False):
+        """
+        Record an RPC request.
+
+        Args:
+            method (str): The RPC method.
+            elapsed (float): The latency, in seconds.
+            failed (bool): Whether the request raised.
+        """
+        with self._lock:
+            histogram = self.rpc.get(method) or self.rpc.setdefault(method, Histogram())
+            histogram.observe(elapsed, failed=failed)
+
+    def reset(self):
+        """
+        Clear all the recorded calls.
+        """
+        with self._lock:
+            self.calls.clear()
+            self.rpc.clear()
+
+    def to_prometheus(self, prefix: str = "ape_arbitrum") -> str:
+        """
+        Dump the recorded calls in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix of the metric names. Defaults to ``"ape_arbitrum"``.
+
+        Returns:
+            str
+        """
+        with self._lock:
+            lines = [
+                *_format_histograms(f"{prefix}_call_seconds", "name", self.calls),
+                *_format_histograms(f"{prefix}_rpc_seconds", "method", self.rpc),
+            ]
+            lines.append(f"# TYPE {prefix}_call_errors_total counter")
+            lines.extend(
+                f'{prefix}_call_errors_total{{name="{name}"}} {histogram.errors}'
+                for name, histogram in self.calls.items()
+            )
+            # NOTE: A gauge, as the net number of allocated blocks can decrease.
+            lines.append(f"# TYPE {prefix}_call_allocated_blocks gauge")
+            lines.extend(
+                f'{prefix}_call_allocated_blocks{{name="{name}"}} {histogram.allocated_blocks}'
+                for name, histogram in self.calls.items()
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _instrument_provider(self):
+        # NOTE: Time the RPC requests of the connected provider, through a web3 middleware.
+        provider = self.network_manager.active_provider
+        if (web3 := getattr(provider, "web3", None)) is None or web3 in self._instrumented_web3:
+            return
+
+        with self._lock:
+            if web3 not in self._instrumented_web3:
+                web3.middleware_onion.add(_create_middleware(self), name="ape_arbitrum_metrics")
+                self._instrumented_web3.add(web3)
+
+
+instrumentation = Instrumentation()
+"""The instrumentation of the plugin."""
+
+
+def _create_middleware(metrics: Instrumentation) -> type[Web3Middleware]:
+    class InstrumentationMiddleware(Web3Middleware):
+        def wrap_make_request(self, make_request):
+            def middleware(method, params):
+                if not metrics.enabled:
+                    return make_request(method, params)
+
+                start = time.perf_counter()
+                failed = True
+                try:
+                    response = make_request(method, params)
+                    failed = False
+                    return response
+                finally:
+                    metrics.observe_rpc(method, time.perf_counter() - start, failed=failed)
+
+            return middleware
+
+    return InstrumentationMiddleware
+
+
+def _format_histograms(metric: str, label: str, histograms: dict[str, Histogram]) -> list[str]:
+    lines = [f"# TYPE {metric} histogram"]
+    for name, histogram in histograms.items():
+        cumulative = 0
+        bounds = (*map(str, LATENCY_BUCKETS), "+Inf")
+        for bound, count in zip(bounds, histogram.bucket_counts, strict=True):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound}"}} {cumulative}')
+
+        lines.append(f'{metric}_sum{{{label}="{name}"}} {histogram.sum}')
+        lines.append(f'{metric}_count{{{label}="{name}"}} {histogram.count}')
+
+    return lines
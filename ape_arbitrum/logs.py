@@ -0,0 +1,204 @@
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ape.exceptions import ProviderError
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_utils import encode_hex, keccak, to_hex
+from ethpm_types import EventABI
+from requests.exceptions import HTTPError, RequestException, Timeout
+
+from .ecosystem import ApeArbitrumError
+
+# NOTE: Error messages nodes and RPC services use when a log query is too large.
+RESPONSE_SIZE_ERRORS = (
+    "query returned more than",
+    "response size exceeded",
+    "block range too large",
+    "exceed maximum block range",
+    "query exceeds max results",
+)
+
+# NOTE: Error messages of rate limits and timeouts, which are retried with the same window.
+#   Only full phrases, as messages of other errors can contain block numbers and the like.
+TRANSIENT_ERRORS = (
+    "too many requests",
+    "rate limit",
+    "request timed out",
+    "timeout exceeded",
+)
+
+# NOTE: HTTP statuses of rate limits, which ape raises as-is rather than as a `ProviderError`.
+RATE_LIMIT_STATUS_CODES = frozenset((429,))
+
+
+class LogScanner(ManagerAccessMixin):
+    """
+    Scans a block range for logs using ``eth_getLogs``. Arbitrum produces many
+    more blocks than L1, so the block window adapts to the number of logs found
+    and shrinks when the node rejects a query as too large. The next window is
+    requested while the current one is being consumed.
+
+    Logs are yielded one window at a time and :attr:`checkpoint` is only moved
+    past a window once all its logs were consumed. To resume, create a new
+    scanner starting at the checkpoint.
+
+    Usage example::
+
+        scanner = networks.arbitrum.scan_logs(events=[contract.Transfer.abi], start_block=0)
+        for log in scanner:
+            ...
+            save(scanner.checkpoint)
+
+    Args:
+        address (str | Sequence[str] | None): Only get logs from these contracts.
+        topics (list | None): The topics to filter by. Defaults to the selectors of ``events``.
+        events (Sequence[EventABI]): Decode the logs with these events.
+          Defaults to yielding the raw logs.
+        start_block (int): The first block to scan. Defaults to ``0``.
+        stop_block (int | None): The last block to scan. Defaults to the latest block
+          at the start of the scan.
+        window (int): The initial number of blocks per query.
+        min_window (int): The smallest number of blocks per query.
+        max_window (int): The largest number of blocks per query.
+        target_logs (int): The ideal number of logs per query.
+        max_retries (int): The number of times to retry a rate-limited or timed-out query.
+        backoff (float): The seconds to wait before the first retry, doubled for each retry.
+    """
+
+    def __init__(
+        self,
+        address: str | Sequence[str] | None = None,
+        topics: list | None = None,
+        events: Sequence[EventABI] = (),
+        start_block: int = 0,
+        stop_block: int | None = None,
+        window: int = 2_000,
+        min_window: int = 1,
+        max_window: int = 100_000,
+        target_logs: int = 5_000,
+        max_retries: int = 5,
+        backoff: float = 1,
+    ):
+        self.address = address
+        self.events = list(events)
+        self.topics = topics
+        if topics is None and self.events:
+            self.topics = [[encode_hex(keccak(text=event.selector)) for event in self.events]]
+
+        self.checkpoint = start_block
+        self.stop_block = stop_block
+        self.min_window = min_window
+        self.max_window = max_window
+        self.window = min(max(window, min_window), max_window)
+        self.target_logs = target_logs
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.scan()
+
+    def scan(self) -> Iterator[Any]:
+        """
+        Scan from the checkpoint to the stop block.
+
+        Returns:
+            Iterator: :class:`~ape.types.ContractLog` objects when given ``events``,
+            else the raw log data.
+        """
+        stop_block = self.stop_block
+        if stop_block is None:
+            stop_block = self.provider.get_block("latest").number or 0
+
+        if self.checkpoint > stop_block:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            start, stop = self.checkpoint, min(self.checkpoint + self.window - 1, stop_block)
+            future = pool.submit(self._get_logs, start, stop)
+            while True:
+                start, stop, logs = self._resolve(future, start, stop)
+                self._adapt_window(len(logs))
+
+                # Prefetch the next window while this one is consumed.
+                next_start = stop + 1
+                next_stop = min(next_start + self.window - 1, stop_block)
+                if next_start <= stop_block:
+                    future = pool.submit(self._get_logs, next_start, next_stop)
+
+                if self.events:
+                    yield from self.provider.network.ecosystem.decode_logs(logs, *self.events)
+                else:
+                    yield from logs
+
+                self.checkpoint = next_start
+                if next_start > stop_block:
+                    break
+
+                start, stop = next_start, next_stop
+
+    def _resolve(self, future: Future, start: int, stop: int) -> tuple[int, int, list]:
+        try:
+            return start, stop, future.result()
+        except (ProviderError, RequestException) as err:
+            error = err
+
+        # Shrink the window for as long as the node rejects the query as too large,
+        # and back off (without shrinking) when rate-limited.
+        retries = 0
+        while True:
+            if _is_error(error, RESPONSE_SIZE_ERRORS):
+                if stop <= start or self.window <= self.min_window:
+                    raise ApeArbitrumError(
+                        f"Unable to get logs for block range {start}-{stop}: {error}"
+                    ) from error
+
+                self.window = max(self.window // 2, self.min_window)
+                stop = min(start + self.window - 1, stop)
+
+            elif _is_transient(error):
+                if retries >= self.max_retries:
+                    raise error
+
+                time.sleep(self.backoff * 2**retries)
+                retries += 1
+
+            else:
+                raise error
+
+            try:
+                return start, stop, self._get_logs(start, stop)
+            except (ProviderError, RequestException) as err:
+                error = err
+
+    def _adapt_window(self, num_logs: int):
+        if num_logs > self.target_logs:
+            self.window = max(self.window // 2, self.min_window)
+        elif num_logs < self.target_logs // 2:
+            self.window = min(self.window * 2, self.max_window)
+
+    def _get_logs(self, start: int, stop: int) -> list:
+        log_filter: dict = {"fromBlock": to_hex(start), "toBlock": to_hex(stop)}
+        if self.address is not None:
+            log_filter["address"] = self.address
+        if self.topics is not None:
+            log_filter["topics"] = self.topics
+
+        return list(self.provider.make_request("eth_getLogs", [log_filter]) or [])
+
+
+def _is_error(err: Exception, messages: tuple[str, ...]) -> bool:
+    message = str(err).lower()
+    return any(text in message for text in messages)
+
+
+def _is_transient(err: Exception) -> bool:
+    cause = err.__cause__ if isinstance(err, ProviderError) else err
+    if isinstance(cause, Timeout):
+        return True
+
+    if isinstance(cause, HTTPError) and cause.response is not None:
+        return cause.response.status_code in RATE_LIMIT_STATUS_CODES
+
+    return _is_error(err, TRANSIENT_ERRORS)
@@ -0,0 +1,246 @@
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from ape.api.transactions import ReceiptAPI, TransactionAPI
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+
+from .ecosystem import ApeArbitrumError
+
+if TYPE_CHECKING:
+    from ape.api.accounts import AccountAPI
+    from ape.types import AddressType
+
+# NOTE: Error messages nodes use when a nonce is already used or out of order.
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "invalid transaction nonce",
+    "replacement transaction underpriced",
+)
+
+# NOTE: The error message nodes use when the same signed transaction was already received.
+ALREADY_KNOWN_ERROR = "already known"
+
+# NOTE: The number of times a submission is retried after resynchronizing its sender's nonce.
+MAX_NONCE_RETRIES = 3
+
+
+class NonceManager(ManagerAccessMixin):
+    """
+    Hands out nonces per sender from a local counter, so only the first
+    transaction of a sender needs a ``eth_getTransactionCount`` round trip.
+    The counter is resynchronized with the node after a nonce error. Counters
+    are kept per chain, as the manager is shared by the Arbitrum networks.
+
+    Usage example::
+
+        nonce = networks.arbitrum.nonces.allocate(account.address)
+    """
+
+    def __init__(self):
+        self._next_nonces: dict[tuple[int, str], int] = {}
+        self._locks: dict[tuple[int, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def allocate(self, sender: "AddressType") -> int:
+        """
+        Get the next unused nonce of a sender.
+
+        Args:
+            sender (:class:`~ape.types.address.AddressType`): The sender.
+
+        Returns:
+            int
+        """
+        key = self._get_key(sender)
+        with self._get_lock(key):
+            if (nonce := self._next_nonces.get(key)) is None:
+                nonce = self.provider.get_nonce(sender, block_id="pending")
+
+            self._next_nonces[key] = nonce + 1
+            return nonce
+
+    def release(self, sender: "AddressType", nonce: int):
+        """
+        Return a nonce that was not used, e.g. because its transaction failed to send.
+        Later nonces may already be in use, leaving a gap, so the next allocation
+        is resynchronized with the node unless it was the last nonce handed out.
+
+        Args:
+            sender (:class:`~ape.types.address.AddressType`): The sender.
+            nonce (int): The unused nonce.
+        """
+        key = self._get_key(sender)
+        with self._get_lock(key):
+            if self._next_nonces.get(key) == nonce + 1:
+                self._next_nonces[key] = nonce
+            else:
+                self._next_nonces.pop(key, None)
+
+    def resync(self, sender: "AddressType"):
+        """
+        Get the sender's next nonce from the node on the next allocation.
+
+        Args:
+            sender (:class:`~ape.types.address.AddressType`): The sender.
+        """
+        key = self._get_key(sender)
+        with self._get_lock(key):
+            self._next_nonces.pop(key, None)
+
+    def reset(self):
+        """
+        Forget the nonces of all the senders.
+        """
+        with self._lock:
+            keys = list(self._next_nonces)
+
+        # NOTE: Take each sender's lock, so an allocation in progress is not undone.
+        for key in keys:
+            with self._get_lock(key):
+                self._next_nonces.pop(key, None)
+
+    def _get_key(self, sender: str) -> tuple[int, str]:
+        return self.provider.chain_id, sender
+
+    def _get_lock(self, key: tuple[int, str]) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+class TransactionPipeline(ManagerAccessMixin):
+    """
+    Submits many transactions from one account without waiting for each to be
+    included before sending the next. Nonces come from the ecosystem's
+    :class:`~ape_arbitrum.nonces.NonceManager`, transactions are sent in nonce
+    order and the receipts are awaited in the background, with at most
+    ``max_in_flight`` transactions waiting at once.
+
+    Usage example::
+
+        with TransactionPipeline(account) as pipeline:
+            futures = [pipeline.submit(txn) for txn in txns]
+
+        receipts = [future.result() for future in futures]
+
+    Args:
+        account (:class:`~ape.api.accounts.AccountAPI`): The sender.
+        max_in_flight (int): The most transactions waiting for a receipt at once.
+        nonces (:class:`~ape_arbitrum.nonces.NonceManager` | None): The nonce allocator.
+          Defaults to the connected Arbitrum ecosystem's.
+        timeout (int | None): The number of seconds to wait for each receipt.
+    """
+
+    def __init__(
+        self,
+        account: "AccountAPI",
+        max_in_flight: int = 32,
+        nonces: NonceManager | None = None,
+        timeout: int | None = None,
+    ):
+        self.account = account
+        self.nonces = nonces if nonces is not None else self.provider.network.ecosystem.nonces
+        self.timeout = timeout
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._send_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_in_flight)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def submit(self, txn: TransactionAPI) -> "Future[ReceiptAPI]":
+        """
+        Sign and send a transaction, blocking only while ``max_in_flight``
+        transactions are already waiting for their receipts.
+
+        Args:
+            txn (:class:`~ape.api.transactions.TransactionAPI`): The transaction.
+              Its nonce is always allocated by the pipeline.
+
+        Returns:
+            Future[:class:`~ape.api.transactions.ReceiptAPI`]: The receipt, once included.
+        """
+        self._in_flight.acquire()
+        try:
+            txn_hash = self._send(txn)
+        except BaseException:
+            self._in_flight.release()
+            raise
+
+        future = self._pool.submit(self._get_receipt, txn_hash, txn.required_confirmations)
+        future.add_done_callback(lambda _: self._in_flight.release())
+        return future
+
+    def submit_many(self, txns: Iterable[TransactionAPI]) -> list[ReceiptAPI]:
+        """
+        Submit many transactions and wait for all their receipts.
+
+        Args:
+            txns (Iterable[:class:`~ape.api.transactions.TransactionAPI`]): The transactions.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]: The receipts, in order.
+        """
+        futures = [self.submit(txn) for txn in txns]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """
+        Wait for the in-flight transactions and stop the background workers.
+        """
+        self._pool.shutdown(wait=True)
+
+    def _send(self, txn: TransactionAPI) -> str:
+        sender = self.account.address
+        txn.sender = sender
+
+        # NOTE: Send one at a time, so transactions reach the sequencer in nonce order.
+        with self._send_lock:
+            for attempt in range(MAX_NONCE_RETRIES + 1):
+                txn.nonce = self.nonces.allocate(sender)
+                signed_txn = None
+                try:
+                    signed_txn = self._sign(txn)
+                    return self.provider.make_request(
+                        "eth_sendRawTransaction",
+                        [HexBytes(signed_txn.serialize_transaction()).to_0x_hex()],
+                    )
+                except Exception as err:
+                    if signed_txn is not None and ALREADY_KNOWN_ERROR in str(err).lower():
+                        # NOTE: This exact transaction is already in the mempool (e.g. sent
+                        #   again after a lost response), so don't re-send it with a new nonce.
+                        return HexBytes(signed_txn.txn_hash).to_0x_hex()
+
+                    if _is_nonce_error(err) and attempt < MAX_NONCE_RETRIES:
+                        # NOTE: Another process used the nonce, or one was dropped.
+                        self.nonces.resync(sender)
+                        continue
+
+                    self.nonces.release(sender, txn.nonce)
+                    raise
+
+        raise ApeArbitrumError(f"Unable to allocate a nonce for '{sender}'.")
+
+    def _sign(self, txn: TransactionAPI) -> TransactionAPI:
+        # NOTE: Skip the account's own preparation, which requests the nonce to check it.
+        txn = self.provider.prepare_transaction(txn)
+        if (signed_txn := self.account.sign_transaction(txn)) is None:
+            raise ApeArbitrumError("The transaction was not signed.")
+
+        return signed_txn
+
+    def _get_receipt(self, txn_hash: str, required_confirmations: int | None) -> ReceiptAPI:
+        return self.provider.get_receipt(
+            txn_hash, required_confirmations=required_confirmations or 0, timeout=self.timeout
+        )
+
+
+def _is_nonce_error(err: Exception) -> bool:
+    message = str(err).lower()
+    return any(text in message for text in NONCE_ERRORS)
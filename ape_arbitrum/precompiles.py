@@ -0,0 +1,367 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from ape.exceptions import ApeException, ProviderError
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+from eth_utils import to_hex
+from ethpm_types import MethodABI
+from pydantic import BaseModel
+
+from .instrumentation import instrumentation
+
+if TYPE_CHECKING:
+    from ape.api.providers import ProviderAPI
+    from ape.api.transactions import TransactionAPI
+    from ape.types import BlockID
+
+    from .ecosystem import Arbitrum
+
+ARB_GAS_INFO_ADDRESS = "0x000000000000000000000000000000000000006C"
+NODE_INTERFACE_ADDRESS = "0x00000000000000000000000000000000000000C8"
+
+# NOTE: The number of blocks to keep price data for.
+PRICE_CACHE_SIZE = 128
+
+GET_PRICES_IN_WEI_ABI = MethodABI.model_validate(
+    {
+        "type": "function",
+        "name": "getPricesInWei",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"} for _ in range(6)],
+    }
+)
+GET_L1_BASE_FEE_ESTIMATE_ABI = MethodABI.model_validate(
+    {
+        "type": "function",
+        "name": "getL1BaseFeeEstimate",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+    }
+)
+GAS_ESTIMATE_L1_COMPONENT_ABI = MethodABI.model_validate(
+    {
+        "type": "function",
+        "name": "gasEstimateL1Component",
+        "stateMutability": "payable",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "contractCreation", "type": "bool"},
+            {"name": "data", "type": "bytes"},
+        ],
+        # NOTE: gasEstimateForL1, baseFee and l1BaseFeeEstimate.
+        "outputs": [
+            {"name": "", "type": "uint64"},
+            {"name": "", "type": "uint256"},
+            {"name": "", "type": "uint256"},
+        ],
+    }
+)
+
+FIND_BATCH_CONTAINING_BLOCK_ABI = MethodABI.model_validate(
+    {
+        "type": "function",
+        "name": "findBatchContainingBlock",
+        "stateMutability": "view",
+        "inputs": [{"name": "blockNum", "type": "uint64"}],
+        "outputs": [{"name": "batch", "type": "uint64"}],
+    }
+)
+GET_L1_CONFIRMATIONS_ABI = MethodABI.model_validate(
+    {
+        "type": "function",
+        "name": "getL1Confirmations",
+        "stateMutability": "view",
+        "inputs": [{"name": "blockHash", "type": "bytes32"}],
+        "outputs": [{"name": "confirmations", "type": "uint64"}],
+    }
+)
+
+
+class GasPrices(BaseModel):
+    """
+    The prices from ``ArbGasInfo.getPricesInWei()``.
+    """
+
+    per_l2_tx: int
+    per_l1_calldata_byte: int
+    per_storage_allocation: int
+    per_arb_gas_base: int
+    per_arb_gas_congestion: int
+    per_arb_gas_total: int
+
+
+class L1GasEstimate(BaseModel):
+    """
+    The result of ``NodeInterface.gasEstimateL1Component()``.
+    """
+
+    gas_estimate_for_l1: int
+    base_fee: int
+    l1_base_fee_estimate: int
+
+
+class ArbitrumPrecompiles(ManagerAccessMixin):
+    """
+    A client for the ``ArbGasInfo`` and ``NodeInterface`` precompiles. Calls
+    are sent as a single JSON-RPC batch and price data is cached per block
+    (of each chain, as the client is shared by the Arbitrum networks).
+
+    Usage example::
+
+        precompiles = networks.arbitrum.precompiles
+        prices = precompiles.get_prices_in_wei()
+        estimates = precompiles.gas_estimate_l1_components(txns)
+    """
+
+    def __init__(self, ecosystem: "Arbitrum"):
+        self.ecosystem = ecosystem
+        self._prices: OrderedDict[tuple[int, int], GasPrices] = OrderedDict()
+
+    def get_prices_in_wei(self, block_id: "BlockID" = "latest") -> GasPrices:
+        """
+        Get the current L2 and L1 gas prices. Prices are cached per block, so
+        polling ``"latest"`` only requests the block number until a new block.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block to get prices at.
+              Defaults to ``"latest"``.
+
+        Returns:
+            :class:`~ape_arbitrum.precompiles.GasPrices`
+        """
+        if block_id == "latest":
+            # NOTE: Pin the call to the block, so its prices can be cached by number.
+            (block_number,) = self.batch_request([("eth_blockNumber", [])])
+            block_id = to_int(block_number)
+
+        if isinstance(block_id, int):
+            if (prices := self._prices.get((self.provider.chain_id, block_id))) is not None:
+                return prices
+
+            (result,) = self._call([(ARB_GAS_INFO_ADDRESS, GET_PRICES_IN_WEI_ABI, ())], block_id)
+            prices = GasPrices(**dict(zip(GasPrices.model_fields, result, strict=True)))
+            self._cache_prices(block_id, prices)
+            return prices
+
+        (result,) = self._call([(ARB_GAS_INFO_ADDRESS, GET_PRICES_IN_WEI_ABI, ())], block_id)
+        return GasPrices(**dict(zip(GasPrices.model_fields, result, strict=True)))
+
+    def get_block_and_prices(self, block_id: "BlockID" = "latest") -> tuple[dict, GasPrices]:
+        """
+        Get a block's header and the gas prices at it in a single request.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block. Defaults to ``"latest"``.
+
+        Returns:
+            tuple[dict, :class:`~ape_arbitrum.precompiles.GasPrices`]: The raw block
+            header and the prices.
+        """
+        block_param = to_hex(block_id) if isinstance(block_id, int) else block_id
+        block, result = self.batch_request(
+            [
+                ("eth_getBlockByNumber", [block_param, False]),
+                self._create_call(ARB_GAS_INFO_ADDRESS, GET_PRICES_IN_WEI_ABI, (), block_id),
+            ]
+        )
+        result = self.ecosystem.decode_returndata(GET_PRICES_IN_WEI_ABI, HexBytes(result))
+        prices = GasPrices(**dict(zip(GasPrices.model_fields, result, strict=True)))
+        self._cache_prices(to_int(block["number"]), prices)
+        return block, prices
+
+    def get_l1_base_fee_estimate(self, block_id: "BlockID" = "latest") -> int:
+        """
+        Get ArbOS's estimate of the L1 base fee.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block to get the estimate at.
+              Defaults to ``"latest"``.
+
+        Returns:
+            int
+        """
+        (result,) = self._call([(ARB_GAS_INFO_ADDRESS, GET_L1_BASE_FEE_ESTIMATE_ABI, ())], block_id)
+        return result[0]
+
+    def gas_estimate_l1_components(
+        self, txns: Sequence["TransactionAPI"], block_id: "BlockID" = "latest"
+    ) -> list[L1GasEstimate]:
+        """
+        Estimate the L1 component of the gas for many transactions
+        in a single request.
+
+        Args:
+            txns (Sequence[:class:`~ape.api.transactions.TransactionAPI`]): The transactions.
+            block_id (:class:`~ape.types.BlockID`): The block to estimate at.
+              Defaults to ``"latest"``.
+
+        Returns:
+            list[:class:`~ape_arbitrum.precompiles.L1GasEstimate`]
+        """
+        calls = [
+            (
+                NODE_INTERFACE_ADDRESS,
+                GAS_ESTIMATE_L1_COMPONENT_ABI,
+                (
+                    txn.receiver or NODE_INTERFACE_ADDRESS,
+                    txn.receiver is None,
+                    bytes(txn.data),
+                ),
+            )
+            for txn in txns
+        ]
+        return [
+            L1GasEstimate(
+                gas_estimate_for_l1=result[0],
+                base_fee=result[1],
+                l1_base_fee_estimate=result[2],
+            )
+            for result in self._call(calls, block_id)
+        ]
+
+    def find_batches_containing_blocks(self, block_numbers: Sequence[int]) -> list[int | None]:
+        """
+        Find the L1 batches that posted many L2 blocks, in a single request.
+
+        Args:
+            block_numbers (Sequence[int]): The L2 block numbers.
+
+        Returns:
+            list[int | None]: The batch number of each block, or ``None`` when
+            the block is not yet posted to L1.
+        """
+        abi = FIND_BATCH_CONTAINING_BLOCK_ABI
+        requests = [
+            self._create_call(NODE_INTERFACE_ADDRESS, abi, (n,), "latest") for n in block_numbers
+        ]
+        batches: list[int | None] = []
+        for result in batch_request(self.provider, requests, raise_errors=False):
+            if isinstance(result, ApeException):
+                # NOTE: The call reverts for blocks that are not yet posted.
+                batches.append(None)
+            else:
+                batches.append(self.ecosystem.decode_returndata(abi, HexBytes(result))[0])
+
+        return batches
+
+    def get_l1_confirmations(self, block_hashes: Sequence[bytes]) -> list[int]:
+        """
+        Get the number of L1 blocks confirming the batches that posted many
+        L2 blocks, in a single request.
+
+        Args:
+            block_hashes (Sequence[bytes]): The L2 block hashes.
+
+        Returns:
+            list[int]: The L1 confirmations of each block, ``0`` if not yet posted.
+        """
+        calls = [
+            (NODE_INTERFACE_ADDRESS, GET_L1_CONFIRMATIONS_ABI, (bytes(block_hash),))
+            for block_hash in block_hashes
+        ]
+        return [result[0] for result in self._call(calls, "latest")]
+
+    def batch_request(self, requests: list[tuple[str, list]]) -> list[Any]:
+        """
+        Make many JSON-RPC requests in a single batch.
+
+        Args:
+            requests (list[tuple[str, list]]): The RPC method and parameters of each request.
+
+        Returns:
+            list: The result of each request, in the same order.
+        """
+        return batch_request(self.provider, requests)
+
+    def _call(
+        self, calls: list[tuple[str, MethodABI, tuple]], block_id: "BlockID"
+    ) -> list[tuple[Any, ...]]:
+        requests = [self._create_call(address, abi, args, block_id) for address, abi, args in calls]
+        return [
+            self.ecosystem.decode_returndata(abi, HexBytes(result))
+            for (_, abi, _), result in zip(calls, self.batch_request(requests), strict=True)
+        ]
+
+    def _create_call(
+        self, address: str, abi: MethodABI, args: tuple, block_id: "BlockID"
+    ) -> tuple[str, list]:
+        calldata = self.ecosystem.get_method_selector(abi) + self.ecosystem.encode_calldata(
+            abi, *args
+        )
+        block = to_hex(block_id) if isinstance(block_id, int) else block_id
+        return ("eth_call", [{"to": address, "data": to_hex(calldata)}, block])
+
+    def _cache_prices(self, block_number: int, prices: GasPrices):
+        self._prices[(self.provider.chain_id, block_number)] = prices
+        while len(self._prices) > PRICE_CACHE_SIZE:
+            self._prices.popitem(last=False)
+
+
+def to_int(value: int | str) -> int:
+    """
+    Convert an RPC result, which may already be formatted, to an ``int``.
+    """
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+@instrumentation.instrument("batch_request")
+def batch_request(
+    provider: "ProviderAPI", requests: list[tuple[str, list]], raise_errors: bool = True
+) -> list[Any]:
+    """
+    Make many JSON-RPC requests in a single batch, falling back
+    to one request at a time if the provider does not support batching.
+
+    Args:
+        provider (:class:`~ape.api.providers.ProviderAPI`): The provider.
+        requests (list[tuple[str, list]]): The RPC method and parameters of each request.
+        raise_errors (bool): Set to ``False`` to return the error of a failed request
+          as an :class:`~ape.exceptions.ApeException` in its place, instead of raising it.
+          Defaults to ``True``.
+
+    Returns:
+        list: The result of each request, in the same order.
+    """
+    if not requests:
+        return []
+
+    web3_provider = getattr(getattr(provider, "web3", None), "provider", None)
+    if (make_batch_request := getattr(web3_provider, "make_batch_request", None)) is None:
+        if raise_errors:
+            return [provider.make_request(method, params) for method, params in requests]
+
+        results: list[Any] = []
+        for method, params in requests:
+            try:
+                results.append(provider.make_request(method, params))
+            except ApeException as err:
+                results.append(err)
+
+        return results
+
+    responses = make_batch_request(requests)
+    if isinstance(responses, dict):
+        # NOTE: Some nodes respond with a single error for the whole batch.
+        error = responses.get("error", responses)
+        raise ProviderError(error.get("message", str(error)) if isinstance(error, dict) else error)
+
+    results = []
+    for response in responses:
+        if "error" in response:
+            error = response["error"]
+            provider_error = ProviderError(
+                error.get("message", str(error)) if isinstance(error, dict) else error
+            )
+            if raise_errors:
+                raise provider_error
+
+            results.append(provider_error)
+            continue
+
+        results.append(response.get("result"))
+
+    return results
@@ -0,0 +1,318 @@
+import time
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any
+
+from ape.exceptions import ApeException, ContractLogicError
+from ape.utils.basemodel import ManagerAccessMixin
+from eth_pydantic_types import HexBytes
+from eth_utils import encode_hex, keccak, to_hex
+from pydantic import BaseModel
+
+from .ecosystem import MIN_CONFIRMATIONS_POLL_INTERVAL, ApeArbitrumError
+from .precompiles import batch_request, to_int
+
+ARB_RETRYABLE_TX_ADDRESS = "0x000000000000000000000000000000000000006E"
+REDEEM_SCHEDULED_TOPIC = encode_hex(
+    keccak(text="RedeemScheduled(bytes32,bytes32,uint64,uint64,address,uint256,uint256)")
+)
+GET_TIMEOUT_SELECTOR = keccak(text="getTimeout(bytes32)")[:4]
+
+# NOTE: The largest number of requests sent in one JSON-RPC batch.
+DEFAULT_BATCH_SIZE = 500
+
+
+class RetryableStatus(Enum):
+    """
+    The state of a retryable ticket on L2.
+    """
+
+    NOT_YET_CREATED = "not_yet_created"
+    """The L1 message creating the ticket has not been executed on L2 yet."""
+
+    CREATION_FAILED = "creation_failed"
+    """The ticket could not be created, e.g. because the deposit was too low."""
+
+    REDEEMABLE = "redeemable"
+    """The ticket exists but no redeem attempt has succeeded yet."""
+
+    REDEEMED = "redeemed"
+    """An automatic or manual redeem attempt succeeded."""
+
+    EXPIRED = "expired"
+    """The ticket expired before being redeemed."""
+
+
+FINAL_RETRYABLE_STATUSES = frozenset(
+    (RetryableStatus.CREATION_FAILED, RetryableStatus.REDEEMED, RetryableStatus.EXPIRED)
+)
+
+
+class RetryableTicket(BaseModel):
+    """
+    The tracked state of a retryable ticket.
+    """
+
+    ticket_id: str
+    """The ticket ID, which is the hash of the L2 submit-retryable (type 105) transaction."""
+
+    status: RetryableStatus = RetryableStatus.NOT_YET_CREATED
+    creation_block: int | None = None
+    redeem_txn_hash: str | None = None
+    """The successful redeem (type 104) transaction."""
+
+    failed_redeem_txn_hashes: list[str] = []
+    timeout: int | None = None
+    """The timestamp the ticket expires at, unless it is kept alive."""
+
+    @property
+    def is_final(self) -> bool:
+        """
+        ``True`` when the ticket's state can no longer change.
+        """
+        return self.status in FINAL_RETRYABLE_STATUSES
+
+
+class RetryableTicketTracker(ManagerAccessMixin):
+    """
+    Follows many retryable tickets from their creation on L2 through an automatic
+    or manual redeem. Each poll sends one JSON-RPC batch per step for all the
+    tickets, instead of requests per ticket, and tickets in a final state or
+    with a known timeout are not requested again.
+
+    Tickets are tracked by ID, which is the hash of the L2 submit-retryable
+    (type 105) transaction created for the L1 submission.
+
+    Usage example::
+
+        tracker = RetryableTicketTracker(ticket_ids)
+        tracker.wait()
+        redeemed = [t for t in tracker.tickets.values() if t.status is RetryableStatus.REDEEMED]
+
+    Args:
+        ticket_ids (Iterable[str]): The tickets to track.
+        batch_size (int): The largest number of requests per batch.
+    """
+
+    def __init__(self, ticket_ids: Iterable[str] = (), batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.tickets: dict[str, RetryableTicket] = {}
+
+        # NOTE: Redeem attempts without a receipt yet, by transaction hash.
+        self._attempts: dict[str, str] = {}
+
+        # NOTE: The last block searched for manual redeems of each ticket.
+        self._scanned_blocks: dict[str, int] = {}
+
+        for ticket_id in ticket_ids:
+            self.add(ticket_id)
+
+    def add(self, ticket_id: str) -> RetryableTicket:
+        """
+        Start tracking a ticket.
+
+        Args:
+            ticket_id (str): The ticket ID.
+
+        Returns:
+            :class:`~ape_arbitrum.retryables.RetryableTicket`
+        """
+        ticket_id = _to_hash(ticket_id)
+        if ticket_id not in self.tickets:
+            self.tickets[ticket_id] = RetryableTicket(ticket_id=ticket_id)
+
+        return self.tickets[ticket_id]
+
+    @property
+    def pending(self) -> list[RetryableTicket]:
+        """
+        The tickets that are not in a final state.
+        """
+        return [ticket for ticket in self.tickets.values() if not ticket.is_final]
+
+    def poll(self) -> list[RetryableTicket]:
+        """
+        Update every pending ticket.
+
+        Returns:
+            list[:class:`~ape_arbitrum.retryables.RetryableTicket`]: The tickets
+            whose status changed.
+        """
+        if not (pending := self.pending):
+            return []
+
+        statuses = {ticket.ticket_id: ticket.status for ticket in pending}
+        head = self.provider.get_block("latest")
+        head_number = head.number or 0
+        self._update_created([t for t in pending if t.status is RetryableStatus.NOT_YET_CREATED])
+
+        redeemable = [t for t in pending if t.status is RetryableStatus.REDEEMABLE]
+        self._scan_redeems(redeemable, head_number)
+        self._update_attempts()
+
+        # NOTE: Only check tickets without a pending attempt that may have expired.
+        attempted = set(self._attempts.values())
+        self._update_timeouts(
+            [
+                ticket
+                for ticket in redeemable
+                if ticket.status is RetryableStatus.REDEEMABLE
+                and ticket.ticket_id not in attempted
+                and (ticket.timeout is None or ticket.timeout <= head.timestamp)
+            ],
+            head_number,
+        )
+        return [ticket for ticket in pending if ticket.status is not statuses[ticket.ticket_id]]
+
+    def wait(self, timeout: float | None = None, poll_interval: float | None = None):
+        """
+        Wait until all the tracked tickets are in a final state.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait.
+              Defaults to waiting indefinitely.
+            poll_interval (float | None): The number of seconds between polls.
+              Defaults to the network's block time.
+
+        Raises:
+            :class:`~ape_arbitrum.ecosystem.ApeArbitrumError`: When the timeout is reached.
+        """
+        if poll_interval is None:
+            poll_interval = max(self.provider.network.block_time, MIN_CONFIRMATIONS_POLL_INTERVAL)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.poll()
+            if not self.pending:
+                return
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ApeArbitrumError(
+                    f"Timed out waiting for {len(self.pending)} retryable ticket(s)."
+                )
+
+            time.sleep(poll_interval)
+
+    def _update_created(self, tickets: list[RetryableTicket]):
+        receipts = self._batch_request(
+            [("eth_getTransactionReceipt", [ticket.ticket_id]) for ticket in tickets]
+        )
+        for ticket, receipt in zip(tickets, receipts, strict=True):
+            if not receipt:
+                continue
+
+            if not to_int(receipt["status"]):
+                ticket.status = RetryableStatus.CREATION_FAILED
+                continue
+
+            ticket.status = RetryableStatus.REDEEMABLE
+            ticket.creation_block = to_int(receipt["blockNumber"])
+
+            # NOTE: The auto-redeem is scheduled in the creation receipt.
+            self._add_attempts(receipt["logs"])
+            self._scanned_blocks[ticket.ticket_id] = ticket.creation_block
+
+    def _scan_redeems(self, tickets: list[RetryableTicket], head_number: int):
+        # NOTE: Search for manual redeems of all the tickets scanned up to the same block at once.
+        tickets_by_block: dict[int, list[str]] = {}
+        for ticket in tickets:
+            if (scanned_block := self._scanned_blocks[ticket.ticket_id]) < head_number:
+                tickets_by_block.setdefault(scanned_block, []).append(ticket.ticket_id)
+
+        requests = []
+        for scanned_block, ticket_ids in tickets_by_block.items():
+            for start in range(0, len(ticket_ids), self.batch_size):
+                log_filter = {
+                    "address": ARB_RETRYABLE_TX_ADDRESS,
+                    "fromBlock": to_hex(scanned_block + 1),
+                    "toBlock": to_hex(head_number),
+                    "topics": [REDEEM_SCHEDULED_TOPIC, ticket_ids[start : start + self.batch_size]],
+                }
+                requests.append(("eth_getLogs", [log_filter]))
+
+        for logs in self._batch_request(requests):
+            self._add_attempts(logs)
+
+        for ticket_ids in tickets_by_block.values():
+            for ticket_id in ticket_ids:
+                self._scanned_blocks[ticket_id] = head_number
+
+    def _update_attempts(self):
+        txn_hashes = list(self._attempts)
+        receipts = self._batch_request(
+            [("eth_getTransactionReceipt", [txn_hash]) for txn_hash in txn_hashes]
+        )
+        for txn_hash, receipt in zip(txn_hashes, receipts, strict=True):
+            if not receipt:
+                continue
+
+            ticket = self.tickets[self._attempts.pop(txn_hash)]
+            if to_int(receipt["status"]):
+                ticket.status = RetryableStatus.REDEEMED
+                ticket.redeem_txn_hash = txn_hash
+            else:
+                ticket.failed_redeem_txn_hashes.append(txn_hash)
+
+    def _update_timeouts(self, tickets: list[RetryableTicket], head_number: int):
+        # NOTE: Call at the scanned block, so a redeem after it isn't mistaken for an expiry.
+        requests = [
+            (
+                "eth_call",
+                [
+                    {
+                        "to": ARB_RETRYABLE_TX_ADDRESS,
+                        "data": encode_hex(GET_TIMEOUT_SELECTOR + HexBytes(ticket.ticket_id)),
+                    },
+                    to_hex(head_number),
+                ],
+            )
+            for ticket in tickets
+        ]
+        for ticket, result in zip(
+            tickets, self._batch_request(requests, raise_errors=False), strict=True
+        ):
+            if isinstance(result, ApeException):
+                # NOTE: `getTimeout()` reverts once the ticket no longer exists. Other
+                #   errors, such as rate limits, say nothing about the ticket.
+                if not _is_revert(result):
+                    raise result
+
+                ticket.status = RetryableStatus.EXPIRED
+            else:
+                ticket.timeout = to_int(HexBytes(result).to_0x_hex())
+
+    def _add_attempts(self, logs: list[dict]):
+        for log in logs:
+            topics = [_to_hash(topic) for topic in log["topics"]]
+            if (
+                len(topics) < 3
+                or topics[0] != REDEEM_SCHEDULED_TOPIC
+                or topics[1] not in self.tickets
+                or _to_hash(log["address"]) != ARB_RETRYABLE_TX_ADDRESS.lower()
+            ):
+                continue
+
+            ticket = self.tickets[topics[1]]
+            if topics[2] not in ticket.failed_redeem_txn_hashes:
+                self._attempts[topics[2]] = topics[1]
+
+    def _batch_request(self, requests: list[tuple[str, list]], raise_errors: bool = True):
+        results: list[Any] = []
+        for start in range(0, len(requests), self.batch_size):
+            results.extend(
+                batch_request(
+                    self.provider,
+                    requests[start : start + self.batch_size],
+                    raise_errors=raise_errors,
+                )
+            )
+
+        return results
+
+
+def _to_hash(value: str | bytes) -> str:
+    return HexBytes(value).to_0x_hex()
+
+
+def _is_revert(err: ApeException) -> bool:
+    return isinstance(err, ContractLogicError) or "revert" in str(err).lower()
@@ -0,0 +1,395 @@
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import ijson  # type: ignore[import-untyped]
+import requests
+from ape.exceptions import ProviderError
+from ape.utils.basemodel import ManagerAccessMixin
+from pydantic import BaseModel
+
+from .constants import GENESIS_BLOCKS, INTERNAL_TRANSACTION_TYPE
+from .ecosystem import ApeArbitrumError
+from .precompiles import to_int
+
+# NOTE: The number of bytes of a trace response read and parsed at once.
+CHUNK_SIZE = 2**17
+
+# NOTE: The ArbOS precompiles and system addresses, which generic tracers show as unknown.
+SYSTEM_CONTRACTS = {
+    "0x0000000000000000000000000000000000000064": "ArbSys",
+    "0x0000000000000000000000000000000000000065": "ArbInfo",
+    "0x0000000000000000000000000000000000000066": "ArbAddressTable",
+    "0x0000000000000000000000000000000000000068": "ArbFunctionTable",
+    "0x0000000000000000000000000000000000000069": "ArbosTest",
+    "0x000000000000000000000000000000000000006b": "ArbOwnerPublic",
+    "0x000000000000000000000000000000000000006c": "ArbGasInfo",
+    "0x000000000000000000000000000000000000006d": "ArbAggregator",
+    "0x000000000000000000000000000000000000006e": "ArbRetryableTx",
+    "0x000000000000000000000000000000000000006f": "ArbStatistics",
+    "0x0000000000000000000000000000000000000070": "ArbOwner",
+    "0x0000000000000000000000000000000000000071": "ArbWasm",
+    "0x0000000000000000000000000000000000000072": "ArbWasmCache",
+    "0x00000000000000000000000000000000000000c8": "NodeInterface",
+    "0x00000000000000000000000000000000000000c9": "NodeInterfaceDebug",
+    "0x00000000000000000000000000000000000000ff": "ArbDebug",
+    "0x00000000000000000000000000000000000a4b05": "ArbOS",
+    "0xa4b05fffffffffffffffffffffffffffffffffff": "ArbosActs",
+}
+
+# NOTE: The call tracer fields kept per frame. Others, such as the return data
+#   and Arbitrum's EVM transfer lists, are skipped while parsing.
+_CALL_FIELDS = frozenset(("type", "from", "to", "value", "gas", "gasUsed", "input", "error"))
+
+
+class CallFrame(BaseModel):
+    """
+    A call in a transaction trace, with the gas used by it and its sub-calls.
+    """
+
+    type: str = "CALL"
+    sender: str | None = None
+    receiver: str | None = None
+    value: int = 0
+    gas: int = 0
+    gas_used: int = 0
+    selector: str | None = None
+    """The first 4 bytes of the calldata."""
+
+    error: str | None = None
+    calls: list["CallFrame"] = []
+
+    @property
+    def name(self) -> str:
+        """
+        The ArbOS name of the receiver, or its address.
+        """
+        receiver = (self.receiver or "").lower()
+        return SYSTEM_CONTRACTS.get(receiver) or self.receiver or "<create>"
+
+    @property
+    def self_gas_used(self) -> int:
+        """
+        The gas used by this call, excluding its sub-calls.
+        """
+        return max(self.gas_used - sum(call.gas_used for call in self.calls), 0)
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, "CallFrame"]]:
+        """
+        Iterate over this call and its sub-calls, depth-first.
+
+        Args:
+            depth (int): The depth of this call.
+
+        Returns:
+            Iterator[tuple[int, :class:`CallFrame`]]: The depth and call.
+        """
+        yield depth, self
+        for call in self.calls:
+            yield from call.walk(depth + 1)
+
+
+class GasProfile(BaseModel):
+    """
+    The gas of a transaction by call, with the L1 (calldata posting) and L2
+    (execution) costs split. The L1 gas is charged to the top-level call.
+    """
+
+    txn_hash: str
+    root: CallFrame
+    gas_used: int
+    l1_gas_used: int
+    is_internal: bool = False
+    """Whether this is an ArbOS internal (type 106) transaction, which uses no gas."""
+
+    @property
+    def l2_gas_used(self) -> int:
+        """
+        The gas used for execution on L2.
+        """
+        return self.gas_used - self.l1_gas_used
+
+    def get_gas_by_receiver(self) -> dict[str, int]:
+        """
+        Sum the L2 gas used by each receiver, excluding sub-calls.
+
+        Returns:
+            dict[str, int]: The gas by receiver name or address, most first.
+        """
+        totals: dict[str, int] = {}
+        for depth, call in self.root.walk():
+            gas = call.self_gas_used - (self.l1_gas_used if depth == 0 else 0)
+            totals[call.name] = totals.get(call.name, 0) + max(gas, 0)
+
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def format(self) -> str:
+        """
+        Format the calls as an indented tree.
+
+        Returns:
+            str
+        """
+        lines = [f"{self.txn_hash} gas={self.gas_used} l1={self.l1_gas_used} l2={self.l2_gas_used}"]
+        for depth, call in self.root.walk():
+            selector = f".{call.selector}" if call.selector else ""
+            error = f" [{call.error}]" if call.error else ""
+            lines.append(
+                f"{'  ' * (depth + 1)}{call.type} {call.name}{selector} "
+                f"gas={call.gas_used} self={call.self_gas_used}{error}"
+            )
+
+        return "\n".join(lines)
+
+
+class TraceProfiler(ManagerAccessMixin):
+    """
+    Replays transactions with the node's tracer and profiles their gas by call.
+    Traces are streamed and parsed incrementally, so only the parts needed for the
+    gas tree are kept in memory, and are cached on disk by transaction hash.
+    Nitro blocks use ``debug_traceTransaction`` with the call tracer and blocks
+    from before Nitro use ``arbtrace_transaction``.
+
+    Usage example::
+
+        profiler = TraceProfiler()
+        profile = profiler.profile(txn_hash)
+        print(profile.format())
+
+    Args:
+        uri (str | None): The node's HTTP URL. Defaults to the connected provider's.
+        path (Path | None): The cache directory. Defaults to a folder in the ape data folder.
+        chunk_size (int): The number of bytes read and parsed at once.
+        timeout (float): The number of seconds to wait for a trace.
+    """
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        path: Path | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        timeout: float = 120,
+    ):
+        if uri is None and (uri := getattr(self.provider, "http_uri", None)) is None:
+            raise ApeArbitrumError("Tracing requires a provider with an HTTP URL.")
+
+        self.uri = uri
+        base_path = self.config_manager.DATA_FOLDER / "arbitrum" / "traces"
+        self.path = Path(path) if path is not None else base_path
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._chain_id: int | None = None
+
+    @property
+    def chain_id(self) -> int:
+        """
+        The chain ID of the node, which the cache is separated by.
+        """
+        if self._chain_id is None:
+            self._chain_id = to_int(self._request("eth_chainId", []))
+
+        return self._chain_id
+
+    def profile(self, txn_hash: str) -> GasProfile:
+        """
+        Profile the gas of a transaction.
+
+        Args:
+            txn_hash (str): The transaction hash.
+
+        Returns:
+            :class:`GasProfile`
+        """
+        if (receipt := self._request("eth_getTransactionReceipt", [txn_hash])) is None:
+            raise ApeArbitrumError(f"Transaction '{txn_hash}' not found.")
+
+        root = self.get_trace(txn_hash, block_number=to_int(receipt["blockNumber"]))
+        return GasProfile(
+            txn_hash=txn_hash,
+            root=root,
+            gas_used=to_int(receipt["gasUsed"]),
+            l1_gas_used=to_int(receipt.get("gasUsedForL1") or 0),
+            is_internal=to_int(receipt.get("type") or 0) == INTERNAL_TRANSACTION_TYPE,
+        )
+
+    def get_trace(self, txn_hash: str, block_number: int | None = None) -> CallFrame:
+        """
+        Get the call tree of a transaction, from the cache when possible.
+
+        Args:
+            txn_hash (str): The transaction hash.
+            block_number (int | None): The transaction's block, to pick the tracing
+              method. Defaults to a Nitro block.
+
+        Returns:
+            :class:`CallFrame`
+        """
+        file = self.path / str(self.chain_id) / f"{txn_hash.lower()}.json"
+        if file.is_file():
+            return CallFrame.model_validate_json(file.read_text())
+
+        if block_number is not None and block_number < GENESIS_BLOCKS.get(self.chain_id, 0):
+            root = parse_arbtrace(self.stream_request("arbtrace_transaction", [txn_hash]))
+        else:
+            root = parse_call_trace(
+                self.stream_request("debug_traceTransaction", [txn_hash, {"tracer": "callTracer"}])
+            )
+
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: Write to a temporary file first, so readers never see a partial trace.
+        temp_file = file.with_suffix(f".{threading.get_ident()}.tmp")
+        temp_file.write_text(root.model_dump_json())
+        temp_file.replace(file)
+        return root
+
+    def stream_request(self, method: str, params: list) -> Iterator[bytes]:
+        """
+        Make a JSON-RPC request and stream the raw response.
+
+        Args:
+            method (str): The RPC method.
+            params (list): The RPC parameters.
+
+        Returns:
+            Iterator[bytes]: The response, in chunks.
+        """
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        with self._session.post(self.uri, json=payload, stream=True, timeout=self.timeout) as resp:
+            resp.raise_for_status()
+            yield from resp.iter_content(chunk_size=self.chunk_size)
+
+    def _request(self, method: str, params: list) -> Any:
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        response = self._session.post(self.uri, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if "error" in data:
+            raise ProviderError(data["error"].get("message", str(data["error"])))
+
+        return data.get("result")
+
+
+def parse_call_trace(chunks: Iterable[bytes]) -> CallFrame:
+    """
+    Incrementally parse a JSON-RPC response with a ``callTracer`` result.
+
+    Args:
+        chunks (Iterable[bytes]): The response, in chunks.
+
+    Returns:
+        :class:`CallFrame`: The top-level call.
+    """
+    events = ijson.sendable_list()
+    coroutine = ijson.parse_coro(events)
+    stack: list[tuple[str, dict]] = []
+    root: CallFrame | None = None
+    error: str | None = None
+    for chunk in _with_end(chunks):
+        if chunk is None:
+            coroutine.close()
+        else:
+            coroutine.send(chunk)
+
+        for prefix, event, value in events:
+            if event == "start_map" and (
+                (prefix == "result" and not stack)
+                or (stack and prefix == f"{stack[-1][0]}.calls.item")
+            ):
+                stack.append((prefix, {"calls": []}))
+
+            elif event == "end_map" and stack and prefix == stack[-1][0]:
+                call = _create_call_frame(stack.pop()[1])
+                if stack:
+                    stack[-1][1]["calls"].append(call)
+                else:
+                    root = call
+
+            elif stack and prefix.startswith(f"{stack[-1][0]}."):
+                key = prefix[len(stack[-1][0]) + 1 :]
+                if key in _CALL_FIELDS:
+                    stack[-1][1][key] = value
+
+            elif prefix == "error.message":
+                error = value
+
+        del events[:]
+
+    if error is not None or root is None:
+        raise ProviderError(error or "The response has no trace.")
+
+    return root
+
+
+def parse_arbtrace(chunks: Iterable[bytes]) -> CallFrame:
+    """
+    Incrementally parse a JSON-RPC response with an ``arbtrace_transaction``
+    result, a flat list of calls with their positions in the call tree.
+
+    Args:
+        chunks (Iterable[bytes]): The response, in chunks.
+
+    Returns:
+        :class:`CallFrame`: The top-level call.
+    """
+    items = ijson.sendable_list()
+    errors = ijson.sendable_list()
+    coroutines = (ijson.items_coro(items, "result.item"), ijson.items_coro(errors, "error"))
+    calls: dict[tuple[int, ...], CallFrame] = {}
+    for chunk in _with_end(chunks):
+        for coroutine in coroutines:
+            if chunk is None:
+                coroutine.close()
+            else:
+                coroutine.send(chunk)
+
+        for item in items:
+            action = item.get("action") or {}
+            result = item.get("result") or {}
+            address = tuple(item.get("traceAddress") or ())
+            calls[address] = _create_call_frame(
+                {
+                    "type": action.get("callType") or item.get("type"),
+                    "from": action.get("from"),
+                    "to": action.get("to") or result.get("address"),
+                    "value": action.get("value"),
+                    "gas": action.get("gas"),
+                    "gasUsed": result.get("gasUsed"),
+                    "input": action.get("input") or action.get("init"),
+                    "error": item.get("error"),
+                    "calls": [],
+                }
+            )
+            if address:
+                calls[address[:-1]].calls.append(calls[address])
+
+        del items[:]
+
+    if errors or () not in calls:
+        message = errors[0].get("message", str(errors[0])) if errors else None
+        raise ProviderError(message or "The response has no trace.")
+
+    return calls[()]
+
+
+def _create_call_frame(data: dict) -> CallFrame:
+    data_input = data.get("input") or ""
+    return CallFrame(
+        type=str(data.get("type") or "CALL").upper(),
+        sender=data.get("from"),
+        receiver=data.get("to"),
+        value=to_int(data.get("value") or 0),
+        gas=to_int(data.get("gas") or 0),
+        gas_used=to_int(data.get("gasUsed") or 0),
+        selector=data_input[:10] if len(data_input) >= 10 else None,
+        error=data.get("error"),
+        calls=data.get("calls", []),
+    )
+
+
+def _with_end(chunks: Iterable[bytes]) -> Iterator[bytes | None]:
+    # NOTE: `None` marks the end, where the parser is closed. Closing it flushes
+    #   the events it held back, which are then handled like those of a chunk.
+    yield from chunks
+    yield None
@@ -1,5 +1,194 @@
+import gc
+import json
+import statistics
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
 import ape
 import pytest
+from eth_pydantic_types import HexBytes
+
+BENCHMARK_BASELINE = Path(__file__).parent / "data" / "benchmarks" / "baseline.json"
+# NOTE: Pure-Python work like the plugin's (parsing JSON-RPC data and hex values). Each
+#   benchmark's speed is stored relative to it, so the baseline holds across machines.
+REFERENCE_DATA = json.dumps(
+    [{"number": hex(n), "hash": f"0x{n:064x}", "value": hex(n * 10**9)} for n in range(100)]
+)
+_benchmark_results = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark", action="store_true", help="Run the benchmarks (marked `benchmark`)."
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help=f"Store the benchmark results as the new baseline, in {BENCHMARK_BASELINE.name}.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.5,
+        help="The fraction a benchmark can fall behind its baseline before it fails.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+
+    skip = pytest.mark.skip(reason="Benchmarks only run with --benchmark.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(_benchmark_results, None)
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<40} {'ops/sec':>12} {'relative':>10} {'baseline':>10} "
+        f"{'KiB/op':>10} {'baseline':>10}"
+    )
+    baseline = _load_baseline()
+    for name, result in results.items():
+        expected = baseline.get(name, {})
+        terminalreporter.write_line(
+            f"{name:<40} {result['ops_per_sec']:>12,.1f} "
+            f"{result['relative_speed']:>10.4g} "
+            f"{expected.get('relative_speed', float('nan')):>10.4g} "
+            f"{result['peak_bytes'] / 1024:>10,.1f} "
+            f"{expected.get('peak_bytes', float('nan')) / 1024:>10,.1f}"
+        )
+
+    if config.getoption("--benchmark-save"):
+        # NOTE: Absolute speeds depend on the machine, so only the relative ones are stored.
+        saved = {
+            name: {"relative_speed": result["relative_speed"], "peak_bytes": result["peak_bytes"]}
+            for name, result in results.items()
+        }
+        BENCHMARK_BASELINE.write_text(json.dumps({**baseline, **saved}, indent=2) + "\n")
+        terminalreporter.write_line(f"Saved the baseline to '{BENCHMARK_BASELINE}'.")
+
+
+def _load_baseline() -> dict:
+    return json.loads(BENCHMARK_BASELINE.read_text()) if BENCHMARK_BASELINE.is_file() else {}
+
+
+def _run_reference() -> list[int]:
+    return [int(value, 16) for item in json.loads(REFERENCE_DATA) for value in item.values()]
+
+
+class Benchmark:
+    """
+    Measures the throughput and memory per operation of a callable, and
+    flags regressions against the stored baseline. Throughput is compared
+    relative to a reference operation measured in the same run, so a faster
+    or slower machine doesn't pass or fail the benchmarks by itself.
+    """
+
+    def __init__(self, results: dict, baseline: dict, tolerance: float, save: bool):
+        self.results = results
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.save = save
+        self._reference_seconds: float | None = None
+
+    @property
+    def reference_seconds(self) -> float:
+        """
+        The seconds per call of the reference operation on this machine.
+        """
+        if self._reference_seconds is None:
+            self._reference_seconds = self._time(_run_reference, repeat=5)
+
+        return self._reference_seconds
+
+    def __call__(
+        self, name: str, fn: Callable, ops: int = 1, repeat: int = 5, memory_rounds: int = 5
+    ):
+        """
+        Benchmark a callable, taking the best of ``repeat`` timed rounds.
+        Each round runs the callable for at least 0.2 seconds. Set ``ops``
+        when each call performs many operations, such as a batch.
+        """
+        seconds = self._time(fn, repeat=repeat)
+
+        # NOTE: Trace allocations separately, as tracing slows down the calls.
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(memory_rounds):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                fn()
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+
+        return self.record(name, seconds / ops, statistics.median(peaks) / ops)
+
+    def record(self, name: str, seconds: float, peak_bytes: float) -> dict:
+        """
+        Record a measurement made elsewhere, such as in a subprocess.
+        """
+        result = {
+            "ops_per_sec": round(1 / seconds, 1),
+            "relative_speed": float(f"{self.reference_seconds / seconds:.4g}"),
+            "peak_bytes": int(peak_bytes),
+        }
+        self.results[name] = result
+        if self.save or name not in self.baseline:
+            return result
+
+        # NOTE: Coverage tracing slows everything down, so the results are not comparable.
+        if sys.gettrace() is not None:
+            return result
+
+        expected = self.baseline[name]
+        regressions = []
+        if result["relative_speed"] < expected["relative_speed"] * (1 - self.tolerance):
+            regressions.append(f"{result['relative_speed']:.4g}x the reference speed")
+        # NOTE: Ignore changes of under a KiB, which are noise from the allocator.
+        if result["peak_bytes"] > max(
+            expected["peak_bytes"] * (1 + self.tolerance), expected["peak_bytes"] + 1024
+        ):
+            regressions.append(f"{result['peak_bytes']:,} bytes/op")
+
+        if regressions:
+            pytest.fail(
+                f"'{name}' regressed: {', '.join(regressions)} "
+                f"(baseline {expected['relative_speed']:.4g}x, "
+                f"{expected['peak_bytes']:,} bytes/op)."
+            )
+
+        return result
+
+    def _time(self, fn: Callable, repeat: int) -> float:
+        # NOTE: Start from a clean heap, so earlier benchmarks' garbage is not collected here.
+        gc.collect()
+        timer = timeit.Timer(fn)
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+@pytest.fixture(scope="session")
+def benchmark(pytestconfig):
+    results = pytestconfig.stash.setdefault(_benchmark_results, {})
+    return Benchmark(
+        results,
+        _load_baseline(),
+        tolerance=pytestconfig.getoption("--benchmark-tolerance"),
+        save=pytestconfig.getoption("--benchmark-save"),
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -39,3 +228,42 @@ def account(accounts):
 @pytest.fixture
 def second_account(accounts):
     return accounts.test_accounts[1]
+
+
+@pytest.fixture
+def receipt_data():
+    return {
+        "required_confirmations": 0,
+        "blockHash": HexBytes("0x01b9030516454bbb3d846bfa31fca8bf5cbdfb735879dcee27fd61f2ae3776b3"),
+        "blockNumber": 121166619,
+        "hash": HexBytes("0x8b8c74711aa2e117a307f8a96a93350e5ca7e01a7bf39dbb7a824e6a6fc3736f"),
+        "chainId": 42161,
+        "from": "0x00000000000000000000000000000000000A4B05",
+        "gas": 0,
+        "gasPrice": 0,
+        "input": HexBytes(
+            "0x6bf6a42d000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000011148fc000000000000000000000000000000000000000000000000000000000738db1b0000000000000000000000000000000000000000000000000000000000000000"  # noqa: E501
+        ),
+        "nonce": 0,
+        "r": HexBytes("0x00"),
+        "s": HexBytes("0x00"),
+        "to": "0x00000000000000000000000000000000000A4B05",
+        "transactionIndex": 0,
+        "type": 106,
+        "v": 0,
+        "value": 0,
+        "transactionHash": HexBytes(
+            "0x8b8c74711aa2e117a307f8a96a93350e5ca7e01a7bf39dbb7a824e6a6fc3736f"
+        ),
+        "logs": [],
+        "contractAddress": None,
+        "effectiveGasPrice": 100000000,
+        "cumulativeGasUsed": 0,
+        "gasUsed": 0,
+        "logsBloom": HexBytes(
+            "0x00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"  # noqa: E501
+        ),
+        "status": 1,
+        "l1BlockNumber": "0x11148fc",
+        "gasUsedForL1": "0x7",
+    }
@@ -0,0 +1,78 @@
+import pytest
+from ape import chain
+
+from ape_arbitrum.analytics import L1GasAnalytics
+
+SENDER = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+CONTRACT = "0x00000000000000000000000000000000000A4B05"
+OTHER_CONTRACT = "0x0000000000000000000000000000000000000064"
+
+
+@pytest.fixture
+def receipts(arbitrum, receipt_data):
+    specs = (
+        # block, sender, receiver, gas_used, gas_used_for_L1
+        (100, SENDER, CONTRACT, 50_000, 20_000),
+        (100, CONTRACT, CONTRACT, 30_000, 0),
+        (101, SENDER, OTHER_CONTRACT, 10_000, 4_000),
+    )
+    return [
+        arbitrum.decode_receipt(
+            {
+                **receipt_data,
+                "blockNumber": block,
+                "from": sender,
+                "to": receiver,
+                "gasUsed": gas_used,
+                "gasUsedForL1": gas_used_for_l1,
+            }
+        )
+        for block, sender, receiver, gas_used, gas_used_for_l1 in specs
+    ]
+
+
+def test_totals(receipts):
+    analytics = L1GasAnalytics(receipts)
+    assert len(analytics) == 3
+    assert analytics.total_l1_gas == 24_000
+    assert analytics.total_l2_gas == 66_000
+
+
+def test_by_sender(receipts):
+    summary = L1GasAnalytics(receipts).by_sender()
+    assert summary[SENDER] == (SENDER, 2, 36_000, 24_000)
+    assert summary[CONTRACT] == (CONTRACT, 1, 30_000, 0)
+    with pytest.raises(KeyError):
+        summary[OTHER_CONTRACT]
+
+
+def test_by_contract(receipts):
+    summary = L1GasAnalytics(receipts).by_contract()
+    assert list(summary) == [
+        (CONTRACT, 2, 60_000, 20_000),
+        (OTHER_CONTRACT, 1, 6_000, 4_000),
+    ]
+    assert summary.top(1, by="l1_ratio") == [(OTHER_CONTRACT, 1, 6_000, 4_000)]
+
+
+def test_by_block(receipts):
+    summary = L1GasAnalytics(receipts).by_block()
+    assert summary.keys == [100, 101]
+    assert summary.counts.tolist() == [2, 1]
+    assert summary.l1_ratio.tolist() == [0.25, 0.4]
+
+
+def test_empty():
+    analytics = L1GasAnalytics()
+    assert analytics.total_l1_gas == 0
+    assert len(analytics.by_block()) == 0
+
+
+def test_add_block_range(account, second_account):
+    start = chain.blocks.head.number + 1
+    account.transfer(second_account, 1)
+    account.transfer(second_account, 1)
+    analytics = L1GasAnalytics()
+    analytics.add_block_range(start, chain.blocks.head.number)
+    assert len(analytics) == 2
+    assert analytics.by_sender()[account.address][1] == 2
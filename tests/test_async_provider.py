@@ -0,0 +1,258 @@
+import asyncio
+import json
+import threading
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import PropertyMock
+
+import pytest
+from ape import chain
+from ape.exceptions import ProviderError, TransactionNotFoundError
+from eth_pydantic_types import HexBytes
+from eth_utils import to_hex
+
+from ape_arbitrum.async_provider import AsyncArbitrumProvider
+from ape_arbitrum.ecosystem import ApeArbitrumError
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return HexBytes(value).to_0x_hex()
+    if isinstance(value, int) and not isinstance(value, bool):
+        return to_hex(value)
+    if isinstance(value, Mapping):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_to_json(item) for item in value]
+
+    return value
+
+
+class NodeStandIn:
+    """
+    A JSON-RPC HTTP endpoint in front of the local test provider.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.requests: list[str] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def uri(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, request: dict) -> dict:
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        with self._lock:
+            self.requests.append(request["method"])
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+        try:
+            # NOTE: Give concurrent requests a chance to overlap.
+            threading.Event().wait(0.01)
+            with self._lock:
+                result = self.provider.web3.manager.request_blocking(
+                    request["method"], request.get("params", [])
+                )
+
+        except Exception as err:
+            return {**response, "error": {"code": -32000, "message": str(err)}}
+
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        return {**response, "result": _to_json(result)}
+
+    def _create_handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                data = json.dumps(stand_in.respond(body)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def node(eth_tester_provider):
+    with NodeStandIn(eth_tester_provider) as stand_in:
+        yield stand_in
+
+
+def run(node, fn, **kwargs):
+    async def main():
+        async with AsyncArbitrumProvider(node.uri, **kwargs) as provider:
+            return await fn(provider)
+
+    return asyncio.run(main())
+
+
+def test_get_block(node):
+    chain.mine(2)
+    head = chain.blocks.head
+
+    async def fn(provider):
+        return await provider.get_block_number(), await provider.get_block("latest")
+
+    number, block = run(node, fn)
+    assert number == head.number
+    assert block.number == head.number
+    assert block.hash == head.hash
+
+
+def test_gather(node):
+    chain.mine(5)
+
+    async def fn(provider):
+        return await asyncio.gather(*(provider.get_block(n) for n in range(5)))
+
+    blocks = run(node, fn)
+    assert [block.number for block in blocks] == list(range(5))
+    assert node.max_in_flight > 1
+
+
+def test_max_concurrency(node):
+    chain.mine(5)
+
+    async def fn(provider):
+        return await provider.make_requests(
+            ("eth_getBlockByNumber", [to_hex(n), False]) for n in range(5)
+        )
+
+    results = run(node, fn, max_concurrency=1)
+    assert [int(block["number"], 16) for block in results] == list(range(5))
+    assert node.max_in_flight == 1
+
+
+def test_get_receipt(node, account, second_account):
+    sent = account.transfer(second_account, 123)
+
+    async def fn(provider):
+        return await provider.get_receipt(sent.txn_hash, required_confirmations=0)
+
+    receipt = run(node, fn)
+    assert receipt.txn_hash == sent.txn_hash
+    assert receipt.block_number == sent.block_number
+    assert receipt.transaction.value == 123
+    assert receipt.sender == account.address
+
+
+def test_get_receipt_pending_does_not_starve(node, mocker):
+    mocker.patch("ape_arbitrum.async_provider.MIN_CONFIRMATIONS_POLL_INTERVAL", 0.05)
+    unknown = "0x" + "ab" * 32
+
+    async def fn(provider):
+        pending = asyncio.create_task(provider.get_receipt(unknown, timeout=1))
+        await asyncio.sleep(0.1)
+        # The one concurrency slot is free between polls of the pending receipt.
+        number = await asyncio.wait_for(provider.get_block_number(), timeout=0.5)
+        with pytest.raises(TransactionNotFoundError):
+            await pending
+
+        return number
+
+    assert run(node, fn, max_concurrency=1) == chain.blocks.head.number
+    assert node.requests.count("eth_getTransactionReceipt") > 2
+
+
+def test_get_receipt_awaits_confirmations(node, account, second_account, mocker):
+    sent = account.transfer(second_account, 1)
+    sleep = mocker.patch("ape_arbitrum.async_provider.asyncio.sleep", new=mocker.AsyncMock())
+    sleep.side_effect = lambda *_: chain.mine(1)
+
+    async def fn(provider):
+        return await provider.get_receipt(sent.txn_hash, required_confirmations=2)
+
+    receipt = run(node, fn)
+    assert chain.blocks.head.number >= receipt.block_number + 2
+    assert sleep.call_count == 2
+
+
+def test_get_receipt_without_sync_lookups(
+    node, account, second_account, eth_tester_provider, mocker
+):
+    sent = account.transfer(second_account, 1)
+    chain.mine(2)
+    error = AssertionError("Looked up through the synchronous provider.")
+    mocker.patch.object(
+        type(eth_tester_provider), "chain_id", new_callable=PropertyMock, side_effect=error
+    )
+    for name in ("block_time", "required_confirmations"):
+        mocker.patch.object(
+            type(eth_tester_provider.network), name, new_callable=PropertyMock, side_effect=error
+        )
+
+    async def fn(provider):
+        return await provider.get_receipt(sent.txn_hash)
+
+    receipt = run(node, fn, required_confirmations=2)
+    assert receipt.required_confirmations == 2
+    assert receipt.transaction.chain_id == eth_tester_provider.web3.eth.chain_id
+
+
+def test_poll_interval():
+    assert AsyncArbitrumProvider("http://127.0.0.1:1").poll_interval == 0.5
+    assert AsyncArbitrumProvider("http://127.0.0.1:1", block_time=0).poll_interval == 0.1
+
+
+def test_send_transaction(node, arbitrum, account, second_account):
+    txn = arbitrum.create_transaction(receiver=second_account.address, value=7)
+    txn = account.sign_transaction(account.prepare_transaction(txn))
+
+    async def fn(provider):
+        return await provider.send_transaction(txn, required_confirmations=0)
+
+    receipt = run(node, fn)
+    assert receipt.transaction.value == 7
+    assert not receipt.failed
+
+
+def test_send_call(node, arbitrum, account):
+    txn = arbitrum.create_transaction(receiver=account.address, sender=account.address)
+
+    async def fn(provider):
+        return await provider.send_call(txn)
+
+    assert run(node, fn) == HexBytes("")
+
+
+def test_request_error(node):
+    async def fn(provider):
+        return await provider.make_request("eth_notAMethod", [])
+
+    with pytest.raises(ProviderError, match="eth_notAMethod"):
+        run(node, fn)
+
+
+def test_not_connected():
+    provider = AsyncArbitrumProvider("http://127.0.0.1:1")
+    with pytest.raises(ApeArbitrumError, match="not connected"):
+        asyncio.run(provider.get_block_number())
@@ -0,0 +1,270 @@
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from ape import chain
+from ape.exceptions import ProviderError
+from ape_node import Node
+from requests.exceptions import HTTPError
+from web3 import Web3
+
+from ape_arbitrum.balancer import ArbitrumNode, LoadBalancedProvider
+from ape_arbitrum.cache import BlockCache
+from ape_arbitrum.ecosystem import ArbitrumConfig, LoadBalancerConfig
+
+
+class EndpointStandIn:
+    """
+    A JSON-RPC HTTP endpoint with injected latency, lag and failures.
+    """
+
+    def __init__(self, latency: float = 0, block_number: int = 100):
+        self.latency = latency
+        self.block_number = block_number
+        self.status = 200
+        self.rate_limited = False
+        self.requests: Counter = Counter()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def uri(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, request: dict) -> dict:
+        self.requests[request["method"]] += 1
+        response = {"jsonrpc": "2.0", "id": request["id"]}
+        if self.rate_limited:
+            return {**response, "error": {"code": -32005, "message": "rate limited"}}
+
+        if request["method"] == "eth_blockNumber":
+            return {**response, "result": hex(self.block_number)}
+
+        return {**response, "result": self.uri}
+
+    def _create_handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if isinstance(request, list):
+                    body = json.dumps([stand_in.respond(item) for item in request]).encode()
+                else:
+                    body = json.dumps(stand_in.respond(request)).encode()
+
+                time.sleep(stand_in.latency)
+                self.send_response(stand_in.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def fast():
+    with EndpointStandIn() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def slow():
+    with EndpointStandIn(latency=0.05) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def balancer(fast, slow):
+    provider = LoadBalancedProvider([fast.uri, slow.uri], failure_cooldown=60)
+    yield provider
+    provider.close()
+
+
+def test_latency_weighted(balancer, fast, slow):
+    balancer.check_health()
+    assert [e.healthy for e in balancer.endpoints] == [True, True]
+    for _ in range(40):
+        balancer.make_request("eth_call", [])
+
+    # NOTE: The fast endpoint is over 10 times faster, so it gets most requests.
+    assert fast.requests["eth_call"] > 3 * slow.requests["eth_call"]
+
+
+def test_hedged_reads(fast, slow):
+    slow.latency = 1
+    balancer = LoadBalancedProvider([slow.uri, fast.uri], hedge_delay=0.05)
+    # NOTE: Make the slow endpoint look fastest, so it gets the first request.
+    balancer.endpoints[0].latency, balancer.endpoints[1].latency = 0.001, 10
+
+    start = time.monotonic()
+    response = balancer.make_request("eth_call", [])
+    assert time.monotonic() - start < 0.5
+    assert response["result"] == fast.uri
+    assert slow.requests["eth_call"] == fast.requests["eth_call"] == 1
+
+
+def test_sticky_writes(balancer, fast, slow):
+    balancer.check_health()
+    uris = {balancer.make_request("eth_getTransactionCount", [])["result"] for _ in range(10)}
+    uris |= {balancer.make_request("eth_sendRawTransaction", [])["result"] for _ in range(10)}
+    assert uris == {fast.uri}
+    assert balancer.sticky_endpoint.uri == fast.uri
+
+    # An unhealthy sticky endpoint is replaced.
+    fast.status = 500
+    balancer.check_health()
+    assert balancer.make_request("eth_sendRawTransaction", [])["result"] == slow.uri
+
+
+def test_failover(balancer, fast, slow, mocker):
+    # NOTE: Pick the first available endpoint, rather than at random.
+    mocker.patch.object(balancer._random, "choices", side_effect=lambda c, **_: c[:1])
+    fast.status = 500
+    for _ in range(5):
+        assert balancer.make_request("eth_call", [])["result"] == slow.uri
+
+    # The failed endpoint is skipped until its cooldown passes.
+    assert fast.requests["eth_call"] == 1
+    assert balancer.stats[0]["healthy"] is False
+
+    fast.status = 200
+    balancer.check_health()
+    assert balancer.stats[0]["healthy"] is True
+
+
+def test_failover_rate_limited(balancer, fast, slow):
+    fast.rate_limited = True
+    for _ in range(5):
+        assert balancer.make_request("eth_call", [])["result"] == slow.uri
+
+    # When every endpoint is rate-limiting, the error is returned.
+    slow.rate_limited = True
+    fast.requests.clear()
+    balancer.endpoints[0].retry_at = 0
+    response = balancer.make_request("eth_call", [])
+    assert response["error"]["code"] == -32005
+
+
+def test_all_endpoints_fail(balancer, fast, slow):
+    fast.status = slow.status = 500
+    with pytest.raises(HTTPError):
+        balancer.make_request("eth_call", [])
+
+
+def test_sticky_timeout(fast, slow):
+    balancer = LoadBalancedProvider([slow.uri, fast.uri], request_kwargs={"timeout": 0.01})
+    slow.latency = 0.5
+    with pytest.raises(ProviderError, match="failed"):
+        balancer.make_request("eth_sendRawTransaction", [])
+
+    # The request may have been sent, so it isn't sent to another endpoint.
+    assert fast.requests["eth_sendRawTransaction"] == 0
+    balancer.close()
+
+
+def test_lagging_endpoint(balancer, fast, slow):
+    slow.block_number = 50
+    balancer.check_health()
+    assert [e.block_number for e in balancer.endpoints] == [100, 50]
+    assert [e.healthy for e in balancer.endpoints] == [True, False]
+    for _ in range(10):
+        assert balancer.make_request("eth_call", [])["result"] == fast.uri
+
+
+def test_batch_request(balancer, fast):
+    balancer.check_health()
+    web3 = Web3(balancer)
+    with web3.batch_requests() as batch:
+        batch.add(web3.eth.get_block_number())
+        batch.add(web3.eth.get_block_number())
+        assert batch.execute() == [100, 100]
+
+
+def test_health_check_thread(balancer, fast, mocker):
+    balancer.health_check_interval = 0.01
+    check_health = mocker.spy(balancer, "check_health")
+    balancer.start_health_checks()
+    time.sleep(0.2)
+    balancer.stop_health_checks()
+    assert check_health.call_count > 2
+
+
+def test_close(balancer, fast):
+    balancer.start_health_checks()
+    balancer.close()
+    assert balancer._health_thread is None
+    with pytest.raises(RuntimeError):
+        balancer._executor.submit(print)
+
+
+def test_config():
+    obj = ArbitrumConfig.model_validate(
+        {"mainnet": {"load_balancer": {"endpoints": ["https://a.example"], "hedge_delay": None}}}
+    )
+    assert obj.mainnet.load_balancer.endpoints == ["https://a.example"]
+    assert obj.mainnet.load_balancer.hedge_delay is None
+    assert obj.nova.load_balancer.endpoints == []
+    assert obj.nova.is_mainnet
+
+
+def test_provider_plugin():
+    from ape_arbitrum import providers
+
+    assert {cls for _, name, cls in providers() if name != "local"} == {ArbitrumNode}
+
+
+def test_provider_name(networks):
+    provider = networks.arbitrum.mainnet.get_provider("node")
+    assert isinstance(provider, ArbitrumNode)
+    assert provider.load_balancer is None
+
+
+def test_provider_load_balancer(networks, fast, slow, mocker):
+    config = LoadBalancerConfig(endpoints=[fast.uri, slow.uri], hedge_delay=None)
+    mocker.patch.object(ArbitrumNode, "_get_load_balancer_config", return_value=config)
+    provider = networks.arbitrum.mainnet.get_provider("node")
+    provider._set_web3()
+    assert provider.load_balancer is provider.web3.provider
+    assert provider.load_balancer.hedge_delay is None
+    assert provider.uri == fast.uri
+    assert provider.http_uri in (fast.uri, slow.uri)
+    assert provider.web3.eth.block_number == 100
+
+    provider.disconnect()
+    assert provider.load_balancer is None
+
+
+def test_provider_block_cache(networks, mocker):
+    chain.mine(1)
+    head = chain.blocks.head
+    get_block = mocker.patch.object(Node, "get_block", return_value=head)
+    provider = networks.arbitrum.mainnet.get_provider("node")
+    assert provider.get_block(head.number) is head
+
+    provider._block_cache = BlockCache(unsafe_ttl=60)
+    assert provider.get_block(head.number) is head
+    assert provider.get_block(head.number) is head
+    assert get_block.call_count == 2
+    assert provider._block_cache.hits == 1
+
+    provider.disconnect()
+    assert provider._block_cache is None
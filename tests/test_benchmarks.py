@@ -0,0 +1,200 @@
+"""
+Performance benchmarks of the plugin's hot paths, run against the local test provider
+with blocks and receipts in the format of Arbitrum One (``mainnet``) and Nova nodes.
+
+The benchmarks are skipped unless ``--benchmark`` is given. Run them without
+coverage, as tracing slows everything down (and skips the baseline comparison)::
+
+    pytest -m benchmark --benchmark --no-cov
+
+Each benchmark fails when it is slower, relative to a reference operation timed
+in the same run, or uses more memory per operation, than
+``tests/data/benchmarks/baseline.json`` allows (see ``--benchmark-tolerance``).
+After intended changes, store a new baseline with ``--benchmark-save``.
+
+The blocks are recorded from a node with this module, e.g.::
+
+    python -m tests.test_benchmarks mainnet https://arb1.arbitrum.io/rpc
+    python -m tests.test_benchmarks nova https://nova.arbitrum.io/rpc
+"""
+
+import json
+import subprocess
+import sys
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+from ethpm_types import MethodABI
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from web3._utils.rpc_abi import RPC
+
+from ape_arbitrum.constants import LOCAL_GAS_LIMIT
+from ape_arbitrum.ecosystem import ArbitrumReceipt, LazyArbitrumReceipt
+
+pytestmark = pytest.mark.benchmark
+
+DATA = Path(__file__).parent / "data" / "benchmarks"
+RECEIVER = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+TRANSFER_ABI = MethodABI.model_validate(
+    {
+        "type": "function",
+        "name": "transfer",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    }
+)
+IMPORT_ROUNDS = 5
+
+
+def load(network: str) -> tuple[dict, list[dict]]:
+    """
+    Load a block and its receipts, formatted as by web3 and merged with
+    their transactions, as the provider gives them to the ecosystem.
+    """
+    data = json.loads((DATA / f"{network}.json").read_text())
+    block = dict(PYTHONIC_RESULT_FORMATTERS[RPC.eth_getBlockByNumber](data["block"]))
+    transactions = {txn["hash"]: dict(txn) for txn in block["transactions"]}
+    receipts = []
+    for receipt in data["receipts"]:
+        receipt = dict(PYTHONIC_RESULT_FORMATTERS[RPC.eth_getTransactionReceipt](receipt))
+        receipts.append({**transactions[receipt["transactionHash"]], **receipt})
+
+    return block, receipts
+
+
+def record(network: str, uri: str, block_id: str = "latest"):
+    """
+    Record a block, with its transactions and receipts, from a node.
+    """
+
+    def request(method: str, params: list) -> Any:
+        body = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        response = requests.post(uri, json=body, timeout=30)
+        response.raise_for_status()
+        if error := response.json().get("error"):
+            raise RuntimeError(f"{method} failed: {error}")
+
+        return response.json()["result"]
+
+    tag = block_id if block_id in ("latest", "safe", "finalized") else hex(int(block_id))
+    block = request("eth_getBlockByNumber", [tag, True])
+    receipts = request("eth_getBlockReceipts", [block["number"]])
+    data = {"block": block, "receipts": receipts}
+    (DATA / f"{network}.json").write_text(json.dumps(data, indent=2) + "\n")
+
+
+@pytest.fixture(scope="module", params=("mainnet", "nova"))
+def recorded(request):
+    return request.param, *load(request.param)
+
+
+def time_import(module: str) -> tuple[float, int]:
+    # NOTE: Import in a new interpreter, after ape, so only the plugin's import is measured.
+    code = f"""
+import sys, time, tracemalloc
+import ape
+if sys.argv[1] == "memory":
+    tracemalloc.start()
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, tracemalloc.get_traced_memory()[1])
+"""
+    seconds = []
+    for mode in ["time"] * IMPORT_ROUNDS + ["memory"]:
+        output = subprocess.check_output([sys.executable, "-c", code, mode], text=True)
+        elapsed, peak_bytes = output.split()
+        seconds.append(float(elapsed))
+
+    return min(seconds[:-1]), int(peak_bytes)
+
+
+@pytest.mark.parametrize("module", ["ape_arbitrum", "ape_arbitrum.ecosystem"])
+def test_import(benchmark, module):
+    seconds, peak_bytes = time_import(module)
+    benchmark.record(f"import {module}", seconds, peak_bytes)
+
+
+@pytest.mark.parametrize("txn_type", [0, 2])
+def test_create_transaction(benchmark, arbitrum, txn_type):
+    def create():
+        return arbitrum.create_transaction(
+            receiver=RECEIVER, value="1 gwei", data="0x12345678", type=txn_type
+        )
+
+    assert create().type == txn_type
+    benchmark(f"create_transaction[type-{txn_type}]", create)
+
+
+def test_create_transactions(benchmark, arbitrum):
+    kwargs_list = [
+        {"receiver": RECEIVER, "value": "1 gwei", "nonce": nonce, "type": 2}
+        for nonce in range(1_000)
+    ]
+    assert len(arbitrum.create_transactions(kwargs_list)) == 1_000
+    benchmark("create_transactions[1000]", lambda: arbitrum.create_transactions(kwargs_list), 1_000)
+
+
+def test_encode_transaction(benchmark, arbitrum):
+    def encode():
+        return arbitrum.encode_transaction(
+            RECEIVER, TRANSFER_ABI, RECEIVER, 10**18, gas_limit=LOCAL_GAS_LIMIT
+        )
+
+    assert encode().gas_limit == LOCAL_GAS_LIMIT
+    benchmark("encode_transaction", encode)
+
+
+def test_decode_receipt(benchmark, arbitrum, recorded):
+    network, _, receipts = recorded
+
+    def decode():
+        return [arbitrum.decode_receipt(dict(data)) for data in receipts]
+
+    assert all(isinstance(receipt, ArbitrumReceipt) for receipt in decode())
+    benchmark(f"decode_receipt[{network}]", decode, len(receipts))
+
+
+def test_decode_receipt_lazy(benchmark, arbitrum, recorded):
+    network, _, receipts = recorded
+
+    def decode():
+        return [arbitrum.decode_receipt(dict(data), lazy=True) for data in receipts]
+
+    assert all(isinstance(receipt, LazyArbitrumReceipt) for receipt in decode())
+    benchmark(f"decode_receipt_lazy[{network}]", decode, len(receipts))
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_decode_receipts(benchmark, arbitrum, recorded, trusted):
+    network, _, receipts = recorded
+
+    def decode():
+        return list(arbitrum.decode_receipts([dict(data) for data in receipts], trusted=trusted))
+
+    assert len(decode()) == len(receipts)
+    name = "decode_receipts_trusted" if trusted else "decode_receipts"
+    benchmark(f"{name}[{network}]", decode, len(receipts))
+
+
+def test_decode_receipts_trusted_10k(benchmark, arbitrum):
+    _, receipts = load("mainnet")
+    batch = list(islice(cycle(receipts), 10_000))
+
+    def decode():
+        return list(arbitrum.decode_receipts([dict(data) for data in batch], trusted=True))
+
+    benchmark("decode_receipts_trusted[10k]", decode, len(batch), repeat=3, memory_rounds=1)
+
+
+def test_decode_block(benchmark, arbitrum, recorded):
+    network, block, _ = recorded
+    assert arbitrum.decode_block(dict(block)).num_transactions == len(block["transactions"])
+    benchmark(f"decode_block[{network}]", lambda: arbitrum.decode_block(dict(block)))
+
+
+if __name__ == "__main__":
+    record(*sys.argv[1:])
@@ -0,0 +1,213 @@
+from unittest.mock import PropertyMock
+
+import pytest
+from ape import chain
+from eth_pydantic_types import HexBytes
+
+from ape_arbitrum.cache import BLOCK_SIZE_ESTIMATE, BlockCache
+
+
+@pytest.fixture
+def cache():
+    # NOTE: Keep unsafe blocks from expiring (and checking finality) during the tests.
+    return BlockCache(unsafe_ttl=60)
+
+
+@pytest.fixture
+def get_block(eth_tester_provider, mocker):
+    return mocker.spy(type(eth_tester_provider), "get_block")
+
+
+def fork(block, name: bytes):
+    return block.model_copy(update={"hash": HexBytes(name.ljust(32, b"\x00"))})
+
+
+def test_get_block(cache, get_block):
+    chain.mine(3)
+    head = chain.blocks.head
+    get_block.reset_mock()
+
+    assert cache.get_block(head.number).hash == head.hash
+    assert cache.get_block(head.number).hash == head.hash
+    assert cache.get_block(head.hash).number == head.number
+    assert get_block.call_count == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.stats["blocks"] == 1
+
+
+def test_get_block_tag(cache, get_block):
+    chain.mine(1)
+    get_block.reset_mock()
+
+    # Tags are always requested, but the blocks are cached by number.
+    latest = cache.get_block("latest")
+    cache.get_block("latest")
+    cache.get_block(latest.number)
+    assert get_block.call_count == 2
+    assert cache.hits == 1
+
+
+def test_unsafe_blocks_expire(get_block, mocker):
+    cache = BlockCache(unsafe_ttl=1)
+    chain.mine(1)
+    number = chain.blocks.head.number
+    monotonic = mocker.patch("ape_arbitrum.cache.time.monotonic", return_value=100)
+    cache.set_finalized(0)
+    cache.get_block(number)
+
+    monotonic.return_value = 100.5
+    cache.get_block(number)
+    assert cache.hits == 1
+
+    monotonic.return_value = 102
+    get_block.reset_mock()
+    cache.get_block(number)
+    assert cache.misses == 2
+    assert [c.args[1] for c in get_block.call_args_list] == [number]
+
+
+def test_expired_blocks_check_finality(get_block, mocker):
+    cache = BlockCache(unsafe_ttl=1)
+    chain.mine(1)
+    number = chain.blocks.head.number
+    monotonic = mocker.patch("ape_arbitrum.cache.time.monotonic", return_value=100)
+    cache.get_block(number)
+
+    # NOTE: The local network finalizes blocks right away.
+    monotonic.return_value = 102
+    get_block.reset_mock()
+    cache.get_block(number)
+    assert cache.hits == 1
+    assert cache.finalized_block == number
+    assert [c.args[1] for c in get_block.call_args_list] == ["finalized"]
+
+
+def test_finalized_blocks_do_not_expire(mocker):
+    cache = BlockCache(unsafe_ttl=1)
+    chain.mine(2)
+    number = chain.blocks.head.number
+    monotonic = mocker.patch("ape_arbitrum.cache.time.monotonic", return_value=100)
+    cache.get_block(number - 1)
+    cache.set_finalized(number - 1)
+
+    monotonic.return_value = 1_000
+    cache.get_block(number - 1)
+    assert cache.hits == 1
+
+
+def test_reorg_invalidates(cache):
+    chain.mine(3)
+    head = chain.blocks.head
+    for number in range(head.number - 2, head.number + 1):
+        cache.get_block(number)
+
+    assert len(cache) == 3
+
+    # A different block at the same height drops it and the blocks after it.
+    reorged = fork(chain.blocks[head.number - 1], b"reorg")
+    cache.put_block(reorged)
+    assert cache.invalidations == 2
+    assert len(cache) == 2
+    assert cache.get_block(head.number - 1).hash == reorged.hash
+
+    # A parent that doesn't match the cached child drops the child.
+    cache.put_block(chain.blocks[head.number - 2])
+    assert cache.invalidations == 2
+    cache.put_block(fork(chain.blocks[head.number - 2], b"other"))
+    assert head.number - 1 not in cache._entries
+
+
+def test_reorg_keeps_finalized(cache):
+    chain.mine(3)
+    head = chain.blocks.head
+    for number in range(head.number - 2, head.number + 1):
+        cache.get_block(number)
+
+    cache.set_finalized(head.number - 1)
+    cache.invalidate(head.number - 2)
+    assert sorted(cache._entries) == [head.number - 2, head.number - 1]
+
+
+def test_get_receipt(cache, account, second_account, eth_tester_provider, mocker):
+    sent = account.transfer(second_account, 1)
+    get_receipt = mocker.spy(type(eth_tester_provider), "get_receipt")
+
+    assert cache.get_receipt(sent.txn_hash).txn_hash == sent.txn_hash
+    assert cache.get_receipt(sent.txn_hash).txn_hash == sent.txn_hash
+    assert get_receipt.call_count == 1
+
+    # Receipts are dropped along with their block.
+    cache.invalidate(sent.block_number)
+    cache.get_receipt(sent.txn_hash)
+    assert get_receipt.call_count == 2
+
+
+def test_get_block_receipts(cache, arbitrum, account, second_account, mocker):
+    sent = account.transfer(second_account, 1)
+    decode = mocker.spy(type(arbitrum), "decode_block_receipts")
+
+    (receipt,) = cache.get_block_receipts(sent.block_number)
+    assert receipt.txn_hash == sent.txn_hash
+    assert [r.txn_hash for r in cache.get_block_receipts(sent.block_number)] == [sent.txn_hash]
+    assert cache.get_receipt(sent.txn_hash) is receipt
+    assert decode.call_count == 1
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_put_lazy_receipts(arbitrum, receipt_data, trusted):
+    receipt_data["logs"] = [{"data": HexBytes(b"\x01" * 64), "topics": [HexBytes(b"\x02" * 32)]}]
+    eager = arbitrum.decode_receipt(dict(receipt_data), trusted=trusted)
+    lazy = arbitrum.decode_receipt(dict(receipt_data), lazy=True, trusted=trusted)
+    eager_cache, lazy_cache = BlockCache(), BlockCache()
+    eager_cache.put_receipts([eager])
+    lazy_cache.put_receipts([lazy])
+
+    # Lazy receipts are sized without creating their transaction and logs.
+    assert "transaction" not in lazy.__dict__
+    assert "logs" not in lazy.__dict__
+    assert lazy_cache.size == eager_cache.size
+
+
+def test_get_block_with_only_receipts_cached(cache, account, second_account, get_block):
+    sent = account.transfer(second_account, 1)
+    cache.get_receipt(sent.txn_hash)
+    get_block.reset_mock()
+
+    # The block of a cached receipt is still a miss, and only counted once.
+    assert cache.get_block(sent.block_number).number == sent.block_number
+    assert get_block.call_count == 1
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_max_bytes():
+    cache = BlockCache(max_bytes=2 * BLOCK_SIZE_ESTIMATE, unsafe_ttl=60)
+    chain.mine(3)
+    head = chain.blocks.head.number
+    for number in range(head - 2, head + 1):
+        cache.get_block(number)
+
+    assert sorted(cache._entries) == [head - 1, head]
+    assert cache.size == 2 * BLOCK_SIZE_ESTIMATE
+    assert cache.evictions == 1
+
+    # Lookups make blocks most-recently-used.
+    cache.get_block(head - 1)
+    cache.get_block(head - 2)
+    assert sorted(cache._entries) == [head - 2, head - 1]
+
+
+def test_ecosystem_block_cache(arbitrum):
+    assert arbitrum.block_cache is arbitrum.block_cache
+    assert arbitrum.block_cache.max_bytes == 64 * 1024 * 1024
+
+
+def test_ecosystem_block_cache_per_chain(arbitrum, eth_tester_provider, mocker):
+    cache = arbitrum.block_cache
+    chain_id = mocker.patch.object(
+        type(eth_tester_provider), "chain_id", new_callable=PropertyMock, return_value=42161
+    )
+    assert arbitrum.block_cache is not cache
+    assert arbitrum.block_cache is arbitrum.get_block_cache(42161)
+
+    chain_id.return_value = 1337
+    assert arbitrum.block_cache is cache
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from ape_arbitrum.columnar import (
+    STATUS_UNKNOWN,
+    ReceiptStore,
+    get_txn_hash,
+    receipts_to_array,
+)
+
+# NOTE: Ends in zero-bytes, to show they are not dropped.
+TXN_HASH = "0x8b8c74711aa2e117a307f8a96a93350e5ca7e01a7bf39dbb7a824e6a6fc30000"
+
+
+@pytest.fixture
+def receipts(arbitrum, receipt_data):
+    return [
+        arbitrum.decode_receipt(
+            {
+                **receipt_data,
+                "blockNumber": block_number,
+                "hash": TXN_HASH,
+                "gasUsed": 1_000 + block_number,
+                "gasUsedForL1": block_number,
+            }
+        )
+        for block_number in (12, 10, 11)
+    ]
+
+
+def test_receipts_to_array(receipts):
+    actual = receipts_to_array(receipts)
+    assert actual["block_number"].tolist() == [10, 11, 12]
+    assert actual["gas_used"].tolist() == [1_010, 1_011, 1_012]
+    assert actual["gas_used_for_L1"].tolist() == [10, 11, 12]
+    assert actual["type"].tolist() == [106, 106, 106]
+    assert actual["status"].tolist() == [1, 1, 1]
+    assert get_txn_hash(actual[0]) == TXN_HASH
+
+
+def test_receipts_to_array_no_status(receipts):
+    receipt = receipts[0].model_copy(update={"status": None})
+    assert receipts_to_array([receipt])["status"].tolist() == [STATUS_UNKNOWN]
+
+
+def test_receipts_to_array_empty():
+    assert len(receipts_to_array([])) == 0
+
+
+def test_store(receipts, tmp_path):
+    store = ReceiptStore(tmp_path)
+    assert store.write(receipts[:2])
+    assert store.write(receipts[2:])
+    assert store.write([]) is None
+    assert len(store) == 3
+
+    actual = store.query(11, 12)
+    assert actual["block_number"].tolist() == [11, 12]
+    assert store.query(13).size == 0
+    assert store.query()["gas_used_for_L1"].sum() == 33
+
+
+def test_store_unsorted_array(receipts, tmp_path):
+    array = receipts_to_array(receipts)[::-1]
+    store = ReceiptStore(tmp_path)
+    path = store.write(array)
+    assert path.name.startswith("000000000010-000000000012-")
+    assert store.query(11, 11)["block_number"].tolist() == [11]
+
+
+def test_store_memory_mapped(receipts, tmp_path):
+    store = ReceiptStore(tmp_path)
+    store.write(receipts)
+    (path, *_), *_ = store._files
+    assert isinstance(store._load(path), np.memmap)
+
+
+def test_store_missing_directory(tmp_path):
+    store = ReceiptStore(tmp_path / "missing")
+    assert len(store) == 0
+    assert store.query().size == 0
@@ -1,3 +1,4 @@
+from ape_ethereum.ecosystem import NetworkConfig
 from ape_ethereum.transactions import TransactionType
 
 from ape_arbitrum.ecosystem import LOCAL_GAS_LIMIT, ArbitrumConfig
@@ -28,3 +29,41 @@ def test_custom_network():
     data = {"apenet": {"required_confirmations": 333}}
     obj = ArbitrumConfig.model_validate(data)
     assert obj.apenet.required_confirmations == 333
+
+
+def test_gas_estimate_cache_not_custom_network():
+    data = {"gas_estimate_cache": {"enabled": True, "ttl": 30}}
+    obj = ArbitrumConfig.model_validate(data)
+    assert obj.gas_estimate_cache.enabled
+    assert obj.gas_estimate_cache.ttl == 30
+    assert not isinstance(obj.gas_estimate_cache, NetworkConfig)
+
+
+def test_instrumentation():
+    assert not ArbitrumConfig.model_validate({}).instrumentation.enabled
+    obj = ArbitrumConfig.model_validate({"instrumentation": {"enabled": True}})
+    assert obj.instrumentation.enabled
+
+
+def test_block_cache():
+    obj = ArbitrumConfig.model_validate({"block_cache": {"max_bytes": 1024, "unsafe_ttl": 0.5}})
+    assert obj.block_cache.max_bytes == 1024
+    assert obj.block_cache.unsafe_ttl == 0.5
+    assert not obj.block_cache.enabled
+
+
+def test_trusted_decode():
+    obj = ArbitrumConfig.model_validate({})
+    assert not obj.trusted_decode.enabled
+    assert obj.trusted_decode.validation_sample_rate == 0.01
+    obj = ArbitrumConfig.model_validate({"trusted_decode": {"enabled": True}})
+    assert obj.trusted_decode.enabled
+
+
+def test_fee_oracle():
+    obj = ArbitrumConfig.model_validate({})
+    assert not obj.fee_oracle.enabled
+    assert obj.fee_oracle.window == 20
+    obj = ArbitrumConfig.model_validate({"fee_oracle": {"enabled": True, "multiplier": 2}})
+    assert obj.fee_oracle.enabled
+    assert obj.fee_oracle.multiplier == 2
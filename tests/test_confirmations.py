@@ -0,0 +1,63 @@
+import pytest
+from ape import chain
+
+from ape_arbitrum.confirmations import ConfirmationTracker
+from ape_arbitrum.ecosystem import ApeArbitrumError
+
+
+@pytest.fixture
+def create_receipt(arbitrum, receipt_data):
+    def fn(required_confirmations: int, **kwargs):
+        data = {
+            **receipt_data,
+            "blockNumber": chain.blocks.head.number,
+            "required_confirmations": required_confirmations,
+            **kwargs,
+        }
+        return arbitrum.decode_receipt(data)
+
+    return fn
+
+
+def test_register_no_confirmations_required(create_receipt):
+    receipt = create_receipt(0)
+    tracker = ConfirmationTracker([receipt])
+    assert tracker.resolved == [receipt]
+    assert not tracker.pending
+
+
+def test_register_failed(create_receipt):
+    receipt = create_receipt(2, status=0)
+    tracker = ConfirmationTracker([receipt])
+    assert tracker.resolved == [receipt]
+
+
+def test_poll(create_receipt, eth_tester_provider, mocker):
+    first = create_receipt(1)
+    second = create_receipt(2)
+    tracker = ConfirmationTracker([first, second])
+    get_block = mocker.spy(type(eth_tester_provider), "get_block")
+
+    assert tracker.poll() == []
+    chain.mine(1)
+    assert tracker.poll() == [first]
+    chain.mine(1)
+    assert tracker.poll() == [second]
+    assert tracker.resolved == [first, second]
+
+    # Only one chain-head check per poll, regardless of the number of receipts.
+    assert get_block.call_count == 3
+
+
+def test_wait(create_receipt, mocker):
+    receipts = [create_receipt(1) for _ in range(3)]
+    tracker = ConfirmationTracker(receipts)
+    mocker.patch("ape_arbitrum.confirmations.time.sleep", side_effect=lambda _: chain.mine(1))
+    assert tracker.wait(show_progress=False) == receipts
+
+
+def test_wait_timeout(create_receipt, mocker):
+    tracker = ConfirmationTracker([create_receipt(1)])
+    mocker.patch("ape_arbitrum.confirmations.time.sleep")
+    with pytest.raises(ApeArbitrumError, match="Timed out"):
+        tracker.wait(timeout=0, show_progress=False)
@@ -1,10 +1,27 @@
+import asyncio
+from unittest.mock import PropertyMock
+
 import pytest
+from ape.exceptions import TransactionError
 from ape.utils.misc import DEFAULT_LIVE_NETWORK_BASE_FEE_MULTIPLIER
 from ape_ethereum.transactions import TransactionType
 from eth_pydantic_types import HexBytes
 from ethpm_types import MethodABI
 
-from ape_arbitrum.ecosystem import INTERNAL_TRANSACTION_TYPE, LOCAL_GAS_LIMIT, ArbitrumReceipt
+from ape_arbitrum.ecosystem import (
+    CONTRACT_TRANSACTION_TYPE,
+    DEPOSIT_TRANSACTION_TYPE,
+    INTERNAL_TRANSACTION_TYPE,
+    LOCAL_GAS_LIMIT,
+    RETRY_TRANSACTION_TYPE,
+    SUBMIT_RETRYABLE_TRANSACTION_TYPE,
+    UNSIGNED_TRANSACTION_TYPE,
+    ApeArbitrumError,
+    ArbitrumConfig,
+    ArbitrumReceipt,
+    LazyArbitrumReceipt,
+    SubmitRetryableTransaction,
+)
 
 
 @pytest.mark.parametrize(
@@ -42,11 +59,102 @@ def test_create_transaction_type_2(arbitrum, tx_kwargs):
     assert txn.type == TransactionType.DYNAMIC.value
 
 
+@pytest.mark.parametrize(
+    "tx_kwargs",
+    [
+        {"max_fee": 5, "maxFeePerGas": 6},
+        {"maxFee": 6, "max_fee_per_gas": 5},
+        {"maxFeePerGas": 5, "maxFee": 6},
+    ],
+)
+def test_create_transaction_alias_precedence(arbitrum, tx_kwargs):
+    txn = arbitrum.create_transaction(**tx_kwargs)
+    assert txn.max_fee == 5
+
+
+def test_create_transaction_input_and_chain_id_aliases(arbitrum):
+    txn = arbitrum.create_transaction(data="0x01", input="0x02", chain_id=42170)
+    assert txn.data == HexBytes("0x02")
+    assert txn.chain_id == 42170
+
+
 def test_create_transaction_internal(arbitrum):
     tx = arbitrum.create_transaction(type=INTERNAL_TRANSACTION_TYPE, gas_limit=10000)
     assert tx.type == INTERNAL_TRANSACTION_TYPE
 
 
+@pytest.mark.parametrize(
+    "tx_type",
+    (
+        DEPOSIT_TRANSACTION_TYPE,
+        UNSIGNED_TRANSACTION_TYPE,
+        CONTRACT_TRANSACTION_TYPE,
+        RETRY_TRANSACTION_TYPE,
+        SUBMIT_RETRYABLE_TRANSACTION_TYPE,
+    ),
+)
+def test_create_transaction_system(arbitrum, tx_type):
+    tx = arbitrum.create_transaction(type=hex(tx_type))
+    assert tx.type == tx_type
+
+
+def test_create_transaction_submit_retryable(arbitrum):
+    address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    tx = arbitrum.create_transaction(
+        **{
+            "type": "0x69",
+            "from": address,
+            "to": "0x000000000000000000000000000000000000006E",
+            "requestId": f"0x{'00' * 31}01",
+            "depositValue": "0x100",
+            "retryTo": address,
+            "retryData": "0x1234",
+            "maxSubmissionFee": "0x5",
+            "refundTo": address,
+        }
+    )
+    assert isinstance(tx, SubmitRetryableTransaction)
+    assert tx.request_id == HexBytes(1).rjust(32, b"\x00")
+    assert tx.deposit_value == 256
+    assert tx.retry_to == address
+    assert tx.retry_data == HexBytes("0x1234")
+    assert tx.max_submission_fee == 5
+
+
+def test_create_transactions(arbitrum, eth_tester_provider, mocker):
+    chain_id = mocker.patch.object(
+        type(eth_tester_provider),
+        "chain_id",
+        new_callable=PropertyMock,
+        return_value=eth_tester_provider.chain_id,
+    )
+    convert = mocker.spy(type(arbitrum.conversion_manager), "convert")
+    kwargs_list = [
+        {"value": "1 gwei", "type": "0x2"},
+        {"value": "1 gwei", "chain_id": 42170},
+        {"value": 5, "gas_price": 0},
+        {},
+    ]
+    actual = arbitrum.create_transactions(kwargs_list)
+    assert [txn.value for txn in actual] == [10**9, 10**9, 5, 0]
+    assert actual[0].type == TransactionType.DYNAMIC.value
+    assert actual[1].chain_id == 42170
+    assert actual[2].type == TransactionType.STATIC.value
+
+    # The defaults were resolved and each distinct value converted only once for the batch.
+    assert chain_id.call_count == 1
+    conversions = [call.args[1] for call in convert.call_args_list if isinstance(call.args[1], str)]
+    assert conversions == ["1 gwei", "0x2"]
+
+    assert actual == [arbitrum.create_transaction(**kwargs) for kwargs in kwargs_list]
+
+
+def test_create_transactions_thread_pool(arbitrum):
+    kwargs_list = [{"value": i, "nonce": i} for i in range(20)]
+    actual = arbitrum.create_transactions(kwargs_list, max_workers=4)
+    assert [txn.nonce for txn in actual] == list(range(20))
+
+
 @pytest.mark.parametrize(
     "tx_type",
     (
@@ -70,49 +178,201 @@ def test_encode_transaction(tx_type, arbitrum, eth_tester_provider):
     assert actual.gas_limit >= LOCAL_GAS_LIMIT
 
 
-def test_decode_receipt(arbitrum):
-    data = {
-        "required_confirmations": 0,
-        "blockHash": HexBytes("0x01b9030516454bbb3d846bfa31fca8bf5cbdfb735879dcee27fd61f2ae3776b3"),
-        "blockNumber": 121166619,
-        "hash": HexBytes("0x8b8c74711aa2e117a307f8a96a93350e5ca7e01a7bf39dbb7a824e6a6fc3736f"),
-        "chainId": 42161,
-        "from": "0x00000000000000000000000000000000000A4B05",
-        "gas": 0,
-        "gasPrice": 0,
-        "input": HexBytes(
-            "0x6bf6a42d000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000011148fc000000000000000000000000000000000000000000000000000000000738db1b0000000000000000000000000000000000000000000000000000000000000000"  # noqa: E501
-        ),
-        "nonce": 0,
-        "r": HexBytes("0x00"),
-        "s": HexBytes("0x00"),
-        "to": "0x00000000000000000000000000000000000A4B05",
-        "transactionIndex": 0,
-        "type": 106,
-        "v": 0,
-        "value": 0,
-        "transactionHash": HexBytes(
-            "0x8b8c74711aa2e117a307f8a96a93350e5ca7e01a7bf39dbb7a824e6a6fc3736f"
-        ),
-        "logs": [],
-        "contractAddress": None,
-        "effectiveGasPrice": 100000000,
-        "cumulativeGasUsed": 0,
-        "gasUsed": 0,
-        "logsBloom": HexBytes(
-            "0x00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"  # noqa: E501
-        ),
-        "status": 1,
-        "l1BlockNumber": "0x11148fc",
-        "gasUsedForL1": "0x7",
-    }
-    actual = arbitrum.decode_receipt(data)
+def test_encode_transaction_gas_estimate_cache(arbitrum, eth_tester_provider, mocker):
+    config = ArbitrumConfig.model_validate({"gas_estimate_cache": {"enabled": True}})
+    mocker.patch.object(type(arbitrum), "config", new_callable=PropertyMock, return_value=config)
+    mocker.patch.object(
+        type(eth_tester_provider.network),
+        "gas_limit",
+        new_callable=PropertyMock,
+        return_value="auto",
+    )
+    estimate = mocker.patch.object(
+        type(eth_tester_provider), "estimate_gas_cost", return_value=50_000
+    )
+    arbitrum.gas_estimate_cache.clear()
+    abi = MethodABI.model_validate(
+        {
+            "type": "function",
+            "name": "fooAndBar",
+            "stateMutability": "nonpayable",
+            "inputs": [],
+            "outputs": [],
+        }
+    )
+    address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    first = arbitrum.encode_transaction(address, abi, sender=address)
+    second = arbitrum.encode_transaction(address, abi, sender=address)
+    assert first.gas_limit == second.gas_limit == 55_000
+    assert estimate.call_count == 1
+
+
+def test_decode_receipt(arbitrum, receipt_data):
+    actual = arbitrum.decode_receipt(receipt_data)
     assert isinstance(actual, ArbitrumReceipt)
 
     # Check that the receipt decodes HexInt correctly
     assert actual.gas_used_for_L1 == 7
 
 
+def test_decode_receipt_lazy(arbitrum, receipt_data, mocker):
+    create_transaction = mocker.spy(type(arbitrum), "create_transaction")
+    actual = arbitrum.decode_receipt(receipt_data, lazy=True)
+    assert isinstance(actual, LazyArbitrumReceipt)
+    assert actual.gas_used_for_L1 == 7
+    assert actual.status == 1
+    assert create_transaction.call_count == 0
+
+    # The transaction is created on first access and then cached.
+    assert actual.transaction.type == INTERNAL_TRANSACTION_TYPE
+    assert actual.transaction is actual.transaction
+    assert create_transaction.call_count == 1
+    assert actual.logs == []
+
+
+def test_decode_receipt_lazy_model_dump(arbitrum, receipt_data):
+    actual = arbitrum.decode_receipt(receipt_data, lazy=True)
+    expected = arbitrum.decode_receipt(receipt_data)
+    assert actual.model_dump() == expected.model_dump()
+
+
+def test_decode_receipts(arbitrum, receipt_data):
+    other_data = {**receipt_data, "blockNumber": 121166620, "gasUsedForL1": "0x8"}
+    del other_data["required_confirmations"]
+    actual = list(arbitrum.decode_receipts([receipt_data, other_data]))
+    assert [r.block_number for r in actual] == [121166619, 121166620]
+    assert [r.gas_used_for_L1 for r in actual] == [7, 8]
+
+    # Explicit values are kept; missing values use the network defaults.
+    assert actual[0].transaction.chain_id == 42161
+    assert actual[1].transaction.required_confirmations == 0
+
+
+def test_decode_block_receipts(arbitrum, account, second_account):
+    transfer = account.transfer(second_account, 1)
+    actual = arbitrum.decode_block_receipts(transfer.block_number)
+    assert len(actual) == 1
+    assert isinstance(actual[0], ArbitrumReceipt)
+    assert actual[0].txn_hash == transfer.txn_hash
+    assert actual[0].transaction.receiver == second_account.address
+
+
+def test_decode_receipt_empty_snake_case_keys(arbitrum, receipt_data):
+    contract_address = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+    receipt_data.update(
+        block_number=None,
+        blockNumber=5,
+        contract_address=None,
+        contractAddress=contract_address,
+    )
+    actual = arbitrum.decode_receipt(receipt_data)
+    assert actual.block_number == 5
+    assert actual.contract_address == contract_address
+
+
+def test_decode_receipts_trusted(arbitrum, receipt_data):
+    other_data = {**receipt_data, "type": "0x0", "gasUsedForL1": "0x8"}
+    actual = list(arbitrum.decode_receipts([dict(receipt_data), other_data], trusted=True))
+    expected = list(arbitrum.decode_receipts([dict(receipt_data), other_data], trusted=False))
+    assert [r.model_dump() for r in actual] == [r.model_dump() for r in expected]
+    assert actual[0].transaction.type == INTERNAL_TRANSACTION_TYPE
+    assert actual[1].transaction.max_fee == expected[1].transaction.max_fee
+    assert [r.gas_used_for_L1 for r in actual] == [7, 8]
+
+
+@pytest.mark.parametrize("txn_type", (0, 2))
+def test_decode_block_receipts_trusted(arbitrum, account, second_account, txn_type, mocker):
+    transfer = account.transfer(second_account, 1, type=txn_type)
+    create_transaction = mocker.spy(type(arbitrum), "create_transaction")
+    (actual,) = arbitrum.decode_block_receipts(transfer.block_number, trusted=True)
+    (lazy,) = arbitrum.decode_block_receipts(transfer.block_number, lazy=True, trusted=True)
+    create_transaction.reset_mock()
+    (expected,) = arbitrum.decode_block_receipts(transfer.block_number, trusted=False)
+    assert create_transaction.call_count == 1
+    assert isinstance(actual, ArbitrumReceipt)
+    assert isinstance(lazy, LazyArbitrumReceipt)
+    assert actual.model_dump() == expected.model_dump()
+    assert lazy.model_dump() == expected.model_dump()
+    assert actual.transaction.signature == expected.transaction.signature
+    assert actual.transaction.txn_hash.to_0x_hex() == actual.txn_hash == transfer.txn_hash
+
+
+def test_decode_receipts_trusted_sampling(arbitrum, receipt_data, mocker):
+    mocker.patch("ape_arbitrum.ecosystem.random.random", return_value=0)
+    create_transaction = mocker.spy(type(arbitrum), "create_transaction")
+    list(arbitrum.decode_receipts([receipt_data], trusted=True))
+    assert create_transaction.call_count == 1
+
+    # A sampled receipt that differs from its validated decode raises.
+    receipt_data["to"] = receipt_data["to"].lower()
+    with pytest.raises(ApeArbitrumError, match="does not match"):
+        list(arbitrum.decode_receipts([receipt_data], trusted=True))
+
+
+def test_decode_receipt_resolves_trusted_once(arbitrum, receipt_data, mocker):
+    arbitrum.__dict__.pop("_trusted_decode_config", None)
+    config = ArbitrumConfig.model_validate({"trusted_decode": {"enabled": True}})
+    get_config = mocker.patch.object(
+        type(arbitrum), "config", new_callable=PropertyMock, return_value=config
+    )
+    decode = mocker.spy(type(arbitrum), "_decode_trusted_receipt")
+    arbitrum.decode_receipt(dict(receipt_data))
+
+    # The flag isn't read from the config again for each receipt.
+    get_config.return_value = ArbitrumConfig.model_validate({})
+    arbitrum.decode_receipt(dict(receipt_data))
+    arbitrum.decode_receipt(dict(receipt_data))
+    assert decode.call_count == 3
+    arbitrum.__dict__.pop("_trusted_decode_config")
+
+
+@pytest.fixture
+def pending_receipt(arbitrum, receipt_data, mocker):
+    receipt_data["required_confirmations"] = 2
+    receipt = arbitrum.decode_receipt(receipt_data)
+    mocker.patch.object(ArbitrumReceipt, "_block_time", new_callable=PropertyMock, return_value=1)
+    return receipt
+
+
+def test_await_confirmations_sleeps_fractional_interval(pending_receipt, mocker):
+    mocker.patch.object(
+        ArbitrumReceipt, "_confirmations_occurred", new_callable=PropertyMock, side_effect=[0, 1, 2]
+    )
+    sleep = mocker.patch("ape_arbitrum.ecosystem.time.sleep")
+    pending_receipt.await_confirmations()
+    assert sleep.call_count == 1
+    sleep.assert_called_with(0.5)
+
+
+def test_await_confirmations_async(pending_receipt, mocker):
+    confirmations = mocker.patch.object(
+        ArbitrumReceipt,
+        "_confirmations_occurred",
+        new_callable=PropertyMock,
+        side_effect=[0, 1, 2],
+    )
+    mocker.patch("ape_arbitrum.ecosystem.asyncio.sleep", new=mocker.AsyncMock())
+    actual = asyncio.run(pending_receipt.await_confirmations_async())
+    assert actual is pending_receipt
+    assert confirmations.call_count == 3
+
+
+def test_await_sender_nonce_increment_async(pending_receipt, eth_tester_provider, mocker):
+    get_nonce = mocker.patch.object(type(eth_tester_provider), "get_nonce", side_effect=[0, 0, 1])
+    sleep = mocker.patch("ape_arbitrum.ecosystem.asyncio.sleep", new=mocker.AsyncMock())
+    blocking_sleep = mocker.patch("ape_arbitrum.ecosystem.time.sleep")
+    asyncio.run(pending_receipt._await_sender_nonce_increment_async())
+    assert get_nonce.call_count == 3
+    assert sleep.await_count == 2
+    assert blocking_sleep.call_count == 0
+
+    # A nonce that never increases times out.
+    get_nonce.side_effect = None
+    get_nonce.return_value = 0
+    with pytest.raises(TransactionError, match="nonce to increase"):
+        asyncio.run(pending_receipt._await_sender_nonce_increment_async())
+
+
 def test_is_mainnet(arbitrum):
     assert arbitrum.mainnet.is_mainnet
     assert arbitrum.nova.is_mainnet
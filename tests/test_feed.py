@@ -0,0 +1,209 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from websockets.asyncio.server import serve
+
+from ape_arbitrum.ecosystem import ApeArbitrumError
+from ape_arbitrum.feed import (
+    ARBOS_ADDRESS,
+    REQUESTED_SEQUENCE_NUMBER_HEADER,
+    START_BLOCK_SELECTOR,
+    SequencerFeed,
+    SequencerFeedDecoder,
+)
+
+FEED_DATA = Path(__file__).parent / "data" / "sequencer_feed.jsonl"
+SENDER = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+L1_SENDER = "0x3333333333333333333333333333333333333333"
+
+
+@pytest.fixture(scope="module")
+def broadcasts():
+    return [json.loads(line) for line in FEED_DATA.read_text().splitlines()]
+
+
+class FeedStandIn:
+    """
+    Replays recorded feed broadcasts to each connection, starting at the
+    requested sequence number, and then closes the connection.
+    """
+
+    def __init__(self, broadcasts: list[dict], messages_per_connection: int | None = None):
+        self.broadcasts = broadcasts
+        self.messages_per_connection = messages_per_connection
+        self.requested: list[str | None] = []
+        self.uri = ""
+        self._ready = threading.Event()
+        self._stop: asyncio.Future | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread = threading.Thread(target=asyncio.run, args=(self._run(),), daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        self._ready.wait(timeout=10)
+        return self
+
+    def __exit__(self, *args):
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set_result, None)
+
+        self._thread.join(timeout=10)
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = self._loop.create_future()
+        async with serve(self._handle, "127.0.0.1", 0) as server:
+            port = next(iter(server.sockets)).getsockname()[1]
+            self.uri = f"ws://127.0.0.1:{port}"
+            self._ready.set()
+            await self._stop
+
+    async def _handle(self, connection):
+        requested = connection.request.headers.get(REQUESTED_SEQUENCE_NUMBER_HEADER)
+        self.requested.append(requested)
+        start = int(requested) if requested else 0
+        sent = 0
+        for broadcast in self.broadcasts:
+            messages = [m for m in broadcast.get("messages", []) if m["sequenceNumber"] >= start]
+            if "messages" in broadcast and not messages:
+                continue
+
+            if self.messages_per_connection is not None and sent >= self.messages_per_connection:
+                break
+
+            await connection.send(json.dumps({**broadcast, "messages": messages}))
+            sent += len(messages)
+
+
+@pytest.fixture
+def decoder(arbitrum):
+    return SequencerFeedDecoder(arbitrum, 42161)
+
+
+def test_decode(decoder, broadcasts):
+    messages = [message for broadcast in broadcasts for message in decoder.decode(broadcast)]
+    assert [m.sequence_number for m in messages] == [1000, 1001, 1002, 1003, 1004]
+    assert [m.block_number for m in messages] == [22_208_817 + i for i in range(5)]
+    assert [[txn.type for txn in m.transactions] for m in messages] == [
+        [106, 2],
+        [106, 2, 0],
+        [106, 100],
+        [106, 105],
+        [106, 101],
+    ]
+
+    signed = messages[0].transactions[1]
+    assert signed.sender == SENDER
+    assert signed.nonce == 7
+    assert signed.value == 1000
+    assert signed.max_fee == 100_000_000
+    assert signed.signature is not None
+
+    legacy = messages[1].transactions[2]
+    assert legacy.sender == SENDER
+    assert legacy.gas_price == 100_000_000
+    assert legacy.data == b"\x12\x34"
+
+    deposit = messages[2].transactions[1]
+    assert deposit.sender == L1_SENDER
+    assert deposit.receiver == "0x4444444444444444444444444444444444444444"
+    assert deposit.value == 10**18
+    assert deposit.request_id == (1).to_bytes(32, "big")
+
+    retryable = messages[3].transactions[1]
+    assert retryable.retry_to == "0x5555555555555555555555555555555555555555"
+    assert retryable.retry_value == 5
+    assert retryable.deposit_value == 10**17
+    assert retryable.max_submission_fee == 10**12
+    assert retryable.refund_to == "0x6666666666666666666666666666666666666666"
+    assert retryable.beneficiary == "0x7777777777777777777777777777777777777777"
+    assert retryable.gas_limit == 100_000
+    assert retryable.retry_data == b"\xde\xad\xbe\xef"
+    assert retryable.l1_base_fee == 30_000_000_000
+
+    unsigned = messages[4].transactions[1]
+    assert unsigned.sender == L1_SENDER
+    assert unsigned.nonce == 3
+    assert unsigned.receiver == "0x8888888888888888888888888888888888888888"
+    assert unsigned.value == 9
+    assert unsigned.data == b"\xab"
+
+
+def test_decode_start_block(decoder, broadcasts):
+    decoder.decode(broadcasts[0])
+    (message,) = decoder.decode(broadcasts[1])[:1]
+    internal = message.transactions[0]
+    assert internal.sender == ARBOS_ADDRESS
+    assert internal.receiver == ARBOS_ADDRESS
+    assert internal.data[:4] == START_BLOCK_SELECTOR
+    words = [int.from_bytes(internal.data[i : i + 32], "big") for i in range(4, 132, 32)]
+    assert words == [0, 18_000_000, message.block_number, 1]
+
+
+def test_decode_without_senders(arbitrum, broadcasts):
+    decoder = SequencerFeedDecoder(arbitrum, 42161, recover_senders=False, genesis_block=0)
+    (message,) = decoder.decode(broadcasts[0])
+    assert message.block_number == 1000
+    assert message.transactions[1].sender is None
+
+
+def test_stream(broadcasts, networks):
+    with FeedStandIn(broadcasts) as stand_in:
+        feed = SequencerFeed(stand_in.uri, chain_id=42161, reconnect_delay=0.01)
+
+        async def consume():
+            received = []
+            async for message in feed.stream():
+                received.append(message.sequence_number)
+                if len(received) == 5:
+                    break
+
+            return received
+
+        assert asyncio.run(consume()) == [1000, 1001, 1002, 1003, 1004]
+
+
+def test_reconnect_resumes(broadcasts, networks):
+    with FeedStandIn(broadcasts, messages_per_connection=2) as stand_in:
+        feed = SequencerFeed(stand_in.uri, chain_id=42161, reconnect_delay=0.01)
+        received = []
+        for message in feed:
+            received.append(message.sequence_number)
+            if len(received) == 5:
+                break
+
+    assert received == [1000, 1001, 1002, 1003, 1004]
+    assert stand_in.requested[:2] == [None, "1003"]
+
+
+def test_backpressure(broadcasts, networks):
+    with FeedStandIn(broadcasts) as stand_in:
+        feed = SequencerFeed(stand_in.uri, chain_id=42161, buffer_size=1)
+
+        async def consume():
+            stream = feed.stream()
+            first = await stream.__anext__()
+            await asyncio.sleep(0.2)
+            # NOTE: Only one message is buffered while the consumer is busy.
+            buffered = feed.sequence_number
+            await stream.aclose()
+            return first.sequence_number, buffered
+
+        first, buffered = asyncio.run(consume())
+
+    assert first == 1000
+    assert buffered == 1002
+
+
+def test_max_reconnects(networks):
+    feed = SequencerFeed("ws://127.0.0.1:9", chain_id=42161, reconnect_delay=0.01, max_reconnects=1)
+    with pytest.raises(ApeArbitrumError, match="Unable to connect to the sequencer feed"):
+        next(iter(feed))
+
+
+def test_unknown_chain(networks):
+    with pytest.raises(ApeArbitrumError, match="No known sequencer feed"):
+        SequencerFeed(chain_id=1)
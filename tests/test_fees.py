@@ -0,0 +1,198 @@
+import threading
+import time
+from unittest.mock import PropertyMock
+
+import pytest
+from eth_abi import encode
+from eth_utils import to_hex
+
+from ape_arbitrum.ecosystem import ArbitrumConfig
+from ape_arbitrum.fees import L1_FIXED_OVERHEAD_BYTES, FeeOracle
+from ape_arbitrum.precompiles import ARB_GAS_INFO_ADDRESS, GasPrices
+
+RECEIVER = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+
+
+class ChainStandIn:
+    """
+    The latest block and ``ArbGasInfo`` prices of a node, changed by the test.
+    """
+
+    def __init__(self):
+        self.block_number = 100
+        self.base_fee = 10_000_000
+        self.l1_price = 2_000
+        self.latency = 0.0
+        self.error: Exception | None = None
+        self.batches: list = []
+
+    def make_batch_request(self, batch):
+        self.batches.append(batch)
+        time.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+
+        return [{"id": i, "result": self.respond(*request)} for i, request in enumerate(batch)]
+
+    def respond(self, method: str, params: list):
+        if method == "eth_getBlockByNumber":
+            return {"number": to_hex(self.block_number), "baseFeePerGas": to_hex(self.base_fee)}
+
+        if method == "eth_call" and params[0]["to"] == ARB_GAS_INFO_ADDRESS:
+            return to_hex(encode(["uint256"] * 6, (1, self.l1_price, 3, 4, 5, 6)))
+
+        raise AssertionError(f"Unexpected request '{method}'.")
+
+
+@pytest.fixture
+def chain(eth_tester_provider, mocker):
+    chain = ChainStandIn()
+    mocker.patch.object(
+        type(eth_tester_provider.web3.provider),
+        "make_batch_request",
+        create=True,
+        side_effect=chain.make_batch_request,
+    )
+    return chain
+
+
+@pytest.fixture
+def oracle(arbitrum):
+    arbitrum.precompiles._prices.clear()
+    return FeeOracle(arbitrum.precompiles, window=3, refresh_interval=0)
+
+
+def prices(l1_price: int) -> GasPrices:
+    return GasPrices(
+        per_l2_tx=1,
+        per_l1_calldata_byte=l1_price,
+        per_storage_allocation=3,
+        per_arb_gas_base=4,
+        per_arb_gas_congestion=5,
+        per_arb_gas_total=6,
+    )
+
+
+def test_add_block(oracle):
+    for number in (1, 2, 2, 1, 3, 4):
+        oracle.add_block({"number": to_hex(number), "baseFeePerGas": to_hex(number)}, prices(1))
+
+    # Only the newest blocks are kept, and each block only once.
+    assert [sample.block_number for sample in oracle.samples] == [2, 3, 4]
+    assert len(oracle) == 3
+
+
+def test_get_fee_estimate(oracle, chain):
+    estimate = oracle.get_fee_estimate()
+    assert estimate.max_fee == 12_000_000
+    assert estimate.max_priority_fee == 0
+    assert estimate.block_number == 100
+
+    # A rising base fee raises the prediction by the rise.
+    chain.block_number, chain.base_fee = 101, 15_000_000
+    assert oracle.get_fee_estimate().max_fee == 24_000_000
+
+    # The peak of the window sets the floor of the prediction.
+    chain.block_number, chain.base_fee = 102, 10_000_000
+    assert oracle.get_fee_estimate().max_fee == 18_000_000
+
+
+def test_refresh_interval(oracle, chain):
+    oracle.refresh_interval = 60
+    for _ in range(10):
+        oracle.get_fee_estimate()
+
+    assert oracle.refreshes == len(chain.batches) == 1
+    assert [method for method, _ in chain.batches[0]] == ["eth_getBlockByNumber", "eth_call"]
+
+    assert oracle.refresh(force=True)
+    assert oracle.refreshes == 2
+
+
+def test_predict_l1_gas(oracle, chain):
+    chain.l1_price = 2_000_000
+    oracle.get_fee_estimate()
+    chain.block_number, chain.l1_price = 101, 1_000_000
+
+    # The highest L1 price in the window is used.
+    assert oracle.predict_l1_gas(100) == (100 + L1_FIXED_OVERHEAD_BYTES) * 2_000_000 // 10_000_000
+
+
+def test_concurrent_refresh(oracle, chain):
+    # NOTE: Callers during the first refresh must wait for it, not use the empty window.
+    oracle.refresh_interval = 60
+    chain.latency = 0.1
+    estimates: list = []
+    threads = [
+        threading.Thread(target=lambda: estimates.append(oracle.get_fee_estimate()))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [estimate.block_number for estimate in estimates] == [100] * 5
+    assert len(chain.batches) == 1
+
+
+def test_refresh_error(oracle, chain):
+    oracle.refresh_interval = 60
+    chain.error = ValueError("node down")
+    with pytest.raises(ValueError, match="node down"):
+        oracle.get_fee_estimate()
+
+    # A failed refresh is tried again, rather than leaving the window empty.
+    chain.error = None
+    assert oracle.get_fee_estimate().block_number == 100
+    assert oracle.refreshes == 1
+
+
+@pytest.fixture
+def reset_ecosystem(arbitrum, eth_tester_provider):
+    def reset():
+        arbitrum.__dict__.pop("_fee_oracle_config", None)
+        arbitrum._chain_states.pop(("fee_oracle", eth_tester_provider.chain_id), None)
+        arbitrum.precompiles._prices.clear()
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture
+def live_network(arbitrum, eth_tester_provider, reset_ecosystem, mocker):
+    config = ArbitrumConfig.model_validate({"fee_oracle": {"enabled": True}})
+    mocker.patch.object(type(arbitrum), "config", new_callable=PropertyMock, return_value=config)
+    network = type(eth_tester_provider.network)
+    mocker.patch.object(network, "is_dev", new_callable=PropertyMock, return_value=False)
+    mocker.patch.object(network, "block_time", new_callable=PropertyMock, return_value=60)
+
+
+def test_create_transaction(arbitrum, chain, live_network):
+    txns = [arbitrum.create_transaction(receiver=RECEIVER, type=2) for _ in range(5)]
+    txns += arbitrum.create_transactions([{"receiver": RECEIVER, "type": 2}] * 5)
+    assert {txn.max_fee for txn in txns} == {12_000_000}
+    assert {txn.max_priority_fee for txn in txns} == {0}
+
+    # The window only refreshes once per block.
+    assert len(chain.batches) == 1
+
+    # Given fees are kept.
+    txn = arbitrum.create_transaction(receiver=RECEIVER, max_fee=5, max_priority_fee=1)
+    assert (txn.max_fee, txn.max_priority_fee) == (5, 1)
+
+
+def test_ecosystem_fee_oracle_per_chain(arbitrum, eth_tester_provider, reset_ecosystem, mocker):
+    fee_oracle = arbitrum.fee_oracle
+    assert arbitrum.fee_oracle is fee_oracle
+    mocker.patch.object(
+        type(eth_tester_provider), "chain_id", new_callable=PropertyMock, return_value=42161
+    )
+    assert arbitrum.fee_oracle is not fee_oracle
+
+
+def test_create_transaction_dev_network(arbitrum, chain):
+    txn = arbitrum.create_transaction(receiver=RECEIVER, type=2)
+    assert txn.max_fee is None
+    assert chain.batches == []
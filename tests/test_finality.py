@@ -0,0 +1,174 @@
+from unittest.mock import PropertyMock
+
+import pytest
+from eth_abi import decode, encode
+from eth_utils import to_hex
+
+from ape_arbitrum.ecosystem import ApeArbitrumError
+from ape_arbitrum.finality import BatchIndex, FinalityLevel, FinalityTracker
+from ape_arbitrum.precompiles import (
+    FIND_BATCH_CONTAINING_BLOCK_ABI,
+    GET_L1_CONFIRMATIONS_ABI,
+    NODE_INTERFACE_ADDRESS,
+)
+
+# NOTE: Each batch posts 10 blocks, and blocks up to 59 are posted.
+BLOCKS_PER_BATCH = 10
+LAST_POSTED_BLOCK = 59
+SAFE_BLOCK = 39
+FINALIZED_BLOCK = 19
+
+
+def get_batch(block_number: int) -> int:
+    return block_number // BLOCKS_PER_BATCH + 1
+
+
+class ChainStandIn:
+    """
+    A stand-in for an Arbitrum node that supports JSON-RPC batches and the
+    ``NodeInterface`` batch methods.
+    """
+
+    def __init__(self, arbitrum):
+        self.find_batch_selector = arbitrum.get_method_selector(FIND_BATCH_CONTAINING_BLOCK_ABI)
+        self.confirmations_selector = arbitrum.get_method_selector(GET_L1_CONFIRMATIONS_ABI)
+        self.batches: list[list] = []
+        self.last_posted_block = LAST_POSTED_BLOCK
+        self.safe_block = SAFE_BLOCK
+        self.finalized_block = FINALIZED_BLOCK
+
+    @property
+    def calls(self) -> list[int]:
+        return [len(batch) for batch in self.batches]
+
+    def make_batch_request(self, batch):
+        self.batches.append(batch)
+        return [{"id": i, **self.respond(*request)} for i, request in enumerate(batch)]
+
+    def respond(self, method: str, params: list) -> dict:
+        if method == "eth_getBlockByNumber":
+            tag = params[0]
+            number = {"safe": self.safe_block, "finalized": self.finalized_block}.get(tag)
+            number = int(tag, 16) if number is None else number
+            return {"result": {"number": to_hex(number), "hash": to_hex(number.to_bytes(32))}}
+
+        assert method == "eth_call"
+        assert params[0]["to"] == NODE_INTERFACE_ADDRESS
+        data = bytes.fromhex(params[0]["data"][2:])
+        if data[:4] == self.find_batch_selector:
+            (block_number,) = decode(["uint64"], data[4:])
+            if block_number > self.last_posted_block:
+                return {"error": {"code": -32000, "message": "execution reverted"}}
+
+            return {"result": to_hex(encode(["uint64"], [get_batch(block_number)]))}
+
+        assert data[:4] == self.confirmations_selector
+        block_number = int.from_bytes(data[4:36], "big")
+        confirmations = (get_batch(self.last_posted_block) - get_batch(block_number) + 1) * 10
+        return {"result": to_hex(encode(["uint64"], [confirmations]))}
+
+
+@pytest.fixture
+def node(arbitrum, eth_tester_provider, mocker):
+    stand_in = ChainStandIn(arbitrum)
+    mocker.patch.object(
+        type(eth_tester_provider.web3.provider),
+        "make_batch_request",
+        create=True,
+        side_effect=stand_in.make_batch_request,
+    )
+    return stand_in
+
+
+@pytest.fixture
+def finality(arbitrum):
+    return FinalityTracker(arbitrum.precompiles)
+
+
+def test_batch_index():
+    index = BatchIndex()
+    index.add(12, 2)
+    index.add(17, 2)
+    index.add(25, 3)
+    assert len(index) == 2
+    assert [index.get_batch(n) for n in (11, 12, 15, 17, 18, 25)] == [None, 2, 2, 2, None, 3]
+    assert index.get_range(2) == (12, 17)
+
+    index.add(10, 2)
+    assert index.get_range(2) == (10, 17)
+    assert index.get_batch(10) == 2
+
+
+def test_find_batches(finality, node):
+    block_numbers = list(range(20, 40))
+    actual = finality.find_batches(block_numbers)
+    assert actual == {n: get_batch(n) for n in block_numbers}
+
+    # NOTE: Far fewer calls than blocks, as the blocks between known ends aren't requested.
+    assert sum(node.calls) < len(block_numbers) // 2
+
+    # The index answers without requests.
+    node.batches.clear()
+    assert finality.find_batch(25) == get_batch(25)
+    assert node.batches == []
+
+
+def test_find_batches_not_posted(finality, node):
+    actual = finality.find_batches([55, 58, 61, 70])
+    assert actual == {55: 6, 58: 6, 61: None, 70: None}
+
+    # Blocks that are not yet posted are requested again.
+    node.last_posted_block = 79
+    assert finality.find_batch(70) == get_batch(70)
+
+
+def test_get_finalities(finality, node):
+    actual = finality.get_finalities([10, 30, 50, 70])
+    assert actual == {
+        10: FinalityLevel.FINALIZED,
+        30: FinalityLevel.SAFE,
+        50: FinalityLevel.POSTED,
+        70: FinalityLevel.SEQUENCED,
+    }
+
+
+def test_get_l1_confirmations(finality, node):
+    actual = finality.get_l1_confirmations([21, 29, 45, 70])
+    assert actual == {21: 40, 29: 40, 45: 20, 70: 0}
+
+    # Confirmations are re-used within their TTL.
+    node.batches.clear()
+    finality.get_l1_confirmations([22])
+    assert node.batches == []
+
+
+def test_wait(finality, node, mocker):
+    def post(*_):
+        node.safe_block += 10
+        node.finalized_block += 10
+
+    sleep = mocker.patch("ape_arbitrum.finality.time.sleep", side_effect=post)
+    actual = finality.wait([25, 35], level=FinalityLevel.FINALIZED)
+    assert actual == {25: FinalityLevel.FINALIZED, 35: FinalityLevel.FINALIZED}
+    assert sleep.call_count == 2
+
+
+def test_wait_timeout(finality, node, mocker):
+    mocker.patch("ape_arbitrum.finality.time.sleep")
+    with pytest.raises(ApeArbitrumError, match="1 block"):
+        finality.wait([70], level=FinalityLevel.POSTED, timeout=1, poll_interval=2)
+
+
+def test_ecosystem_finality(arbitrum):
+    assert arbitrum.finality is arbitrum.finality
+    assert arbitrum.finality.precompiles is arbitrum.precompiles
+
+
+def test_ecosystem_finality_per_chain(arbitrum, eth_tester_provider, mocker):
+    finality = arbitrum.finality
+    finality.index.add(12, 2)
+    mocker.patch.object(
+        type(eth_tester_provider), "chain_id", new_callable=PropertyMock, return_value=42161
+    )
+    assert arbitrum.finality is not finality
+    assert len(arbitrum.finality.index) == 0
@@ -0,0 +1,215 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from eth_utils import to_hex
+
+from ape_arbitrum.forking import ForkStateCache
+from ape_arbitrum.precompiles import ARB_GAS_INFO_ADDRESS
+
+CHAIN_ID = 42161
+FORK_BLOCK = 1_000
+CONTRACTS = [f"0x{index:040x}" for index in range(0x1000, 0x1008)]
+
+
+class StandInUpstream:
+    """
+    Serves the state of an upstream network, where each account's balance
+    and nonce is its address and each storage slot holds its number.
+    """
+
+    def __init__(self, delay: float = 0):
+        self.chain_id = CHAIN_ID
+        self.delay = delay
+        self.requests: list[tuple[str, list]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def make_request(self, method: str, params: list):
+        with self._lock:
+            self.requests.append((method, params))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+        if method in ("eth_getBalance", "eth_getTransactionCount"):
+            return to_hex(int(params[0], 16))
+        if method == "eth_getCode":
+            return "0x6080"
+        if method == "eth_getStorageAt":
+            return f"0x{int(params[1], 16):064x}"
+        if method == "eth_blockNumber":
+            return to_hex(FORK_BLOCK + 10)
+        if method == "debug_traceTransaction":
+            return {"gas": 21000, "structLogs": [{"pc": 0, "gas": 79000, "depth": 1}]}
+
+        raise AssertionError(f"Unexpected request '{method}'.")
+
+    def count(self, method: str) -> int:
+        return sum(1 for name, _ in self.requests if name == method)
+
+
+@pytest.fixture
+def upstream():
+    return StandInUpstream()
+
+
+@pytest.fixture
+def cache(upstream, tmp_path):
+    return ForkStateCache(upstream, FORK_BLOCK, path=tmp_path)
+
+
+def test_get_account(cache, upstream, tmp_path):
+    address = CONTRACTS[0]
+    assert cache.get_balance(address) == 0x1000
+    assert cache.get_nonce(address) == 0x1000
+    assert cache.get_code(address) == b"\x60\x80"
+    assert len(upstream.requests) == 3
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert all(params[-1] == to_hex(FORK_BLOCK) for _, params in upstream.requests)
+
+    # A later session forking the same block reads the state from disk.
+    other_upstream = StandInUpstream()
+    other_cache = ForkStateCache(other_upstream, FORK_BLOCK, path=tmp_path)
+    assert other_cache.get_balance(address) == 0x1000
+    assert other_upstream.requests == []
+    assert (tmp_path / str(CHAIN_ID) / str(FORK_BLOCK) / f"{address}.json").is_file()
+
+
+def test_get_storage(cache, upstream):
+    address = CONTRACTS[0]
+    assert cache.get_storage(address, 5) == (5).to_bytes(32, "big")
+    assert cache.get_storage(address, 5) == (5).to_bytes(32, "big")
+    assert upstream.requests == [("eth_getStorageAt", [address, "0x5", to_hex(FORK_BLOCK)])]
+
+    # Only the storage slot was cached, not the account.
+    assert cache.get_balance(address) == 0x1000
+    assert upstream.count("eth_getBalance") == 1
+
+
+def test_separate_fork_blocks(cache, upstream, tmp_path):
+    cache.get_balance(CONTRACTS[0])
+    ForkStateCache(upstream, FORK_BLOCK + 1, path=tmp_path).get_balance(CONTRACTS[0])
+    assert upstream.count("eth_getBalance") == 2
+
+
+def test_prewarm(tmp_path):
+    upstream = StandInUpstream(delay=0.01)
+    cache = ForkStateCache(upstream, FORK_BLOCK, path=tmp_path, max_workers=4)
+    cache.prewarm({address: [0, 1] for address in CONTRACTS})
+    assert len(upstream.requests) == len(CONTRACTS) * 5
+    assert upstream.max_in_flight > 1
+
+    upstream.requests.clear()
+    assert cache.get_storage(CONTRACTS[-1], 1) == (1).to_bytes(32, "big")
+    assert cache.get_code(CONTRACTS[-1]) == b"\x60\x80"
+    assert upstream.requests == []
+
+
+def test_prewarm_writes_once(cache, tmp_path, mocker):
+    write_text = mocker.spy(Path, "write_text")
+    cache.prewarm({CONTRACTS[0]: range(64)})
+    assert write_text.call_count == 1
+
+    # Reloaded from disk.
+    reloaded = ForkStateCache(StandInUpstream(), FORK_BLOCK, path=tmp_path)
+    assert reloaded.get_storage(CONTRACTS[0], 63) == (63).to_bytes(32, "big")
+    assert reloaded.get_balance(CONTRACTS[0]) == 0x1000
+    assert reloaded.misses == 0
+
+
+def test_get_storage_appends(cache, upstream, tmp_path):
+    address = CONTRACTS[0]
+    for slot in range(3):
+        cache.get_storage(address, slot)
+
+    slots_file = tmp_path / str(CHAIN_ID) / str(FORK_BLOCK) / f"{address}.slots"
+    assert len(slots_file.read_text().splitlines()) == 3
+
+    # A line left part-way through appending is skipped.
+    with slots_file.open("a") as file:
+        file.write('{"0x3": "0x')
+
+    reloaded = ForkStateCache(upstream, FORK_BLOCK, path=tmp_path)
+    assert reloaded.get_storage(address, 2) == (2).to_bytes(32, "big")
+    assert reloaded.hits == 1
+
+
+def test_prewarm_cached(cache, upstream):
+    cache.prewarm({CONTRACTS[0]: [0]})
+    upstream.requests.clear()
+
+    # Only the missing storage slots are requested.
+    cache.prewarm({CONTRACTS[0]: [0, 1]})
+    assert upstream.requests == [("eth_getStorageAt", [CONTRACTS[0], "0x1", to_hex(FORK_BLOCK)])]
+
+
+def test_prewarm_skips_precompiles(cache, upstream):
+    cache.prewarm([ARB_GAS_INFO_ADDRESS])
+    assert upstream.requests == []
+
+
+def test_make_request(cache, upstream):
+    address = CONTRACTS[0]
+    fork_block = to_hex(FORK_BLOCK)
+    assert cache.make_request("eth_chainId", []) == to_hex(CHAIN_ID)
+    assert cache.make_request("eth_getBalance", [address, fork_block]) == "0x1000"
+    assert cache.make_request("eth_getStorageAt", [address, "0x02", fork_block]) == f"0x{2:064x}"
+    assert cache.make_request("eth_getCode", [address, {"blockNumber": fork_block}]) == "0x6080"
+    assert cache.hits == 1
+
+    # Requests for other blocks and other methods are forwarded.
+    cache.make_request("eth_getBalance", [address, "latest"])
+    assert cache.make_request("eth_blockNumber", []) == to_hex(FORK_BLOCK + 10)
+    assert upstream.count("eth_getBalance") == 2
+    assert cache.hits == 1
+
+
+def test_serve(cache, upstream):
+    address = CONTRACTS[0]
+    with cache.serve() as server:
+        single = requests.post(
+            server.uri,
+            json={"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []},
+        ).json()
+        batch = requests.post(
+            server.uri,
+            json=[
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "eth_getBalance",
+                    "params": [address, to_hex(FORK_BLOCK)],
+                }
+                for i in range(2)
+            ],
+        ).json()
+
+    assert single == {"jsonrpc": "2.0", "id": 1, "result": to_hex(CHAIN_ID)}
+    assert [response["result"] for response in batch] == ["0x1000", "0x1000"]
+    assert upstream.count("eth_getBalance") == 1
+
+
+def test_serve_forwards_numbers(cache):
+    with cache.serve() as server:
+        response = requests.post(
+            server.uri,
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "debug_traceTransaction",
+                "params": ["0x01"],
+            },
+        ).json()
+
+    # Forwarded results keep their JSON numbers.
+    assert response["result"] == {
+        "gas": 21000,
+        "structLogs": [{"pc": 0, "gas": 79000, "depth": 1}],
+    }
@@ -0,0 +1,64 @@
+import pytest
+
+from ape_arbitrum.gas import GasEstimateCache
+
+RECEIVER = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+
+
+@pytest.fixture
+def estimate(mocker):
+    return mocker.Mock(return_value=100_000)
+
+
+@pytest.fixture
+def create_txn(arbitrum):
+    def fn(data: str = "0x12345678", receiver: str = RECEIVER):
+        return arbitrum.create_transaction(receiver=receiver, data=data)
+
+    return fn
+
+
+def test_get_gas_limit(create_txn, estimate):
+    cache = GasEstimateCache(multiplier=1.5)
+    assert cache.get_gas_limit(create_txn(), estimate) == 150_000
+    assert cache.get_gas_limit(create_txn(), estimate) == 150_000
+    assert estimate.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_gas_limit_calldata_bucket(create_txn, estimate):
+    cache = GasEstimateCache(calldata_bucket_size=32)
+    cache.get_gas_limit(create_txn(data=f"0x12345678{'00' * 20}"), estimate)
+    cache.get_gas_limit(create_txn(data=f"0x12345678{'00' * 24}"), estimate)
+    assert estimate.call_count == 1
+
+    # Different bucket, selector or receiver.
+    cache.get_gas_limit(create_txn(data=f"0x12345678{'00' * 32}"), estimate)
+    cache.get_gas_limit(create_txn(data="0x87654321"), estimate)
+    cache.get_gas_limit(create_txn(receiver=RECEIVER.replace("3", "4")), estimate)
+    assert estimate.call_count == 4
+
+
+def test_get_gas_limit_new_epoch(create_txn, estimate, mocker):
+    time = mocker.patch("ape_arbitrum.gas.time.time", return_value=1_000)
+    cache = GasEstimateCache(ttl=60)
+    cache.get_gas_limit(create_txn(), estimate)
+    time.return_value = 1_019
+    cache.get_gas_limit(create_txn(), estimate)
+    assert estimate.call_count == 1
+
+    time.return_value = 1_020
+    cache.get_gas_limit(create_txn(), estimate)
+    assert estimate.call_count == 2
+
+
+def test_size(create_txn, estimate):
+    cache = GasEstimateCache(size=2)
+    for selector in ("0x00000001", "0x00000002", "0x00000003"):
+        cache.get_gas_limit(create_txn(data=selector), estimate)
+
+    assert len(cache) == 2
+
+    # The least-recently used estimate was removed.
+    cache.get_gas_limit(create_txn(data="0x00000001"), estimate)
+    assert estimate.call_count == 4
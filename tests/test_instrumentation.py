@@ -0,0 +1,105 @@
+import time
+
+import pytest
+from ape import chain
+
+from ape_arbitrum.instrumentation import LATENCY_BUCKETS, Histogram, instrumentation
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enabled = True
+    yield instrumentation
+    instrumentation.enabled = None
+    instrumentation.reset()
+
+
+def test_disabled_by_default(arbitrum):
+    instrumentation.reset()
+    assert instrumentation.enabled is False
+    arbitrum.create_transaction()
+    assert instrumentation.calls == {}
+
+
+def test_create_transaction(arbitrum, enabled):
+    for _ in range(3):
+        arbitrum.create_transaction(value="1 gwei")
+
+    histogram = enabled.calls["create_transaction"]
+    assert histogram.count == 3
+    assert histogram.errors == 0
+    assert sum(histogram.bucket_counts) == 3
+    assert histogram.sum > 0
+
+
+def test_failed_call(arbitrum, enabled):
+    with pytest.raises(KeyError):
+        arbitrum.create_transaction(type=99)
+
+    assert enabled.calls["create_transaction"].errors == 1
+
+
+def test_rpc(arbitrum, enabled):
+    chain.mine(1)
+    arbitrum.decode_block_receipts("latest")
+    assert enabled.calls["decode_block_receipts"].count == 1
+    assert enabled.rpc["eth_getBlockByNumber"].count >= 1
+
+
+def test_histogram():
+    histogram = Histogram()
+    for elapsed in (0.0001, 0.0002, 0.003, 20):
+        histogram.observe(elapsed, allocated_blocks=10)
+
+    assert histogram.count == 4
+    assert histogram.allocated_blocks == 40
+    assert histogram.bucket_counts[0] == 2
+    assert histogram.bucket_counts[-1] == 1
+    assert histogram.quantile(0.5) == LATENCY_BUCKETS[0]
+    assert histogram.quantile(0.75) == 0.005
+    assert histogram.quantile(1) == float("inf")
+
+
+def test_to_prometheus(enabled):
+    enabled.observe("create_transaction", 0.002, allocated_blocks=5)
+    enabled.observe_rpc("eth_chainId", 0.0001)
+    actual = enabled.to_prometheus()
+    assert "# TYPE ape_arbitrum_call_seconds histogram" in actual
+    assert 'ape_arbitrum_call_seconds_bucket{name="create_transaction",le="0.001"} 0' in actual
+    assert 'ape_arbitrum_call_seconds_bucket{name="create_transaction",le="0.0025"} 1' in actual
+    assert 'ape_arbitrum_call_seconds_bucket{name="create_transaction",le="+Inf"} 1' in actual
+    assert 'ape_arbitrum_call_seconds_count{name="create_transaction"} 1' in actual
+    assert 'ape_arbitrum_rpc_seconds_count{method="eth_chainId"} 1' in actual
+    assert 'ape_arbitrum_call_allocated_blocks{name="create_transaction"} 5' in actual
+    assert actual.endswith("\n")
+
+
+def test_disabled_overhead():
+    instrumentation.enabled = False
+
+    def fn():
+        return None
+
+    def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    def measure(function) -> float:
+        # NOTE: Use the best of a few runs, to reduce noise.
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(10_000):
+                function()
+
+            timings.append(time.perf_counter() - start)
+
+        return min(timings)
+
+    instrumented = instrumentation.instrument("fn")(fn)
+    actual = measure(instrumented)
+    instrumentation.enabled = None
+    assert "fn" not in instrumentation.calls
+
+    # NOTE: When disabled, the cost is close to that of a plain wrapper function.
+    assert actual < 3 * measure(wrapper)
@@ -0,0 +1,181 @@
+import pytest
+from ape.exceptions import ProviderError
+from eth_abi import encode
+from eth_utils import encode_hex, keccak, to_hex
+from ethpm_types import EventABI
+from requests import Response
+from requests.exceptions import HTTPError
+
+from ape_arbitrum.ecosystem import ApeArbitrumError
+from ape_arbitrum.logs import LogScanner
+
+ADDRESS = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+TRANSFER_ABI = EventABI.model_validate(
+    {
+        "type": "event",
+        "name": "Transfer",
+        "anonymous": False,
+        "inputs": [
+            {"name": "sender", "type": "address", "indexed": True},
+            {"name": "receiver", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    }
+)
+
+
+def create_log(block_number: int, value: int) -> dict:
+    address_topic = encode_hex(encode(["address"], [ADDRESS]))
+    return {
+        "address": ADDRESS,
+        "blockHash": encode_hex(keccak(block_number.to_bytes(8, "big"))),
+        "blockNumber": to_hex(block_number),
+        "data": encode_hex(encode(["uint256"], [value])),
+        "logIndex": "0x0",
+        "removed": False,
+        "topics": [encode_hex(keccak(text=TRANSFER_ABI.selector)), address_topic, address_topic],
+        "transactionHash": encode_hex(keccak(value.to_bytes(8, "big"))),
+        "transactionIndex": "0x0",
+    }
+
+
+class StandInNode:
+    """
+    Serves canned ``eth_getLogs`` responses and rejects queries
+    returning more than ``max_results`` logs, like hosted RPCs do.
+    """
+
+    def __init__(self, logs_per_block: dict[int, int], max_results: int = 10_000):
+        self.max_results = max_results
+        self.requests: list[tuple[int, int]] = []
+        self.logs = {
+            block: [create_log(block, block * 100 + i) for i in range(count)]
+            for block, count in logs_per_block.items()
+        }
+
+    def make_request(self, rpc: str, parameters: list):
+        assert rpc == "eth_getLogs"
+        start = int(parameters[0]["fromBlock"], 16)
+        stop = int(parameters[0]["toBlock"], 16)
+        self.requests.append((start, stop))
+        logs = [log for block in range(start, stop + 1) for log in self.logs.get(block, [])]
+        if len(logs) > self.max_results:
+            raise ProviderError(f"query returned more than {self.max_results} results")
+
+        return logs
+
+    @property
+    def all_logs(self) -> list:
+        return [log for block in sorted(self.logs) for log in self.logs[block]]
+
+
+@pytest.fixture
+def node(eth_tester_provider, mocker):
+    def fn(logs_per_block: dict[int, int], **kwargs):
+        node = StandInNode(logs_per_block, **kwargs)
+        mocker.patch.object(
+            type(eth_tester_provider), "make_request", side_effect=node.make_request
+        )
+        return node
+
+    return fn
+
+
+def test_scan(node):
+    stand_in = node(dict.fromkeys(range(100), 1))
+    scanner = LogScanner(start_block=0, stop_block=99, window=10, target_logs=100)
+    assert list(scanner) == stand_in.all_logs
+    assert scanner.checkpoint == 100
+
+    # The window grew because the result density was low.
+    assert stand_in.requests[0] == (0, 9)
+    assert stand_in.requests[1] == (10, 29)
+
+
+def test_scan_shrinks_window(node):
+    stand_in = node(dict.fromkeys(range(20), 2), max_results=5)
+    scanner = LogScanner(start_block=0, stop_block=19, window=8, target_logs=4)
+    assert list(scanner) == stand_in.all_logs
+    assert stand_in.requests[:3] == [(0, 7), (0, 3), (0, 1)]
+    assert scanner.window == 2
+
+
+def test_scan_resume_from_checkpoint(node):
+    stand_in = node(dict.fromkeys(range(30), 1))
+    scanner = LogScanner(start_block=0, stop_block=29, window=5, max_window=5)
+    seen = []
+    for log in scanner:
+        seen.append(log)
+        if len(seen) == 7:
+            break
+
+    # The checkpoint only moved past the fully-consumed window.
+    assert scanner.checkpoint == 5
+    resumed = LogScanner(start_block=scanner.checkpoint, stop_block=29, window=5)
+    assert seen[:5] + list(resumed) == stand_in.all_logs
+
+
+def test_scan_decode_events(node):
+    node({3: 2})
+    scanner = LogScanner(events=[TRANSFER_ABI], start_block=0, stop_block=5)
+    actual = list(scanner)
+    assert [log.value for log in actual] == [300, 301]
+    assert actual[0].event_name == "Transfer"
+    assert actual[0].sender == ADDRESS
+
+
+def test_scan_too_many_logs_in_one_block(node):
+    node({0: 3}, max_results=2)
+    with pytest.raises(ApeArbitrumError, match="block range 0-0"):
+        list(LogScanner(start_block=0, stop_block=0))
+
+
+def test_scan_other_error(eth_tester_provider, mocker):
+    mocker.patch.object(
+        type(eth_tester_provider), "make_request", side_effect=ProviderError("invalid params")
+    )
+    with pytest.raises(ProviderError, match="invalid params"):
+        list(LogScanner(start_block=0, stop_block=10))
+
+
+def too_many_requests() -> HTTPError:
+    response = Response()
+    response.status_code = 429
+    return HTTPError("429 Client Error: Too Many Requests", response=response)
+
+
+def test_scan_rate_limited(eth_tester_provider, mocker):
+    make_request = mocker.patch.object(
+        type(eth_tester_provider),
+        "make_request",
+        side_effect=[too_many_requests(), ProviderError("request timed out"), []],
+    )
+    sleep = mocker.patch("ape_arbitrum.logs.time.sleep")
+    assert list(LogScanner(start_block=0, stop_block=10, backoff=0.5)) == []
+
+    # The same window is retried after backing off, rather than shrunk.
+    assert [call.args[1][0]["toBlock"] for call in make_request.call_args_list] == ["0xa"] * 3
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1]
+
+    make_request.side_effect = ProviderError("rate limit exceeded")
+    with pytest.raises(ProviderError, match="rate limit"):
+        list(LogScanner(start_block=0, stop_block=10, max_retries=2))
+
+
+def test_scan_size_error_with_429(eth_tester_provider, mocker):
+    # NOTE: A block range containing "429" must not be mistaken for a rate limit.
+    error = ProviderError("query returned more than 10000 results ... [0x4291a0, 0x42a000]")
+    make_request = mocker.patch.object(
+        type(eth_tester_provider), "make_request", side_effect=[error, [], []]
+    )
+    sleep = mocker.patch("ape_arbitrum.logs.time.sleep")
+    scanner = LogScanner(start_block=0, stop_block=99, window=100)
+    assert list(scanner) == []
+    assert make_request.call_args_list[1].args[1][0]["toBlock"] == "0x31"
+    assert not sleep.called
+
+
+def test_scan_logs(arbitrum, node):
+    stand_in = node({1: 1})
+    scanner = arbitrum.scan_logs(address=ADDRESS, start_block=0, stop_block=1)
+    assert list(scanner) == stand_in.all_logs
@@ -0,0 +1,116 @@
+from unittest.mock import PropertyMock
+
+import pytest
+from ape.exceptions import ProviderError
+from eth_pydantic_types import HexBytes
+
+from ape_arbitrum.nonces import NonceManager, TransactionPipeline
+
+
+@pytest.fixture
+def nonces():
+    return NonceManager()
+
+
+@pytest.fixture
+def create_transfers(arbitrum, second_account):
+    def fn(count: int):
+        return [
+            arbitrum.create_transaction(receiver=second_account.address, value=i + 1)
+            for i in range(count)
+        ]
+
+    return fn
+
+
+def test_allocate(nonces, account, eth_tester_provider, mocker):
+    get_nonce = mocker.spy(type(eth_tester_provider), "get_nonce")
+    start = eth_tester_provider.get_nonce(account.address)
+    get_nonce.reset_mock()
+
+    assert [nonces.allocate(account.address) for _ in range(3)] == [start, start + 1, start + 2]
+    assert get_nonce.call_count == 1
+
+
+def test_release(nonces, account):
+    first = nonces.allocate(account.address)
+    second = nonces.allocate(account.address)
+
+    # Releasing the last nonce re-uses it.
+    nonces.release(account.address, second)
+    assert nonces.allocate(account.address) == second
+
+    # Releasing an earlier nonce leaves a gap, so the node is asked again.
+    nonces.release(account.address, first)
+    assert nonces.allocate(account.address) == first
+
+
+def test_allocate_per_chain(nonces, account, eth_tester_provider, mocker):
+    start = nonces.allocate(account.address)
+
+    # Another network's nonces are counted separately.
+    chain_id = mocker.patch.object(
+        type(eth_tester_provider), "chain_id", new_callable=PropertyMock, return_value=42170
+    )
+    mocker.patch.object(type(eth_tester_provider), "get_nonce", return_value=100)
+    assert nonces.allocate(account.address) == 100
+
+    chain_id.return_value = eth_tester_provider.web3.eth.chain_id
+    assert nonces.allocate(account.address) == start + 1
+
+
+def test_reset(nonces, account, eth_tester_provider, mocker):
+    nonces.allocate(account.address)
+    nonces.reset()
+    get_nonce = mocker.spy(type(eth_tester_provider), "get_nonce")
+    nonces.allocate(account.address)
+    assert get_nonce.call_count == 1
+
+
+def test_pipeline(account, create_transfers, nonces, eth_tester_provider, mocker):
+    get_nonce = mocker.spy(type(eth_tester_provider), "get_nonce")
+    start = eth_tester_provider.get_nonce(account.address)
+    get_nonce.reset_mock()
+
+    with TransactionPipeline(account, max_in_flight=4, nonces=nonces) as pipeline:
+        receipts = pipeline.submit_many(create_transfers(10))
+
+    assert [receipt.nonce for receipt in receipts] == list(range(start, start + 10))
+    assert [receipt.value for receipt in receipts] == list(range(1, 11))
+    assert all(not receipt.failed for receipt in receipts)
+
+    # NOTE: Only the first nonce was requested. Receipts check the nonce on their own.
+    pending_nonce_calls = [c for c in get_nonce.call_args_list if c.kwargs.get("block_id")]
+    assert len(pending_nonce_calls) == 1
+
+
+def test_pipeline_resyncs_used_nonce(account, second_account, create_transfers, nonces):
+    pipeline = TransactionPipeline(account, nonces=nonces)
+    (first,) = pipeline.submit_many(create_transfers(1))
+
+    # A transaction sent outside the pipeline uses the next nonce.
+    account.transfer(second_account, 1)
+
+    (second,) = pipeline.submit_many(create_transfers(1))
+    pipeline.close()
+    assert second.nonce == first.nonce + 2
+
+
+def test_pipeline_already_known(account, create_transfers, nonces, eth_tester_provider, mocker):
+    make_request = mocker.patch.object(
+        type(eth_tester_provider), "make_request", side_effect=ProviderError("already known")
+    )
+    pipeline = TransactionPipeline(account, nonces=nonces)
+    (txn,) = create_transfers(1)
+    txn_hash = pipeline._send(txn)
+    pipeline.close()
+
+    # The transaction is not sent again with another nonce.
+    assert make_request.call_count == 1
+    assert txn_hash == HexBytes(pipeline._sign(txn).txn_hash).to_0x_hex()
+
+
+def test_pipeline_default_nonces(arbitrum, account):
+    pipeline = TransactionPipeline(account)
+    assert pipeline.nonces is arbitrum.nonces
+    pipeline.close()
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import ape_arbitrum
+
+# NOTE: Modules that should only load once an Arbitrum network is used.
+HEAVY_MODULES = ("ape_arbitrum.ecosystem", "ape_ethereum.ecosystem", "ape_ethereum.transactions")
+
+# NOTE: A generous limit for the plugin's own modules, excluding ape itself.
+MAX_IMPORT_TIME = 0.1
+
+
+def run_python(code: str, *args: str) -> str:
+    result = subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout + result.stderr
+
+
+def test_networks():
+    actual = {(ecosystem, name) for ecosystem, name, _ in ape_arbitrum.networks()}
+    assert actual == {
+        ("arbitrum", "mainnet"),
+        ("arbitrum", "mainnet-fork"),
+        ("arbitrum", "sepolia"),
+        ("arbitrum", "sepolia-fork"),
+        ("arbitrum", "nova"),
+        ("arbitrum", "nova-fork"),
+        ("arbitrum", "local"),
+    }
+
+
+def test_register_networks_does_not_import_ecosystem():
+    output = run_python(
+        "import sys, ape_arbitrum; "
+        "list(ape_arbitrum.networks()); ape_arbitrum.NETWORKS; "
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    assert output.strip() == "[]"
+
+
+def test_import_time():
+    output = run_python("import ape_arbitrum", "-X", "importtime")
+
+    # NOTE: Lines look like "import time: <self us> | <cumulative us> | <module>".
+    self_times = [
+        int(line.split("|")[0].split(":")[1])
+        for line in output.splitlines()
+        if line.split("|")[-1].strip().startswith("ape_arbitrum")
+    ]
+    assert self_times
+    assert sum(self_times) / 1_000_000 < MAX_IMPORT_TIME
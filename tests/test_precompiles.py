@@ -0,0 +1,143 @@
+from unittest.mock import PropertyMock
+
+import pytest
+from ape.exceptions import ProviderError
+from eth_abi import encode
+from eth_utils import to_hex
+
+from ape_arbitrum.precompiles import (
+    ARB_GAS_INFO_ADDRESS,
+    NODE_INTERFACE_ADDRESS,
+    GasPrices,
+    L1GasEstimate,
+    batch_request,
+    to_int,
+)
+
+BLOCK_NUMBER = 1234
+PRICES = (1, 2, 3, 4, 5, 6)
+RECEIVER = "0x274b028b03A250cA03644E6c578D81f019eE1323"
+
+
+def respond(method: str, params: list):
+    if method == "eth_blockNumber":
+        return to_hex(BLOCK_NUMBER)
+
+    if method == "eth_getBlockByNumber":
+        return {"number": to_hex(BLOCK_NUMBER), "baseFeePerGas": to_hex(10_000_000)}
+
+    if method == "eth_call" and params[0]["to"] == ARB_GAS_INFO_ADDRESS:
+        return to_hex(encode(["uint256"] * 6, PRICES))
+
+    if method == "eth_call" and params[0]["to"] == NODE_INTERFACE_ADDRESS:
+        # NOTE: Use the calldata length as the L1 gas, to tell the results apart.
+        return to_hex(encode(["uint64", "uint256", "uint256"], (len(params[0]["data"]), 10, 20)))
+
+    raise AssertionError(f"Unexpected request '{method}'.")
+
+
+@pytest.fixture
+def batches(eth_tester_provider, mocker):
+    """
+    A stand-in for a node that supports JSON-RPC batches.
+    """
+    requests: list = []
+
+    def make_batch_request(batch):
+        requests.append(batch)
+        return [{"id": i, "result": respond(*request)} for i, request in enumerate(batch)]
+
+    mocker.patch.object(
+        type(eth_tester_provider.web3.provider),
+        "make_batch_request",
+        create=True,
+        side_effect=make_batch_request,
+    )
+    return requests
+
+
+@pytest.fixture
+def precompiles(arbitrum):
+    precompiles = arbitrum.precompiles
+    precompiles._prices.clear()
+    return precompiles
+
+
+def test_get_prices_in_wei(precompiles, batches):
+    actual = precompiles.get_prices_in_wei()
+    assert actual == GasPrices(
+        per_l2_tx=1,
+        per_l1_calldata_byte=2,
+        per_storage_allocation=3,
+        per_arb_gas_base=4,
+        per_arb_gas_congestion=5,
+        per_arb_gas_total=6,
+    )
+    assert [[method for method, _ in batch] for batch in batches] == [
+        ["eth_blockNumber"],
+        ["eth_call"],
+    ]
+    assert batches[1][0][1][1] == to_hex(BLOCK_NUMBER)
+
+    # The prices of the block are cached, also while the latest block is the same.
+    assert precompiles.get_prices_in_wei(BLOCK_NUMBER) == actual
+    assert precompiles.get_prices_in_wei() == actual
+    assert [[method for method, _ in batch] for batch in batches[2:]] == [["eth_blockNumber"]]
+
+
+def test_get_prices_in_wei_per_chain(precompiles, batches, eth_tester_provider, mocker):
+    precompiles.get_prices_in_wei()
+
+    # Another network's block of the same number is not served from the cache.
+    mocker.patch.object(
+        type(eth_tester_provider), "chain_id", new_callable=PropertyMock, return_value=42170
+    )
+    precompiles.get_prices_in_wei(BLOCK_NUMBER)
+    assert len(batches) == 3
+
+
+def test_get_block_and_prices(precompiles, batches):
+    block, prices = precompiles.get_block_and_prices()
+    assert to_int(block["number"]) == BLOCK_NUMBER
+    assert prices.per_l1_calldata_byte == 2
+    assert len(batches) == 1
+    assert [method for method, _ in batches[0]] == ["eth_getBlockByNumber", "eth_call"]
+
+    # The prices of the block are cached.
+    assert precompiles.get_prices_in_wei(BLOCK_NUMBER) == prices
+    assert len(batches) == 1
+
+
+def test_gas_estimate_l1_components(arbitrum, precompiles, batches):
+    txns = [
+        arbitrum.create_transaction(receiver=RECEIVER, data="0x12345678"),
+        arbitrum.create_transaction(receiver=RECEIVER, data=f"0x12345678{'00' * 32}"),
+    ]
+    actual = precompiles.gas_estimate_l1_components(txns)
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+    assert [estimate.base_fee for estimate in actual] == [10, 10]
+    assert actual[0] == L1GasEstimate(
+        gas_estimate_for_l1=actual[0].gas_estimate_for_l1, base_fee=10, l1_base_fee_estimate=20
+    )
+    assert actual[1].gas_estimate_for_l1 > actual[0].gas_estimate_for_l1
+
+
+def test_batch_request_not_supported(eth_tester_provider):
+    # NOTE: The local test provider does not support batches.
+    chain_id, block_number = batch_request(
+        eth_tester_provider, [("eth_chainId", []), ("eth_blockNumber", [])]
+    )
+    assert to_int(chain_id) == eth_tester_provider.chain_id
+    assert to_int(block_number) >= 0
+
+
+def test_batch_request_error(eth_tester_provider, mocker):
+    mocker.patch.object(
+        type(eth_tester_provider.web3.provider),
+        "make_batch_request",
+        create=True,
+        return_value=[{"id": 0, "error": {"code": -32000, "message": "execution reverted"}}],
+    )
+    with pytest.raises(ProviderError, match="execution reverted"):
+        batch_request(eth_tester_provider, [("eth_call", [])])
@@ -0,0 +1,221 @@
+import pytest
+from ape import chain
+from ape.exceptions import ProviderError
+from eth_abi import encode
+from eth_utils import encode_hex, keccak, to_hex
+
+from ape_arbitrum.ecosystem import ApeArbitrumError
+from ape_arbitrum.retryables import (
+    ARB_RETRYABLE_TX_ADDRESS,
+    GET_TIMEOUT_SELECTOR,
+    REDEEM_SCHEDULED_TOPIC,
+    RetryableStatus,
+    RetryableTicketTracker,
+)
+
+TIMEOUT = 2**40
+
+
+def create_hash(name: str) -> str:
+    return encode_hex(keccak(text=name))
+
+
+def create_redeem_log(ticket_id: str, retry_txn_hash: str) -> dict:
+    return {
+        "address": ARB_RETRYABLE_TX_ADDRESS,
+        "topics": [REDEEM_SCHEDULED_TOPIC, ticket_id, retry_txn_hash, encode_hex(bytes(32))],
+        "data": "0x",
+    }
+
+
+def create_receipt(status: int, logs: list | None = None) -> dict:
+    block_number = to_hex(chain.blocks.head.number)
+    return {"status": to_hex(status), "blockNumber": block_number, "logs": logs or []}
+
+
+class StandInNode:
+    """
+    Serves receipts, ``RedeemScheduled`` logs and ticket timeouts
+    from memory, through JSON-RPC batches.
+    """
+
+    def __init__(self):
+        self.receipts: dict[str, dict] = {}
+        self.logs: list[dict] = []
+        self.timeouts: dict[str, int] = {}
+        self.rate_limited = False
+        self.batches: list[list] = []
+
+    def create_ticket(self, ticket_id: str, status: int = 1, auto_redeem: str | None = None):
+        logs = [create_redeem_log(ticket_id, auto_redeem)] if auto_redeem else []
+        self.receipts[ticket_id] = create_receipt(status, logs)
+        if status:
+            self.timeouts[ticket_id] = TIMEOUT
+
+    def redeem(self, ticket_id: str, txn_hash: str, status: int = 1):
+        self.receipts[txn_hash] = create_receipt(status)
+        if status:
+            self.timeouts.pop(ticket_id, None)
+
+    def make_batch_request(self, batch):
+        self.batches.append(batch)
+        return [self.respond(i, *request) for i, request in enumerate(batch)]
+
+    def respond(self, request_id: int, method: str, params: list) -> dict:
+        if method == "eth_getTransactionReceipt":
+            return {"id": request_id, "result": self.receipts.get(params[0])}
+
+        if method == "eth_getLogs":
+            ticket_ids = params[0]["topics"][1]
+            logs = [log for log in self.logs if log["topics"][1] in ticket_ids]
+            return {"id": request_id, "result": logs}
+
+        if method == "eth_call":
+            if self.rate_limited:
+                return {"id": request_id, "error": {"code": -32005, "message": "rate limited"}}
+
+            ticket_id = "0x" + params[0]["data"][2 + len(GET_TIMEOUT_SELECTOR) * 2 :]
+            if ticket_id not in self.timeouts:
+                return {"id": request_id, "error": {"code": 3, "message": "execution reverted"}}
+
+            return {"id": request_id, "result": encode_hex(encode(["uint256"], [TIMEOUT]))}
+
+        raise AssertionError(f"Unexpected request '{method}'.")
+
+    @property
+    def methods(self) -> list[list[str]]:
+        return [[method for method, _ in batch] for batch in self.batches]
+
+
+@pytest.fixture
+def node(eth_tester_provider, mocker):
+    node = StandInNode()
+    mocker.patch.object(
+        type(eth_tester_provider.web3.provider),
+        "make_batch_request",
+        create=True,
+        side_effect=node.make_batch_request,
+    )
+    return node
+
+
+def test_poll_auto_redeemed(node):
+    tickets = [create_hash(f"ticket{i}") for i in range(3)]
+    for index, ticket_id in enumerate(tickets):
+        retry_txn_hash = create_hash(f"retry{index}")
+        node.create_ticket(ticket_id, auto_redeem=retry_txn_hash)
+        node.redeem(ticket_id, retry_txn_hash)
+
+    tracker = RetryableTicketTracker(tickets)
+    assert len(tracker.poll()) == 3
+    assert not tracker.pending
+    assert tracker.tickets[tickets[0]].status is RetryableStatus.REDEEMED
+    assert tracker.tickets[tickets[0]].redeem_txn_hash == create_hash("retry0")
+
+    # One batch for the creations and one for the redeem attempts, for all the tickets.
+    assert node.methods == [["eth_getTransactionReceipt"] * 3, ["eth_getTransactionReceipt"] * 3]
+
+    # Tickets in a final state are not requested again.
+    assert tracker.poll() == []
+    assert len(node.batches) == 2
+
+
+def test_poll_not_yet_created(node):
+    ticket_id = create_hash("ticket")
+    tracker = RetryableTicketTracker([ticket_id])
+    assert tracker.poll() == []
+    assert tracker.pending[0].status is RetryableStatus.NOT_YET_CREATED
+
+    node.create_ticket(ticket_id)
+    assert tracker.poll() == [tracker.tickets[ticket_id]]
+    assert tracker.tickets[ticket_id].status is RetryableStatus.REDEEMABLE
+    assert tracker.tickets[ticket_id].timeout == TIMEOUT
+
+
+def test_poll_creation_failed(node):
+    ticket_id = create_hash("ticket")
+    node.create_ticket(ticket_id, status=0)
+    tracker = RetryableTicketTracker([ticket_id])
+    tracker.poll()
+    assert tracker.tickets[ticket_id].status is RetryableStatus.CREATION_FAILED
+
+
+def test_poll_manual_redeem(node):
+    ticket_id = create_hash("ticket")
+    auto_redeem, manual_redeem = create_hash("auto"), create_hash("manual")
+    node.create_ticket(ticket_id, auto_redeem=auto_redeem)
+    node.redeem(ticket_id, auto_redeem, status=0)
+    tracker = RetryableTicketTracker([ticket_id])
+    tracker.poll()
+    ticket = tracker.tickets[ticket_id]
+    assert ticket.status is RetryableStatus.REDEEMABLE
+    assert ticket.failed_redeem_txn_hashes == [auto_redeem]
+
+    # The timeout is cached, so a still-redeemable ticket only needs a log query per new block.
+    node.batches.clear()
+    assert tracker.poll() == []
+    assert node.batches == []
+    chain.mine(1)
+    assert tracker.poll() == []
+    assert node.methods == [["eth_getLogs"]]
+
+    node.logs.append(create_redeem_log(ticket_id, manual_redeem))
+    node.redeem(ticket_id, manual_redeem)
+    chain.mine(1)
+    assert tracker.poll() == [ticket]
+    assert ticket.status is RetryableStatus.REDEEMED
+    assert ticket.redeem_txn_hash == manual_redeem
+
+
+def test_poll_expired(node):
+    ticket_id = create_hash("ticket")
+    node.create_ticket(ticket_id)
+    tracker = RetryableTicketTracker([ticket_id])
+    tracker.poll()
+    assert tracker.tickets[ticket_id].status is RetryableStatus.REDEEMABLE
+
+    # The ticket expired without being redeemed.
+    node.timeouts.clear()
+    tracker.tickets[ticket_id].timeout = 0
+    tracker.poll()
+    assert tracker.tickets[ticket_id].status is RetryableStatus.EXPIRED
+
+
+def test_poll_timeout_error(node):
+    ticket_id = create_hash("ticket")
+    node.create_ticket(ticket_id)
+    tracker = RetryableTicketTracker([ticket_id])
+    tracker.poll()
+
+    # A node error is not mistaken for an expired ticket.
+    node.rate_limited = True
+    tracker.tickets[ticket_id].timeout = 0
+    with pytest.raises(ProviderError, match="rate limited"):
+        tracker.poll()
+
+    assert tracker.tickets[ticket_id].status is RetryableStatus.REDEEMABLE
+
+
+def test_poll_batch_size(node):
+    tickets = [create_hash(f"ticket{i}") for i in range(5)]
+    tracker = RetryableTicketTracker(tickets, batch_size=2)
+    tracker.poll()
+    assert [len(batch) for batch in node.batches] == [2, 2, 1]
+
+
+def test_wait(node, mocker):
+    ticket_id = create_hash("ticket")
+    tracker = RetryableTicketTracker([ticket_id])
+    mocker.patch(
+        "ape_arbitrum.retryables.time.sleep",
+        side_effect=lambda _: node.create_ticket(ticket_id, status=0),
+    )
+    tracker.wait(poll_interval=0)
+    assert tracker.tickets[ticket_id].status is RetryableStatus.CREATION_FAILED
+
+
+def test_wait_timeout(node, mocker):
+    tracker = RetryableTicketTracker([create_hash("ticket")])
+    mocker.patch("ape_arbitrum.retryables.time.sleep")
+    with pytest.raises(ApeArbitrumError, match="1 retryable ticket"):
+        tracker.wait(timeout=0)
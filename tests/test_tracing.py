@@ -0,0 +1,202 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import ijson  # type: ignore[import-untyped]
+import pytest
+from ape.exceptions import ProviderError
+
+from ape_arbitrum.tracing import TraceProfiler, parse_arbtrace, parse_call_trace
+
+DATA = Path(__file__).parent / "data" / "traces"
+NITRO_TXN = "0x1111111111111111111111111111111111111111111111111111111111111111"
+CLASSIC_TXN = "0x2222222222222222222222222222222222222222222222222222222222222222"
+
+
+def chunked(data: bytes, size: int = 64):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+class TraceNodeStandIn:
+    """
+    A JSON-RPC HTTP endpoint that serves recorded traces and receipts.
+    """
+
+    def __init__(self):
+        self.receipts = json.loads((DATA / "receipts.json").read_text())
+        self.requests: list[str] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def uri(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, request: dict) -> bytes:
+        method, params = request["method"], request["params"]
+        self.requests.append(method)
+        if method == "debug_traceTransaction" and params[0] == NITRO_TXN:
+            assert params[1] == {"tracer": "callTracer"}
+            return (DATA / "call_trace.json").read_bytes()
+
+        if method == "arbtrace_transaction" and params[0] == CLASSIC_TXN:
+            return (DATA / "arbtrace.json").read_bytes()
+
+        response: dict = {"jsonrpc": "2.0", "id": request["id"]}
+        if method == "eth_chainId":
+            response["result"] = "0xa4b1"
+        elif method == "eth_getTransactionReceipt":
+            response["result"] = self.receipts.get(params[0])
+        else:
+            response["error"] = {"code": -32000, "message": "transaction not found"}
+
+        return json.dumps(response).encode()
+
+    def _create_handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                body = stand_in.respond(request)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def node():
+    with TraceNodeStandIn() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def profiler(node, tmp_path):
+    return TraceProfiler(uri=node.uri, path=tmp_path, chunk_size=64)
+
+
+def test_parse_call_trace():
+    root = parse_call_trace(chunked((DATA / "call_trace.json").read_bytes()))
+    assert root.gas_used == 120_000
+    assert root.selector == "0x38ed1739"
+    assert [(depth, call.name) for depth, call in root.walk()] == [
+        (0, "0x5fbdb2315678afecb367f032d93f642f64180aa3"),
+        (1, "ArbSys"),
+        (1, "0xe7f1725e7734ce288f8367e1bb143e90bb3f0512"),
+        (2, "0x9fe46736679d2d9a65f0992f2272de9f3c7fa6e0"),
+    ]
+    assert root.self_gas_used == 120_000 - 1_000 - 30_000
+    assert root.calls[1].self_gas_used == 25_000
+    assert root.calls[1].calls[0].type == "DELEGATECALL"
+    assert root.calls[1].calls[0].error == "execution reverted"
+
+
+def hold_events(create_coroutine):
+    """
+    A parser that only produces its events once closed, like a backend waiting
+    for the end of the input to finish its last token.
+    """
+
+    class HeldCoroutine:
+        def __init__(self, target, *args):
+            self.target = target
+            self.held = ijson.sendable_list()
+            self.coroutine = create_coroutine(self.held, *args)
+
+        def send(self, chunk: bytes):
+            self.coroutine.send(chunk)
+
+        def close(self):
+            self.coroutine.close()
+            self.target.extend(self.held)
+
+    return HeldCoroutine
+
+
+@pytest.mark.parametrize(
+    ("parse", "name", "coroutine"),
+    [
+        (parse_call_trace, "call_trace.json", "parse_coro"),
+        (parse_arbtrace, "arbtrace.json", "items_coro"),
+    ],
+)
+def test_parse_final_events(parse, name, coroutine, mocker):
+    mocker.patch(f"ape_arbitrum.tracing.ijson.{coroutine}", hold_events(getattr(ijson, coroutine)))
+    response = (DATA / name).read_bytes().rstrip()
+    # The last frame ends in the final chunk, and its events only come when the parser closes.
+    root = parse([response[:-3], response[-3:]])
+    assert root.gas_used == parse(chunked(response)).gas_used
+    assert len(list(root.walk())) > 1
+
+
+def test_parse_call_trace_error():
+    response = b'{"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "not found"}}'
+    with pytest.raises(ProviderError, match="not found"):
+        parse_call_trace(chunked(response))
+
+
+def test_parse_arbtrace():
+    root = parse_arbtrace(chunked((DATA / "arbtrace.json").read_bytes()))
+    assert root.type == "CALL"
+    assert root.gas_used == 50_000
+    assert [call.type for call in root.calls] == ["STATICCALL", "CREATE"]
+    assert root.calls[0].name == "ArbSys"
+    assert root.calls[1].receiver == "0x9fe46736679d2d9a65f0992f2272de9f3c7fa6e0"
+    assert root.self_gas_used == 39_000
+
+
+def test_profile(profiler, node):
+    profile = profiler.profile(NITRO_TXN)
+    assert profile.gas_used == 120_000
+    assert profile.l1_gas_used == 20_000
+    assert profile.l2_gas_used == 100_000
+    assert profile.get_gas_by_receiver() == {
+        "0x5fbdb2315678afecb367f032d93f642f64180aa3": 69_000,
+        "0xe7f1725e7734ce288f8367e1bb143e90bb3f0512": 25_000,
+        "0x9fe46736679d2d9a65f0992f2272de9f3c7fa6e0": 5_000,
+        "ArbSys": 1_000,
+    }
+    assert "debug_traceTransaction" in node.requests
+    assert "STATICCALL ArbSys.0xa3b1b31d gas=1000" in profile.format()
+    assert "[execution reverted]" in profile.format()
+
+
+def test_profile_classic(profiler, node):
+    profile = profiler.profile(CLASSIC_TXN)
+    assert profile.l1_gas_used == 0
+    assert profile.root.calls[0].name == "ArbSys"
+    assert "arbtrace_transaction" in node.requests
+    assert "debug_traceTransaction" not in node.requests
+
+
+def test_get_trace_cached(profiler, node, tmp_path):
+    root = profiler.get_trace(NITRO_TXN)
+    assert (tmp_path / "42161" / f"{NITRO_TXN}.json").is_file()
+
+    # A new profiler reads the trace from disk.
+    node.requests.clear()
+    cached = TraceProfiler(uri=node.uri, path=tmp_path).get_trace(NITRO_TXN)
+    assert cached == root
+    assert node.requests == ["eth_chainId"]
+
+
+def test_profile_not_found(profiler):
+    with pytest.raises(ProviderError, match="not found"):
+        profiler.get_trace("0x" + "33" * 32)